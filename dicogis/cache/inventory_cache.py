@@ -0,0 +1,319 @@
+"""Persistent cache of metadatasets extracted from files and database tables, stored
+in a SQLite database.
+
+A cached metadataset is reused as long as the main file and every file listed in its
+dependencies keep the same size and modification time. For database tables, the
+fingerprint is computed by the reader from the database statistics.
+
+Paths are stored and hashed as bytes, as the file system gives them, so that paths
+which are not valid UTF-8 are cached too.
+"""
+
+# ############################################################################
+# ######### Libraries #############
+# #################################
+
+# Standard library
+import logging
+import pickle
+import sqlite3
+from functools import lru_cache
+from hashlib import sha256
+from os import fsdecode, fsencode, path, scandir, stat
+from pathlib import Path
+from threading import RLock
+from time import time
+
+# 3rd party
+from typer import get_app_dir
+
+# package
+from dicogis.__about__ import __title__, __version__
+from dicogis.models.metadataset import MetaDataset
+
+# ############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# ############################################################################
+# ######### Classes #############
+# ###############################
+
+
+class InventoryCache:
+    """Persistent cache of metadatasets, keyed on dataset path and files identity
+    (size and modification time of the dataset and its dependencies).
+
+    Several processes can read the same cache at the same time (WAL journal) but only
+    one should write into it.
+    """
+
+    # stored entries are dropped when the database schema or DicoGIS version changes
+    SCHEMA_VERSION: int = 2
+    # number of stored entries between two commits
+    COMMIT_EVERY: int = 100
+
+    def __init__(
+        self, database_path: Path | None = None, ttl_hours: int | None = None
+    ) -> None:
+        """Initialization.
+
+        Args:
+            database_path: path to the SQLite database. If None, it's stored into the
+                DicoGIS application folder. Defaults to None.
+            ttl_hours: maximum age of an entry, in hours. None or 0 means entries never
+                expire. Defaults to None.
+        """
+        if database_path is None:
+            database_path = self.default_database_path()
+        self.database_path = Path(database_path)
+        self.ttl_hours = ttl_hours
+
+        # counters
+        self.count_hits: int = 0
+        self.count_misses: int = 0
+
+        self._lock = RLock()
+        self._pending_writes: int = 0
+
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(
+            self.database_path, timeout=30, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL;")
+        self.connection.execute("PRAGMA synchronous=NORMAL;")
+        self.init_database()
+
+    @staticmethod
+    def default_database_path() -> Path:
+        """Default location of the cache database, into the DicoGIS app folder.
+
+        Returns:
+            path to the cache database
+        """
+        return Path(get_app_dir(app_name=__title__, force_posix=True)).joinpath(
+            "cache", "inventory.sqlite"
+        )
+
+    @property
+    def cache_version(self) -> str:
+        """Identifier of cache content compatibility.
+
+        Returns:
+            schema version and DicoGIS version
+        """
+        return f"{self.SCHEMA_VERSION}-{__version__}"
+
+    def init_database(self):
+        """Create tables if needed and purge entries from another cache version."""
+        with self._lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_info "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadatasets ("
+                "dataset_path BLOB PRIMARY KEY, "
+                "fingerprint TEXT NOT NULL, "
+                "dependencies BLOB NOT NULL, "
+                "stored_at REAL NOT NULL, "
+                "metadataset BLOB NOT NULL)"
+            )
+            row = self.connection.execute(
+                "SELECT value FROM cache_info WHERE key = 'version'"
+            ).fetchone()
+            if row is None or row[0] != self.cache_version:
+                if row is not None:
+                    logger.info(
+                        f"Inventory cache has been created by another version "
+                        f"({row[0]}): it's cleared."
+                    )
+                self.connection.execute("DELETE FROM metadatasets")
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO cache_info (key, value) "
+                    "VALUES ('version', ?)",
+                    (self.cache_version,),
+                )
+
+    @staticmethod
+    def compute_fingerprint(
+        dataset_path: Path | str, dependencies: list[Path | str] | None = None
+    ) -> str | None:
+        """Compute an identity hash of a dataset from size and modification time of
+        the dataset and its dependencies. For folder-based datasets (Esri File
+        Geodatabase), every file into the folder is included.
+
+        Args:
+            dataset_path: path to the dataset
+            dependencies: files related to the dataset. Defaults to None.
+
+        Returns:
+            fingerprint or None if one of the files is not reachable
+        """
+        hasher = sha256(usedforsecurity=False)
+        files_to_hash = [fsencode(dataset_path)]
+        if dependencies:
+            files_to_hash.extend(
+                sorted(fsencode(dependency) for dependency in dependencies)
+            )
+
+        try:
+            for file_path in files_to_hash:
+                if path.isdir(file_path):
+                    for entry in sorted(scandir(file_path), key=lambda e: e.name):
+                        if entry.is_file():
+                            entry_stat = entry.stat()
+                            entry_identity = (
+                                f"|{entry_stat.st_size}|{entry_stat.st_mtime_ns}\n"
+                            )
+                            hasher.update(entry.path + entry_identity.encode())
+                    continue
+                file_stat = stat(file_path)
+                hasher.update(
+                    file_path
+                    + f"|{file_stat.st_size}|{file_stat.st_mtime_ns}\n".encode()
+                )
+        except OSError as err:
+            logger.debug(f"Unable to compute fingerprint of {dataset_path}: {err}")
+            return None
+
+        return hasher.hexdigest()
+
+    def get(
+        self, dataset_path: Path | str, fingerprint: str | None = None
+    ) -> MetaDataset | None:
+        """Get the cached metadataset of a dataset if it's still valid.
+
+        Args:
+            dataset_path: path to the dataset, or key of a database table
+            fingerprint: current fingerprint of a database table. If None, it's
+                computed from the dataset files. Defaults to None.
+
+        Returns:
+            cached metadataset or None if there is no valid entry
+        """
+        if fingerprint is None:
+            dataset_path = path.abspath(dataset_path)
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT fingerprint, dependencies, stored_at, metadataset "
+                "FROM metadatasets WHERE dataset_path = ?",
+                (fsencode(dataset_path),),
+            ).fetchone()
+
+        if row is None:
+            self.count_misses += 1
+            return None
+
+        stored_fingerprint, dependencies, stored_at, pickled_metadataset = row
+        if self.ttl_hours and (time() - stored_at) > self.ttl_hours * 3600:
+            logger.debug(f"Cached entry of {dataset_path} has expired.")
+            self.count_misses += 1
+            return None
+
+        if fingerprint is None:
+            fingerprint = self.compute_fingerprint(
+                dataset_path=dataset_path,
+                dependencies=[
+                    fsdecode(dependency) for dependency in dependencies.splitlines()
+                ],
+            )
+        if stored_fingerprint != fingerprint:
+            logger.debug(f"{dataset_path} has changed since it was cached.")
+            self.count_misses += 1
+            return None
+
+        try:
+            metadataset = pickle.loads(pickled_metadataset)
+        except (pickle.UnpicklingError, AttributeError, EOFError, ImportError) as err:
+            logger.warning(f"Unable to load cached entry of {dataset_path}: {err}")
+            self.count_misses += 1
+            return None
+
+        self.count_hits += 1
+        return metadataset
+
+    def store(
+        self,
+        dataset_path: Path | str,
+        metadataset: MetaDataset,
+        fingerprint: str | None = None,
+    ) -> bool:
+        """Store (or replace) the metadataset of a dataset.
+
+        Args:
+            dataset_path: path to the dataset, or key of a database table
+            metadataset: metadataset to store
+            fingerprint: fingerprint of a database table. If None, it's computed from
+                the dataset files. Defaults to None.
+
+        Returns:
+            True if the metadataset has been stored
+        """
+        dependencies = list(metadataset.files_dependencies or [])
+        if fingerprint is None:
+            dataset_path = path.abspath(dataset_path)
+            fingerprint = self.compute_fingerprint(
+                dataset_path=dataset_path, dependencies=dependencies
+            )
+        if fingerprint is None:
+            return False
+
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO metadatasets "
+                "(dataset_path, fingerprint, dependencies, stored_at, metadataset) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    fsencode(dataset_path),
+                    fingerprint,
+                    b"\n".join(fsencode(dependency) for dependency in dependencies),
+                    time(),
+                    pickle.dumps(metadataset, protocol=pickle.HIGHEST_PROTOCOL),
+                ),
+            )
+            self._pending_writes += 1
+            if self._pending_writes >= self.COMMIT_EVERY:
+                self.flush()
+
+        return True
+
+    def flush(self):
+        """Commit pending writes."""
+        with self._lock:
+            self.connection.commit()
+            self._pending_writes = 0
+
+    def clear(self):
+        """Remove every cached entry."""
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM metadatasets")
+
+    def close(self):
+        """Commit pending writes and close the database connection."""
+        self.flush()
+        self.connection.close()
+
+
+# ############################################################################
+# ######### Functions #############
+# #################################
+
+
+@lru_cache
+def get_inventory_cache(
+    database_path: Path | None = None, ttl_hours: int | None = None
+) -> InventoryCache:
+    """Get the inventory cache of the current process, opening it only once. Used by
+    reading worker processes.
+
+    Args:
+        database_path: path to the SQLite database. Defaults to None.
+        ttl_hours: maximum age of an entry, in hours. Defaults to None.
+
+    Returns:
+        inventory cache
+    """
+    return InventoryCache(database_path=database_path, ttl_hours=ttl_hours)
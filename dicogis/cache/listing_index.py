@@ -0,0 +1,219 @@
+"""Persistent index of folders entries, used to list geodata files without reading
+again folders which have not changed since the previous listing.
+
+A folder modification time changes when an entry is added, removed or renamed into
+it, not when a file content changes nor when something changes deeper in the
+tree: every folder is still checked (one stat call) but only modified ones are read.
+
+Paths and names are stored as bytes, as the file system gives them, so that names
+which are not valid UTF-8 are indexed too.
+"""
+
+# ############################################################################
+# ######### Libraries #############
+# #################################
+
+# Standard library
+import logging
+import sqlite3
+from os import fsdecode, fsencode, stat
+from pathlib import Path
+from threading import RLock
+from time import time_ns
+
+# package
+from dicogis.cache.inventory_cache import InventoryCache
+
+# ############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# ############################################################################
+# ######### Classes #############
+# ###############################
+
+
+class ListingIndex:
+    """Persistent index of folders entries, keyed on folder path and modification
+    time."""
+
+    SCHEMA_VERSION: int = 1
+    # folders modified less than this delay before being indexed are not trusted:
+    # some file systems store modification time with a 2 seconds precision
+    MTIME_SAFETY_DELAY_NS: int = 2 * 10**9
+    # names are stored joined with a character forbidden in file names
+    NAMES_SEPARATOR: bytes = b"\0"
+
+    def __init__(self, database_path: Path | None = None, rescan: bool = False) -> None:
+        """Initialization.
+
+        Args:
+            database_path: path to the SQLite database. If None, it's stored next to
+                the inventory cache, into the DicoGIS application folder.
+                Defaults to None.
+            rescan: if True, indexed entries are ignored: every folder is read and
+                the index is refreshed. Defaults to False.
+        """
+        if database_path is None:
+            database_path = InventoryCache.default_database_path().with_name(
+                "listing_index.sqlite"
+            )
+        self.database_path = Path(database_path)
+        self.rescan = rescan
+
+        # counters
+        self.count_reused: int = 0
+        self.count_read: int = 0
+
+        self._lock = RLock()
+
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(
+            self.database_path, timeout=30, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL;")
+        self.connection.execute("PRAGMA synchronous=NORMAL;")
+        self.init_database()
+
+    def init_database(self):
+        """Create tables if needed and purge entries from another schema version."""
+        with self._lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS index_info "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS folders ("
+                "folder_path BLOB PRIMARY KEY, "
+                "mtime_ns INTEGER NOT NULL, "
+                "indexed_at_ns INTEGER NOT NULL, "
+                "dirs BLOB NOT NULL, "
+                "files BLOB NOT NULL, "
+                "walk_dirs BLOB NOT NULL)"
+            )
+            row = self.connection.execute(
+                "SELECT value FROM index_info WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is None or row[0] != f"{self.SCHEMA_VERSION}":
+                self.connection.execute("DELETE FROM folders")
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO index_info (key, value) "
+                    "VALUES ('schema_version', ?)",
+                    (f"{self.SCHEMA_VERSION}",),
+                )
+
+    @staticmethod
+    def join_names(names: list[str]) -> bytes:
+        """Join names to store them as a single value, encoded as the file system
+        does.
+
+        Args:
+            names: names to store
+
+        Returns:
+            stored names
+        """
+        return ListingIndex.NAMES_SEPARATOR.join(fsencode(name) for name in names)
+
+    @staticmethod
+    def split_names(names: bytes) -> list[str]:
+        """Split names stored as a single value.
+
+        Args:
+            names: stored names
+
+        Returns:
+            list of names
+        """
+        if not names:
+            return []
+        return [fsdecode(name) for name in names.split(ListingIndex.NAMES_SEPARATOR)]
+
+    def get_folder_entries(
+        self, folder: str
+    ) -> tuple[int, tuple[list[str], list[str], list[str]] | None] | None:
+        """Get indexed entries of a folder if it has not changed since indexing.
+
+        Args:
+            folder: folder path
+
+        Returns:
+            None if the folder is not reachable, else folder modification time and
+                indexed sub-folders names, files names and names of sub-folders to
+                walk into (None if the folder has to be read again)
+        """
+        try:
+            mtime_ns = stat(folder).st_mtime_ns
+        except OSError as err:
+            logger.debug(f"Unable to get modification time of {folder}: {err}")
+            return None
+
+        if self.rescan:
+            return mtime_ns, None
+
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT mtime_ns, indexed_at_ns, dirs, files, walk_dirs FROM folders "
+                "WHERE folder_path = ?",
+                (fsencode(folder),),
+            ).fetchone()
+
+        if (
+            row is None
+            or row[0] != mtime_ns
+            or row[1] - row[0] < self.MTIME_SAFETY_DELAY_NS
+        ):
+            return mtime_ns, None
+
+        with self._lock:
+            self.count_reused += 1
+        return mtime_ns, (
+            self.split_names(row[2]),
+            self.split_names(row[3]),
+            self.split_names(row[4]),
+        )
+
+    def store_folder_entries(
+        self,
+        folder: str,
+        mtime_ns: int,
+        dirs: list[str],
+        files: list[str],
+        walk_dirs: list[str],
+    ):
+        """Store (or replace) entries of a folder.
+
+        Args:
+            folder: folder path
+            mtime_ns: folder modification time, got before reading it
+            dirs: sub-folders names
+            files: files names
+            walk_dirs: names of sub-folders to walk into
+        """
+        with self._lock:
+            self.count_read += 1
+            self.connection.execute(
+                "INSERT OR REPLACE INTO folders "
+                "(folder_path, mtime_ns, indexed_at_ns, dirs, files, walk_dirs) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    fsencode(folder),
+                    mtime_ns,
+                    time_ns(),
+                    self.join_names(dirs),
+                    self.join_names(files),
+                    self.join_names(walk_dirs),
+                ),
+            )
+
+    def flush(self):
+        """Commit pending writes."""
+        with self._lock:
+            self.connection.commit()
+
+    def close(self):
+        """Commit pending writes and close the database connection."""
+        self.flush()
+        self.connection.close()
@@ -0,0 +1,241 @@
+"""Bounded cache of resolved spatial reference systems details (name, registry, code,
+type), keyed on a fingerprint of the SRS definition.
+
+Resolving a SRS queries the PROJ database several times while an inventory usually
+contains only a few distinct SRS. The in-memory cache is shared by every reader of
+the process and can be backed by a SQLite database, shared between worker processes
+and runs.
+"""
+
+# ############################################################################
+# ######### Libraries #############
+# #################################
+
+# Standard library
+import logging
+import sqlite3
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from threading import RLock
+
+# package
+from dicogis.__about__ import __version__
+
+# ############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# ############################################################################
+# ######### Classes #############
+# ###############################
+
+
+class SrsCache:
+    """Least recently used cache of SRS details, optionally backed by a SQLite
+    database. Thread-safe.
+
+    Several processes can write into the same database: entries are few and written
+    only once.
+    """
+
+    SCHEMA_VERSION: int = 1
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Initialization.
+
+        Args:
+            max_size: maximum number of entries kept in memory. Defaults to 1024.
+        """
+        self.max_size = max_size
+        self.entries: OrderedDict[str, tuple] = OrderedDict()
+
+        # counters
+        self.count_hits: int = 0
+        self.count_misses: int = 0
+
+        self._lock = RLock()
+        self.database_path: Path | None = None
+        self.connection: sqlite3.Connection | None = None
+
+    @staticmethod
+    def compute_fingerprint(*parts: str | bytes) -> str:
+        """Compute the cache key of a SRS definition.
+
+        Args:
+            parts: SRS definition (normalized WKT, .prj file content...) and
+                everything which changes its resolution (GDAL version, options...)
+
+        Returns:
+            fingerprint
+        """
+        hasher = sha256(usedforsecurity=False)
+        for part in parts:
+            hasher.update(part if isinstance(part, bytes) else f"{part}".encode())
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Share of lookups answered by the cache.
+
+        Returns:
+            hit rate between 0 and 1, None if there was no lookup
+        """
+        count_lookups = self.count_hits + self.count_misses
+        if not count_lookups:
+            return None
+        return self.count_hits / count_lookups
+
+    def open_database(self, database_path: Path):
+        """Back the cache with a SQLite database. Does nothing if this database is
+        already opened.
+
+        Args:
+            database_path: path to the SQLite database
+        """
+        database_path = Path(database_path)
+        with self._lock:
+            if self.database_path == database_path:
+                return
+            self.close_database()
+
+            database_path.parent.mkdir(parents=True, exist_ok=True)
+            self.connection = sqlite3.connect(
+                database_path, timeout=30, check_same_thread=False
+            )
+            self.connection.execute("PRAGMA journal_mode=WAL;")
+            self.connection.execute("PRAGMA synchronous=NORMAL;")
+            self.database_path = database_path
+            self.init_database()
+
+    def init_database(self):
+        """Create tables if needed and purge entries from another cache version."""
+        cache_version = f"{self.SCHEMA_VERSION}-{__version__}"
+        with self._lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_info "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS srs_details ("
+                "fingerprint TEXT PRIMARY KEY, "
+                "crs_name TEXT, "
+                "crs_registry TEXT, "
+                "crs_registry_code TEXT, "
+                "crs_type TEXT)"
+            )
+            row = self.connection.execute(
+                "SELECT value FROM cache_info WHERE key = 'version'"
+            ).fetchone()
+            if row is None or row[0] != cache_version:
+                self.connection.execute("DELETE FROM srs_details")
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO cache_info (key, value) "
+                    "VALUES ('version', ?)",
+                    (cache_version,),
+                )
+
+    def close_database(self):
+        """Close the database connection, keeping in-memory entries."""
+        with self._lock:
+            if self.connection is not None:
+                self.connection.close()
+            self.connection = None
+            self.database_path = None
+
+    def get(self, fingerprint: str) -> tuple | None:
+        """Get SRS details from memory, then from the database.
+
+        Args:
+            fingerprint: key of the SRS definition
+
+        Returns:
+            crs_name, crs_registry, crs_code, crs_type or None if not cached
+        """
+        with self._lock:
+            srs_details = self.entries.get(fingerprint)
+            if srs_details is not None:
+                self.entries.move_to_end(fingerprint)
+                self.count_hits += 1
+                return srs_details
+
+            if self.connection is not None:
+                try:
+                    row = self.connection.execute(
+                        "SELECT crs_name, crs_registry, crs_registry_code, crs_type "
+                        "FROM srs_details WHERE fingerprint = ?",
+                        (fingerprint,),
+                    ).fetchone()
+                except sqlite3.Error as err:
+                    logger.debug(f"Unable to read SRS cache database. Trace: {err}")
+                    row = None
+                if row is not None:
+                    self.remember(fingerprint=fingerprint, srs_details=tuple(row))
+                    self.count_hits += 1
+                    return tuple(row)
+
+            self.count_misses += 1
+            return None
+
+    def store(self, fingerprint: str, srs_details: tuple):
+        """Store SRS details in memory and into the database.
+
+        Args:
+            fingerprint: key of the SRS definition
+            srs_details: crs_name, crs_registry, crs_code, crs_type
+        """
+        with self._lock:
+            self.remember(fingerprint=fingerprint, srs_details=srs_details)
+            if self.connection is None:
+                return
+            try:
+                with self.connection:
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO srs_details (fingerprint, crs_name, "
+                        "crs_registry, crs_registry_code, crs_type) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (fingerprint, *srs_details),
+                    )
+            except sqlite3.Error as err:
+                logger.debug(f"Unable to write into SRS cache database. Trace: {err}")
+
+    def remember(self, fingerprint: str, srs_details: tuple):
+        """Keep SRS details in memory, dropping the least recently used entry when
+        the cache is full.
+
+        Args:
+            fingerprint: key of the SRS definition
+            srs_details: crs_name, crs_registry, crs_code, crs_type
+        """
+        with self._lock:
+            self.entries[fingerprint] = srs_details
+            self.entries.move_to_end(fingerprint)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """Remove in-memory entries and reset counters."""
+        with self._lock:
+            self.entries.clear()
+            self.count_hits = 0
+            self.count_misses = 0
+
+    def log_usage(self):
+        """Log cache hits and misses."""
+        if self.hit_rate is None:
+            return
+        logger.info(
+            f"SRS cache: {self.count_hits} hits - {self.count_misses} misses "
+            f"({self.hit_rate:.0%})."
+        )
+
+
+# ############################################################################
+# ######### Instances #############
+# #################################
+
+# one cache per process, shared by every georeader
+srs_cache = SrsCache()
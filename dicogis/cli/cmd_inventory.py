@@ -17,11 +17,24 @@ from rich import print
 
 # project
 from dicogis.__about__ import __package_name__, __title__
-from dicogis.constants import SUPPORTED_FORMATS, AvailableLocales, OutputFormats
+from dicogis.cache.inventory_cache import InventoryCache, get_inventory_cache
+from dicogis.cache.listing_index import ListingIndex
+from dicogis.constants import (
+    SUPPORTED_FORMATS,
+    AvailableLocales,
+    OutputFormats,
+    StatisticsModes,
+)
 from dicogis.export.base_serializer import MetadatasetSerializerBase
+from dicogis.georeaders.postgis_catalog import RelationsFilter
+from dicogis.georeaders.process_databases import ProcessingDatabases
 from dicogis.georeaders.process_files import ProcessingFiles
 from dicogis.georeaders.read_postgis import ReadPostGIS
-from dicogis.listing.geodata_listing import check_usable_pg_services, find_geodata_files
+from dicogis.listing.geodata_listing import (
+    GeodataFilesLister,
+    check_usable_pg_services,
+    find_geodata_files,
+)
 from dicogis.utils.journalizer import LogManager
 from dicogis.utils.notifier import send_system_notify
 from dicogis.utils.slugger import sluggy
@@ -121,6 +134,30 @@ def inventory(
             "If None, database listing is ignored. Defaults to None.",
         ),
     ] = None,
+    pg_schemas: Annotated[
+        list[str] | None,
+        typer.Option(
+            envvar="DICOGIS_PG_SCHEMAS",
+            help="Pattern(s) of PostgreSQL schemas to inventory, with * and ? "
+            "wildcards. It's a repeatable option. Other schemas are never listed.",
+        ),
+    ] = None,
+    pg_tables: Annotated[
+        list[str] | None,
+        typer.Option(
+            envvar="DICOGIS_PG_TABLES",
+            help="Pattern(s) of PostgreSQL tables to inventory, matching table names "
+            "or schema.table names if they contain a dot. It's a repeatable option.",
+        ),
+    ] = None,
+    pg_exclude: Annotated[
+        list[str] | None,
+        typer.Option(
+            envvar="DICOGIS_PG_EXCLUDE",
+            help="Pattern(s) of PostgreSQL schemas, or schema.table names if they "
+            "contain a dot, to leave out. It's a repeatable option.",
+        ),
+    ] = None,
     output_path: Annotated[
         Path | None,
         typer.Option(
@@ -183,6 +220,154 @@ def inventory(
             help="Enable raw path instead of hyperlink in formats which support it.",
         ),
     ] = False,
+    stats_mode: Annotated[
+        StatisticsModes,
+        typer.Option(
+            "--stats",
+            case_sensitive=False,
+            envvar="DICOGIS_STATS",
+            help="How features count and extent are computed. 'exact' reads every "
+            "feature when the format does not store them, 'fast' only uses values "
+            "provided by the format (possibly missing) and 'skip' does not compute "
+            "them at all ('estimated' behaves like 'fast'). The mode is recorded in "
+            "the output.",
+        ),
+    ] = StatisticsModes.exact,
+    pg_exact_below: Annotated[
+        int,
+        typer.Option(
+            envvar="DICOGIS_PG_EXACT_BELOW_MB",
+            help="With '--stats fast', PostGIS tables larger than this size (in "
+            "megabytes) get features count and extent estimated from planner "
+            "statistics instead of being read. Smaller tables are computed exactly.",
+            min=0,
+        ),
+    ] = 50,
+    pg_connections: Annotated[
+        int,
+        typer.Option(
+            envvar="DICOGIS_PG_CONNECTIONS",
+            help="Maximum number of connections used to read PostGIS tables "
+            "concurrently, each one reading whole schemas. Capped to 16 and to half of "
+            "the connections still available on the server. 1 reads tables one after "
+            "another.",
+            min=1,
+        ),
+    ] = 1,
+    pg_view_max_cost: Annotated[
+        float,
+        typer.Option(
+            envvar="DICOGIS_PG_VIEW_MAX_COST",
+            help="Planner cost estimate above which features count and extent of a "
+            "PostGIS view are not read: the view is recorded as skipped (too "
+            "expensive). 0 disables the check.",
+            min=0,
+        ),
+    ] = 1_000_000,
+    pg_view_timeout: Annotated[
+        int,
+        typer.Option(
+            envvar="DICOGIS_PG_VIEW_TIMEOUT",
+            help="Maximum duration, in seconds, of each query reading a PostGIS view. "
+            "Views exceeding it are recorded as skipped (too expensive). 0 disables "
+            "the timeout.",
+            min=0,
+        ),
+    ] = 60,
+    pg_services_jobs: Annotated[
+        int,
+        typer.Option(
+            envvar="DICOGIS_PG_SERVICES_JOBS",
+            help="Number of PostgreSQL services (databases) read at the same time. "
+            "Output order follows the services order whatever the value.",
+            min=1,
+        ),
+    ] = 1,
+    pg_server_jobs: Annotated[
+        int,
+        typer.Option(
+            envvar="DICOGIS_PG_SERVER_JOBS",
+            help="Maximum number of PostgreSQL services read at the same time on a "
+            "same server (host and port). 0 means no other limit than "
+            "--pg-services-jobs.",
+            min=0,
+        ),
+    ] = 0,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            envvar="DICOGIS_JOBS",
+            help="Number of worker processes used to read datasets in parallel. "
+            "1 means sequential reading. Output order is the same whatever the value.",
+            min=1,
+        ),
+    ] = 1,
+    worker_max_datasets: Annotated[
+        int,
+        typer.Option(
+            envvar="DICOGIS_WORKER_MAX_DATASETS",
+            help="Number of datasets read by a worker process before it's replaced by "
+            "a fresh one. Only used with --jobs greater than 1. Keeps GDAL memory "
+            "leaks contained.",
+            min=1,
+        ),
+    ] = 200,
+    layers_jobs: Annotated[
+        int,
+        typer.Option(
+            envvar="DICOGIS_LAYERS_JOBS",
+            help="Number of layers read at the same time within a flat geodatabase "
+            "(FileGDB, GeoPackage, SpatiaLite), each one with its own read-only "
+            "handle on the file. Multiplied by --jobs.",
+            min=1,
+        ),
+    ] = 1,
+    walker_threads: Annotated[
+        int,
+        typer.Option(
+            envvar="DICOGIS_WALKER_THREADS",
+            help="Number of folders read at the same time while listing files. "
+            "Increase it on high-latency network shares (SMB, NFS).",
+            min=1,
+        ),
+    ] = 8,
+    opt_streaming: Annotated[
+        bool,
+        typer.Option(
+            envvar="DICOGIS_STREAMING",
+            is_flag=True,
+            help="Start reading datasets while the folder is still being listed, "
+            "instead of waiting for the complete listing. Useful on large or slow "
+            "(network) folders.",
+        ),
+    ] = False,
+    cache: Annotated[
+        bool,
+        typer.Option(
+            envvar="DICOGIS_CACHE",
+            help="Enable/disable the inventory cache: datasets which have not changed "
+            "since the previous run (same size and modification date of every file, "
+            "same statistics and structure for PostGIS tables) are not read again.",
+        ),
+    ] = True,
+    cache_ttl: Annotated[
+        int,
+        typer.Option(
+            envvar="DICOGIS_CACHE_TTL",
+            help="Maximum age of inventory cache entries, in hours. "
+            "0 means entries never expire.",
+            min=0,
+        ),
+    ] = 168,
+    rescan: Annotated[
+        bool,
+        typer.Option(
+            envvar="DICOGIS_RESCAN",
+            is_flag=True,
+            help="Read every folder again instead of reusing folders which have not "
+            "changed since the previous listing. The listing index is refreshed.",
+        ),
+    ] = False,
     language: Annotated[
         AvailableLocales | None,
         typer.Option(
@@ -206,8 +391,35 @@ def inventory(
             supported formats.
         pg_services: name(s) of PostgreSQL services to use. Repeatable. If None,
             database listing is ignored. Defaults to None.
-        pg_services: name(s) of PostgreSQL services to use. Repeatable. If None,
-            database listing is ignored. Defaults to None.
+        pg_schemas: pattern(s) of schemas to inventory. Repeatable. Defaults to None.
+        pg_tables: pattern(s) of tables to inventory. Repeatable. Defaults to None.
+        pg_exclude: pattern(s) of schemas or tables to leave out. Repeatable.
+            Defaults to None.
+        stats_mode: how features count and extent are computed. Defaults to exact.
+        pg_exact_below: in fast mode, size in megabytes under which PostGIS tables
+            statistics are computed exactly. Defaults to 50.
+        pg_connections: maximum number of connections used to read PostGIS tables
+            concurrently. Defaults to 1.
+        pg_view_max_cost: planner cost above which views statistics are not read.
+            Defaults to 1 000 000.
+        pg_view_timeout: maximum duration of each query reading a view, in seconds.
+            Defaults to 60.
+        pg_services_jobs: number of PostgreSQL services read at the same time.
+            Defaults to 1.
+        pg_server_jobs: maximum number of PostgreSQL services read at the same time
+            on a same server. 0 means no limit. Defaults to 0.
+        jobs: number of worker processes used to read datasets. Defaults to 1.
+        worker_max_datasets: number of datasets read by a worker process before being
+            recycled. Defaults to 200.
+        layers_jobs: number of layers read at the same time within a flat
+            geodatabase. Defaults to 1.
+        walker_threads: number of folders read at the same time while listing files.
+            Defaults to 8.
+        opt_streaming: read datasets while listing is still running. Defaults to False.
+        cache: enable the inventory cache. Defaults to True.
+        cache_ttl: maximum age of inventory cache entries, in hours. Defaults to 168.
+        rescan: ignore the listing index and read every folder again. Defaults to
+            False.
         language: language code to use. If not set, the current default locale is used.
             Defaults to None.
         verbose: enable verbose mode. Defaults to False.
@@ -228,6 +440,12 @@ def inventory(
     logger.debug(f"DicoGIS working folder: {app_dir}")
     logger.debug(
         f"CLI passed parameters: {input_folder=} - {formats=} - {pg_services=} - "
+        f"{pg_schemas=} - {pg_tables=} - {pg_exclude=} - "
+        f"{stats_mode=} - {pg_exact_below=} - {pg_connections=} - "
+        f"{pg_view_max_cost=} - {pg_view_timeout=} - "
+        f"{pg_services_jobs=} - {pg_server_jobs=} - "
+        f"{jobs=} - {layers_jobs=} - {walker_threads=} - {opt_streaming=} - "
+        f"{cache=} - {cache_ttl=} - {rescan=} - "
         f"{verbose=} -{language=}"
     )
 
@@ -264,100 +482,156 @@ def inventory(
             opt_raw_path=opt_raw_path,
         )
 
-        li_vectors = []
-        (
-            num_folders,
-            li_shapefiles,
-            li_mapinfo_tab,
-            li_kml,
-            li_gml,
-            li_geojson,
-            li_geotiff,
-            li_gxt,
-            li_raster,
-            li_file_database_esri,
-            li_dxf,
-            li_dwg,
-            li_dgn,
-            li_cdao,
-            li_file_databases,
-            li_file_database_spatialite,
-            li_file_database_geopackage,
-        ) = find_geodata_files(start_folder=input_folder)
-
-        print(
-            "Found: "
-            f"{len(li_shapefiles)} shapefiles - "
-            f"{len(li_mapinfo_tab)} tables (MapInfo) - "
-            f"{len(li_kml)} KML - "
-            f"{len(li_gml)} GML - "
-            f"{len(li_geojson)} GeoJSON - "
-            f"{len(li_gxt)} GXT - "
-            f"{len(li_raster)} rasters - "
-            f"{len(li_file_databases)} file databases - "
-            f"{len(li_cdao)} CAO/DAO - "
-            f"in {num_folders}{localized_strings.get('log_numfold')}"
-        )
-
-        # grouping vectors lists
-        li_vectors.extend(li_shapefiles)
-        li_vectors.extend(li_mapinfo_tab)
-        li_vectors.extend(li_kml)
-        li_vectors.extend(li_gml)
-        li_vectors.extend(li_geojson)
-        li_vectors.extend(li_gxt)
-        li_raster.extend(li_geotiff)
-
-        # check if there are some layers into the folder structure
-        if not (
-            len(li_vectors) + len(li_raster) + len(li_file_databases) + len(li_cdao)
-        ):
-            logger.error(localized_strings.get("nodata"))
-            typer.Exit(1)
-
-        # instanciate geofiles processor
-        geofiles_processor = ProcessingFiles(
-            serializer=output_serializer,
-            localized_strings=localized_strings,
-            # list by tabs
-            li_vectors=li_vectors,
-            li_rasters=li_raster,
-            li_file_databases=li_file_databases,
-            li_cdao=li_cdao,
-            # list by formats
-            li_dxf=li_dxf,
-            li_flat_geodatabase_esri_filegdb=li_file_database_esri,
-            li_flat_geodatabase_spatialite=li_file_database_spatialite,
-            li_flat_geodatabase_geopackage=li_file_database_geopackage,
-            li_geojson=li_geojson,
-            li_geotiff=li_geotiff,
-            li_gml=li_gml,
-            li_gxt=li_gxt,
-            li_kml=li_kml,
-            li_mapinfo_tab=li_mapinfo_tab,
-            li_shapefiles=li_shapefiles,
-            # options
-            opt_analyze_cdao="dxf" in formats,
-            opt_analyze_esri_filegdb="file_geodatabase_esri" in formats,
-            opt_analyze_geojson="geojson" in formats,
-            opt_analyze_gml="gml" in formats,
-            opt_analyze_gxt="gxt" in formats,
-            opt_analyze_kml="kml" in formats,
-            opt_analyze_mapinfo_tab="geojson" in formats,
-            opt_analyze_raster=any(
+        # folders which have not changed since the previous listing are not read again
+        listing_index = ListingIndex(rescan=rescan) if cache else None
+
+        # analysis options
+        analysis_options = {
+            "opt_analyze_cdao": "dxf" in formats,
+            "opt_analyze_esri_filegdb": "file_geodatabase_esri" in formats,
+            "opt_analyze_geojson": "geojson" in formats,
+            "opt_analyze_gml": "gml" in formats,
+            "opt_analyze_gxt": "gxt" in formats,
+            "opt_analyze_kml": "kml" in formats,
+            "opt_analyze_mapinfo_tab": "geojson" in formats,
+            "opt_analyze_raster": any(
                 [fmt in formats for fmt in ("ecw", "geotiff", "jpeg")]
             ),
-            opt_analyze_shapefiles="esri_shapefile" in formats,
-            opt_analyze_spatialite="file_geodatabase_spatialite" in formats,
-            # misc
-            opt_quick_fail=opt_quick_fail,
-        )
+            "opt_analyze_shapefiles": "esri_shapefile" in formats,
+            "opt_analyze_spatialite": "file_geodatabase_spatialite" in formats,
+        }
+
+        if opt_streaming:
+            # listing and reading run at the same time: no preliminary count
+            geofiles_processor = ProcessingFiles(
+                serializer=output_serializer,
+                localized_strings=localized_strings,
+                **analysis_options,
+                # misc
+                opt_quick_fail=opt_quick_fail,
+                opt_stats_mode=stats_mode,
+                # parallel execution
+                opt_jobs=jobs,
+                opt_worker_max_datasets=worker_max_datasets,
+                opt_layers_jobs=layers_jobs,
+                # cache
+                opt_cache=cache,
+                opt_cache_ttl=cache_ttl,
+            )
+            print(f"Start listing and analyzing files from {input_folder}...")
+            geofiles_processor.process_datasets_from_stream(
+                listed_geofiles=GeodataFilesLister(
+                    start_folder=input_folder,
+                    walker_threads=walker_threads,
+                    listing_index=listing_index,
+                )
+            )
+            total_files = geofiles_processor.total_files
+        else:
+            li_vectors = []
+            (
+                num_folders,
+                li_shapefiles,
+                li_mapinfo_tab,
+                li_kml,
+                li_gml,
+                li_geojson,
+                li_geotiff,
+                li_gxt,
+                li_raster,
+                li_file_database_esri,
+                li_dxf,
+                li_dwg,
+                li_dgn,
+                li_cdao,
+                li_file_databases,
+                li_file_database_spatialite,
+                li_file_database_geopackage,
+            ) = find_geodata_files(
+                start_folder=input_folder,
+                walker_threads=walker_threads,
+                listing_index=listing_index,
+            )
+
+            print(
+                "Found: "
+                f"{len(li_shapefiles)} shapefiles - "
+                f"{len(li_mapinfo_tab)} tables (MapInfo) - "
+                f"{len(li_kml)} KML - "
+                f"{len(li_gml)} GML - "
+                f"{len(li_geojson)} GeoJSON - "
+                f"{len(li_gxt)} GXT - "
+                f"{len(li_raster)} rasters - "
+                f"{len(li_file_databases)} file databases - "
+                f"{len(li_cdao)} CAO/DAO - "
+                f"in {num_folders}{localized_strings.get('log_numfold')}"
+            )
+
+            # grouping vectors lists
+            li_vectors.extend(li_shapefiles)
+            li_vectors.extend(li_mapinfo_tab)
+            li_vectors.extend(li_kml)
+            li_vectors.extend(li_gml)
+            li_vectors.extend(li_geojson)
+            li_vectors.extend(li_gxt)
+            li_raster.extend(li_geotiff)
+
+            # check if there are some layers into the folder structure
+            if not (
+                len(li_vectors) + len(li_raster) + len(li_file_databases) + len(li_cdao)
+            ):
+                logger.error(localized_strings.get("nodata"))
+                typer.Exit(1)
+
+            # instanciate geofiles processor
+            geofiles_processor = ProcessingFiles(
+                serializer=output_serializer,
+                localized_strings=localized_strings,
+                # list by tabs
+                li_vectors=li_vectors,
+                li_rasters=li_raster,
+                li_file_databases=li_file_databases,
+                li_cdao=li_cdao,
+                # list by formats
+                li_dxf=li_dxf,
+                li_flat_geodatabase_esri_filegdb=li_file_database_esri,
+                li_flat_geodatabase_spatialite=li_file_database_spatialite,
+                li_flat_geodatabase_geopackage=li_file_database_geopackage,
+                li_geojson=li_geojson,
+                li_geotiff=li_geotiff,
+                li_gml=li_gml,
+                li_gxt=li_gxt,
+                li_kml=li_kml,
+                li_mapinfo_tab=li_mapinfo_tab,
+                li_shapefiles=li_shapefiles,
+                # options
+                **analysis_options,
+                # misc
+                opt_quick_fail=opt_quick_fail,
+                opt_stats_mode=stats_mode,
+                # parallel execution
+                opt_jobs=jobs,
+                opt_worker_max_datasets=worker_max_datasets,
+                opt_layers_jobs=layers_jobs,
+                # cache
+                opt_cache=cache,
+                opt_cache_ttl=cache_ttl,
+            )
 
-        # sheets and progress bar
-        total_files = geofiles_processor.count_files_to_process()
-        print(f"Start analyzing {total_files} files...")
+            # sheets and progress bar
+            total_files = geofiles_processor.count_files_to_process()
+            print(f"Start analyzing {total_files} files...")
 
-        geofiles_processor.process_datasets_in_queue()
+            geofiles_processor.process_datasets_in_queue()
+
+        if cache:
+            print(
+                f"Listing index: {listing_index.count_reused} folders reused - "
+                f"{listing_index.count_read} folders read. "
+                f"Inventory cache: {geofiles_processor.count_cache_hits} hits - "
+                f"{geofiles_processor.count_cache_misses} misses."
+            )
+            listing_index.close()
 
         send_system_notify(
             notification_title="DicoGIS analysis ended",
@@ -392,40 +666,60 @@ def inventory(
         # configure output workbook
         output_serializer.pre_serializing(has_sgbd=True)
 
-        for pg_service in pg_services:
-            print(f"Start processing using PostgreSQL service: {pg_service}")
-
-            # testing connection settings
-            sgbd_reader = ReadPostGIS(service=pg_service)
-            sgbd_reader.get_connection()
-
-            # check connection state
-            if sgbd_reader.conn is None:
-                fail_reason = sgbd_reader.db_connection.state_msg
-                logger.error(
-                    f"Connection failed using pg_service {pg_service}. Trace: {fail_reason}."
+        databases_processor = ProcessingDatabases(
+            readers=[
+                ReadPostGIS(
+                    service=pg_service,
+                    stats_mode=stats_mode,
+                    exact_stats_below_mb=pg_exact_below,
+                    max_connections=pg_connections,
+                    relations_filter=RelationsFilter(
+                        schemas=pg_schemas or [],
+                        tables=pg_tables or [],
+                        excludes=pg_exclude or [],
+                    ),
+                    view_max_cost=pg_view_max_cost,
+                    view_statement_timeout=pg_view_timeout,
+                    inventory_cache=(
+                        get_inventory_cache(
+                            database_path=InventoryCache.default_database_path(),
+                            ttl_hours=cache_ttl,
+                        )
+                        if cache
+                        else None
+                    ),
                 )
-                continue
-
-            # show must go on
-            logger.info(
-                f"{sgbd_reader.conn.GetLayerCount()} tables found in PostGIS database."
-            )
+                for pg_service in pg_services
+            ],
+            max_databases=pg_services_jobs,
+            max_databases_per_server=pg_server_jobs,
+        )
 
-            # parsing the layers
-            for idx_layer in range(sgbd_reader.conn.GetLayerCount()):
-                layer = sgbd_reader.conn.GetLayerByIndex(idx_layer)
-                metadataset = sgbd_reader.infos_dataset(layer=layer)
-                logger.info(f"Table examined: {metadataset.name}")
-                output_serializer.serialize_metadaset(metadataset=metadataset)
-                logger.debug("Layer metadata stored into workbook.")
+        # databases are read concurrently but serialized in the order of services
+        for metadataset in databases_processor.iter_metadatasets():
+            logger.info(f"Table examined: {metadataset.name}")
+            output_serializer.serialize_metadaset(metadataset=metadataset)
+            logger.debug("Layer metadata stored into workbook.")
+
+        for database in databases_processor.li_databases_to_process:
+            if database.process_error:
+                print(
+                    f"[bold red]PostgreSQL service {database.name}: connection "
+                    f"failed. Trace: {database.process_error}[/bold red]"
+                )
+            elif cache:
+                print(
+                    f"PostgreSQL service {database.name}: "
+                    f"{database.reader.count_cache_hits} tables unchanged (skipped) - "
+                    f"{database.reader.count_cache_misses} read."
+                )
 
         output_serializer.post_serializing()
 
         send_system_notify(
             notification_title="DicoGIS analysis ended",
             notification_message="DicoGIS successfully processed "
-            f"{sgbd_reader.conn.GetLayerCount()} PostGIS tables. "
+            f"{databases_processor.count_metadatasets} PostGIS tables. "
             "\nOpen the application to save the workbook.",
             notification_sound=opt_notify_sound,
         )
@@ -6,6 +6,7 @@
 
 # standard lib
 import logging
+from multiprocessing import freeze_support
 from typing import Annotated
 
 # 3rd party
@@ -91,4 +92,6 @@ click_object = typer.main.get_command(dicogis_cli)
 # #################################
 if __name__ == "__main__":
     """standalone execution"""
+    # required by worker processes (--jobs) in frozen executables (PyInstaller)
+    freeze_support()
     dicogis_cli()
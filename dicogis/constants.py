@@ -63,6 +63,20 @@ class OutputFormats(str, ExtendedEnum):
     udata = "udata"
 
 
+class StatisticsModes(str, ExtendedEnum):
+    """Ways to get features count and spatial extent of vector datasets."""
+
+    # computed by reading the whole layer if the driver can't provide them
+    exact = "exact"
+    # only values the driver can provide without reading the layer, else missing
+    fast = "fast"
+    # not computed
+    skip = "skip"
+    # read from database planner statistics (PostGIS tables in fast mode). Requested
+    # as option, behaves like fast.
+    estimated = "estimated"
+
+
 class FormatsVector(ExtendedEnum):
     """Supported vectors formats. Key=name, value = extension."""
 
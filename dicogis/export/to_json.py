@@ -16,7 +16,7 @@ from typing import Literal
 
 # project
 from dicogis.__about__ import __version__
-from dicogis.constants import JsonFlavors
+from dicogis.constants import JsonFlavors, StatisticsModes
 from dicogis.export.base_serializer import MetadatasetSerializerBase
 from dicogis.models.metadataset import MetaDataset
 from dicogis.utils.slugger import sluggy
@@ -94,6 +94,10 @@ class MetadatasetSerializerJson(MetadatasetSerializerBase):
             ],
         }
 
+        # flag statistics which have not been computed exactly
+        if metadataset.statistics_mode not in (None, StatisticsModes.exact.value):
+            out_dict["extras"]["dicogis_statistics_mode"] = metadataset.statistics_mode
+
         # add udata organization if set as environment variable
         if udata_organization_id := getenv("DICOGIS_UDATA_ORGANIZATION_ID"):
             out_dict["organization"] = f"{udata_organization_id}"
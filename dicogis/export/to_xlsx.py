@@ -12,14 +12,17 @@ from pathlib import Path
 
 # 3rd party library
 from openpyxl import Workbook
+from openpyxl.comments import Comment
 from openpyxl.styles import Alignment, NamedStyle
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
 # project
+from dicogis.constants import StatisticsModes
 from dicogis.export.base_serializer import MetadatasetSerializerBase
 from dicogis.models.metadataset import (
     MetaDatabaseFlat,
+    MetaDatabaseRaster,
     MetaDatabaseTable,
     MetaDataset,
     MetaRasterDataset,
@@ -144,6 +147,14 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
         "format",
         "li_chps",
         "gdal_err",
+        "size_Y",
+        "size_X",
+        "pixel_w",
+        "pixel_h",
+        "num_bands",
+        "raster_tiling",
+        "raster_overviews",
+        "tot_size",
     ]
 
     def __init__(
@@ -173,6 +184,12 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
         ws = self.workbook.active
         self.workbook.remove(worksheet=ws)
 
+        # first row of each serialized dataset with its path, by worksheet title, to
+        # sort rows once everything has been serialized
+        self.datasets_first_rows: dict[str, list[tuple[str, int]]] = {}
+        # column letter where to store processing errors, by worksheet title
+        self.errors_columns: dict[str, str] = {}
+
         # initiate with parent
         super().__init__(
             localized_strings=localized_strings,
@@ -216,6 +233,9 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
             self.sheet_vector_files.append(
                 [self.localized_strings.get(i) for i in self.li_cols_vector]
             )
+            self.errors_columns[self.sheet_vector_files.title] = self.get_error_column(
+                columns=self.li_cols_vector
+            )
 
             # initialize line counter
             self.row_index_vector_files = 1
@@ -232,6 +252,9 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
             self.sheet_raster_files.append(
                 [self.localized_strings.get(i) for i in self.li_cols_raster]
             )
+            self.errors_columns[self.sheet_raster_files.title] = self.get_error_column(
+                columns=self.li_cols_raster
+            )
 
             # initialize line counter
             self.row_index_raster_files = 1
@@ -248,6 +271,9 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
             self.sheet_flat_geodatabases.append(
                 [self.localized_strings.get(i) for i in self.li_cols_filedb]
             )
+            self.errors_columns[self.sheet_flat_geodatabases.title] = (
+                self.get_error_column(columns=self.li_cols_filedb)
+            )
 
             # initialize line counter
             self.row_index_flat_geodatabases = 1
@@ -264,6 +290,9 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
             self.sheet_map_workspaces.append(
                 [self.localized_strings.get(i) for i in self.li_cols_mapdocs]
             )
+            self.errors_columns[self.sheet_map_workspaces.title] = (
+                self.get_error_column(columns=self.li_cols_mapdocs)
+            )
 
             # initialize line counter
             self.row_index_map_worskpaces = 1
@@ -289,16 +318,64 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
             self.sheet_server_geodatabases.append(
                 [self.localized_strings.get(i) for i in self.li_cols_sgbd]
             )
+            self.errors_columns[self.sheet_server_geodatabases.title] = (
+                self.get_error_column(columns=self.li_cols_sgbd)
+            )
             # initialize line counter
             self.row_index_server_geodatabases = 1
 
-    def post_serializing(self):
-        """Run post serialization steps."""
+    def post_serializing(self, sort_rows: bool = False):
+        """Run post serialization steps.
+
+        Args:
+            sort_rows: sort datasets of each worksheet by path, for datasets which
+                have not been serialized in order. Defaults to False.
+        """
+        if sort_rows:
+            self.sort_rows_by_path()
         self.tunning_workbook()
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         self.workbook.save(filename=self.output_path)
         logger.info(f"Workbook saved under {self.output_path}")
 
+    def sort_rows_by_path(self):
+        """Sort datasets rows of each worksheet by dataset path. Rows of a dataset
+        (a database and its layers) are kept together."""
+        for worksheet in self.workbook.worksheets:
+            datasets_first_rows = self.datasets_first_rows.get(worksheet.title)
+            if not datasets_first_rows:
+                continue
+
+            # rows of each dataset, from its first row to the next dataset one
+            last_row = worksheet.max_row
+            datasets_rows = [
+                (
+                    dataset_path,
+                    first_row,
+                    (
+                        datasets_first_rows[idx + 1][1] - 1
+                        if idx + 1 < len(datasets_first_rows)
+                        else last_row
+                    ),
+                )
+                for idx, (dataset_path, first_row) in enumerate(datasets_first_rows)
+            ]
+            last_column = get_column_letter(worksheet.max_column)
+
+            # move datasets below the last row in path order, then move them up
+            target_row = last_row + 1
+            for _, first_row, dataset_last_row in sorted(datasets_rows):
+                worksheet.move_range(
+                    f"A{first_row}:{last_column}{dataset_last_row}",
+                    rows=target_row - first_row,
+                )
+                target_row += dataset_last_row - first_row + 1
+            worksheet.move_range(
+                f"A{last_row + 1}:{last_column}{target_row - 1}",
+                rows=datasets_rows[0][1] - last_row - 1,
+            )
+            datasets_first_rows.clear()
+
     def tunning_workbook(self):
         """Clean up and tunning worksheet."""
         for sheet in self.workbook.worksheets:
@@ -445,6 +522,22 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
         else:
             return in_size_in_octets
 
+    @staticmethod
+    def get_error_column(columns: list[str]) -> str:
+        """Get the letter of the column where to store processing errors: GDAL
+        errors or warnings column if any, else the first column after headers.
+
+        Args:
+            columns (list[str]): worksheet's columns names
+
+        Returns:
+            str: column letter
+        """
+        for column_name in ("gdal_err", "gdal_warn"):
+            if column_name in columns:
+                return get_column_letter(columns.index(column_name) + 1)
+        return get_column_letter(len(columns) + 1)
+
     def store_error(
         self,
         metadataset: MetaDataset,
@@ -470,16 +563,46 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
         worksheet[f"B{row_index}"].style = "Warning Text"
         worksheet[f"C{row_index}"] = err_mess
         worksheet[f"C{row_index}"].style = "Warning Text"
-        # gdal info
-        worksheet[f"Q{row_index}"] = (
-            f"{metadataset.processing_error_type}: {metadataset.processing_error_msg}"
-        )
-        worksheet[f"Q{row_index}"].style = "Warning Text"
+        # gdal info: every message raised while reading the dataset
+        error_column = self.errors_columns.get(worksheet.title, "Q")
+        if metadataset.processing_messages:
+            worksheet[f"{error_column}{row_index}"] = "\n".join(
+                f"{message}" for message in metadataset.processing_messages
+            )
+        else:
+            worksheet[f"{error_column}{row_index}"] = (
+                f"{metadataset.processing_error_type}: "
+                f"{metadataset.processing_error_msg}"
+            )
+        worksheet[f"{error_column}{row_index}"].style = "Warning Text"
         logger.debug(
             f"Processing error detected on {metadataset.name} (in "
             f"{metadataset.path_as_str}) ({err_mess}) has been stored."
         )
 
+    def mark_statistics(
+        self,
+        metadataset: MetaDataset,
+        worksheet: Worksheet,
+        cells: Iterable[str],
+    ):
+        """Add a comment on features count and extent cells when they have not been
+        computed exactly, to avoid taking estimates for real values.
+
+        Args:
+            metadataset (MetaDataset): metadata with statistics mode
+            worksheet (Worksheet): Excel workbook's sheet where to store
+            cells (Iterable[str]): coordinates of cells to mark (E12...)
+        """
+        if metadataset.statistics_mode in (None, StatisticsModes.exact.value):
+            return
+
+        for cell in cells:
+            worksheet[cell].comment = Comment(
+                text=f"Statistics mode: {metadataset.statistics_mode}",
+                author="DicoGIS",
+            )
+
     def get_sheet_and_incremented_row_index_from_type(
         self,
         metadataset: MetaDataset,
@@ -499,10 +622,12 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
         ):
             self.row_index_vector_files += 1
             return self.sheet_vector_files, self.row_index_vector_files
-        elif isinstance(metadataset, MetaRasterDataset):
+        elif isinstance(metadataset, MetaRasterDataset) and not isinstance(
+            metadataset, MetaDatabaseRaster
+        ):
             self.row_index_raster_files += 1
             return self.sheet_raster_files, self.row_index_raster_files
-        elif isinstance(metadataset, MetaDatabaseTable):
+        elif isinstance(metadataset, (MetaDatabaseTable, MetaDatabaseRaster)):
             self.row_index_server_geodatabases += 1
             return self.sheet_server_geodatabases, self.row_index_server_geodatabases
         elif isinstance(metadataset, MetaDatabaseFlat):
@@ -521,6 +646,9 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
         worksheet, row_index = self.get_sheet_and_incremented_row_index_from_type(
             metadataset=metadataset
         )
+        self.datasets_first_rows.setdefault(worksheet.title, []).append(
+            (f"{metadataset.path}", row_index)
+        )
 
         # -- Common --
         # in case of a source error
@@ -560,6 +688,15 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
                 worksheet=worksheet,
                 row_index=row_index,
             )
+        elif (
+            isinstance(metadataset, MetaDatabaseRaster)
+            and metadataset.dataset_type == "sgbd_postgis"
+        ):
+            return self.store_md_geodatabases_server_raster(
+                metadataset=metadataset,
+                worksheet=worksheet,
+                row_index=row_index,
+            )
         elif isinstance(metadataset, MetaDatabaseFlat) and metadataset.dataset_type in (
             "flat_database",
             "flat_database_esri",
@@ -629,6 +766,11 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
         # Spatial extent
         worksheet[f"J{row_index}"].style = "wrap"
         worksheet[f"J{row_index}"] = self.format_bbox(bbox=metadataset.bbox)
+        self.mark_statistics(
+            metadataset=metadataset,
+            worksheet=worksheet,
+            cells=(f"E{row_index}", f"J{row_index}"),
+        )
 
         # Creation date
         worksheet[f"K{row_index}"] = metadataset.storage_date_created
@@ -817,6 +959,11 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
             # Spatial extent
             worksheet[f"O{row_index}"].style = "wrap"
             worksheet[f"O{row_index}"] = self.format_bbox(bbox=layer_metadataset.bbox)
+            self.mark_statistics(
+                metadataset=layer_metadataset,
+                worksheet=worksheet,
+                cells=(f"J{row_index}", f"O{row_index}"),
+            )
 
             # Field informations
             worksheet[f"P{row_index}"] = self.format_feature_attributes(
@@ -877,6 +1024,9 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
         worksheet[f"Q{row_index}"] = metadataset.format_gdal_long_name
         worksheet[f"R{row_index}"] = metadataset.count_feature_attributes
         worksheet[f"S{row_index}"] = metadataset.features_objects_count
+        self.mark_statistics(
+            metadataset=metadataset, worksheet=worksheet, cells=(f"S{row_index}",)
+        )
 
         for layer_idx, layer_name in zip(
             metadataset.get("layers_idx"), metadataset.get("layers_names")
@@ -1003,6 +1153,11 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
         # Spatial extent
         worksheet[f"J{row_index}"].style = "wrap"
         worksheet[f"J{row_index}"] = self.format_bbox(bbox=metadataset.bbox)
+        self.mark_statistics(
+            metadataset=metadataset,
+            worksheet=worksheet,
+            cells=(f"E{row_index}", f"J{row_index}"),
+        )
 
         # type
         worksheet[f"K{row_index}"] = metadataset.format_gdal_long_name
@@ -1011,3 +1166,90 @@ class MetadatasetSerializerXlsx(MetadatasetSerializerBase):
         worksheet[f"L{row_index}"] = self.format_feature_attributes(
             metadataset=metadataset
         )
+
+    def store_md_geodatabases_server_raster(
+        self,
+        metadataset: MetaDatabaseRaster,
+        worksheet: Worksheet | None = None,
+        row_index: int | None = None,
+    ):
+        """Serialize a raster table metadataset into an Excel worksheet's row.
+
+        Args:
+            metadataset (MetaDatabaseRaster): metadataset to serialize
+            worksheet (Workbook | None, optional): Excel workbook's sheet where to store. Defaults to None.
+            row_index (int | None, optional): worksheet's row index. Defaults to None.
+        """
+        # if args not defined use class attributes
+        if worksheet is None:
+            worksheet = self.sheet_server_geodatabases
+        if row_index is None:
+            row_index = self.row_index_server_geodatabases
+
+        # connection string
+        worksheet[f"B{row_index}"] = metadataset.path_as_str
+        worksheet[f"B{row_index}"].style = "Hyperlink"
+        # schema
+        worksheet[f"C{row_index}"] = metadataset.schema_name
+
+        # structure: the raster column stands for the geometry
+        worksheet[f"F{row_index}"] = f"Raster ({metadataset.raster_column})"
+
+        # SRS
+        # Name of srs
+        worksheet[f"G{row_index}"] = metadataset.crs_name
+        # Type of SRS
+        worksheet[f"H{row_index}"] = self.localized_strings.get(
+            metadataset.crs_type, str(metadataset.crs_type)
+        )
+        # SRS code
+        worksheet[f"I{row_index}"] = metadataset.crs_registry_code
+
+        # Spatial extent
+        worksheet[f"J{row_index}"].style = "wrap"
+        worksheet[f"J{row_index}"] = self.format_bbox(bbox=metadataset.bbox)
+
+        # type
+        worksheet[f"K{row_index}"] = metadataset.format_gdal_long_name
+
+        # Bands informations
+        worksheet[f"L{row_index}"].style = "wrap"
+        worksheet[f"L{row_index}"] = " ; ".join(
+            f"{idx_band} ({pixel_type}, nodata={nodata_value})"
+            for idx_band, (pixel_type, nodata_value) in enumerate(
+                zip(
+                    metadataset.pixel_types or [],
+                    metadataset.nodata_values
+                    or [None] * len(metadataset.pixel_types or []),
+                ),
+                start=1,
+            )
+        )
+
+        # Image dimensions
+        worksheet[f"N{row_index}"] = metadataset.rows_count
+        worksheet[f"O{row_index}"] = metadataset.columns_count
+
+        # Pixel dimensions
+        worksheet[f"P{row_index}"] = metadataset.pixel_width
+        worksheet[f"Q{row_index}"] = metadataset.pixel_height
+
+        # Number of bands
+        worksheet[f"R{row_index}"] = metadataset.bands_count
+
+        # Tiling
+        if metadataset.tile_width or metadataset.tile_height:
+            tiling = f"{metadataset.tile_width} x {metadataset.tile_height}"
+            if metadataset.tiles_count is not None:
+                tiling += f" ({metadataset.tiles_count} tiles)"
+            worksheet[f"S{row_index}"] = tiling
+
+        # Overview tables
+        worksheet[f"T{row_index}"].style = "wrap"
+        worksheet[f"T{row_index}"] = " |\n ".join(metadataset.overviews or [])
+
+        # total size of the table, with indexes and TOAST
+        if metadataset.storage_size is not None:
+            worksheet[f"U{row_index}"] = self.format_size(
+                in_size_in_octets=metadataset.storage_size
+            )
@@ -7,16 +7,20 @@
 
 # Standard library
 import logging
+from collections.abc import Iterable
+from functools import lru_cache
 from locale import getlocale
 from os import path
 from pathlib import Path
+from time import monotonic
 from typing import Literal
 
 # 3rd party libraries
 from osgeo import gdal, ogr, osr
 
 # project
-from dicogis.constants import GDAL_POSTGIS_OPEN_OPTIONS
+from dicogis.cache.srs_cache import srs_cache
+from dicogis.constants import GDAL_POSTGIS_OPEN_OPTIONS, StatisticsModes
 from dicogis.georeaders.gdal_exceptions_handler import GdalErrorHandler
 from dicogis.models.feature_attributes import AttributeField
 from dicogis.models.metadataset import MetaDataset
@@ -28,6 +32,60 @@ from dicogis.utils.texts import TextsManager
 # ##############################
 
 logger = logging.getLogger(__name__)
+# shared to load translated strings only once
+txt_manager = TextsManager()
+
+# OGC geometry types mapped to OGR geometry types
+OGC_GEOMETRY_TYPES_OGR: dict[str, int] = {
+    "GEOMETRY": ogr.wkbUnknown,
+    "POINT": ogr.wkbPoint,
+    "LINESTRING": ogr.wkbLineString,
+    "POLYGON": ogr.wkbPolygon,
+    "MULTIPOINT": ogr.wkbMultiPoint,
+    "MULTILINESTRING": ogr.wkbMultiLineString,
+    "MULTIPOLYGON": ogr.wkbMultiPolygon,
+    "GEOMETRYCOLLECTION": ogr.wkbGeometryCollection,
+    "CIRCULARSTRING": ogr.wkbCircularString,
+    "COMPOUNDCURVE": ogr.wkbCompoundCurve,
+    "CURVEPOLYGON": ogr.wkbCurvePolygon,
+    "MULTICURVE": ogr.wkbMultiCurve,
+    "MULTISURFACE": ogr.wkbMultiSurface,
+    "POLYHEDRALSURFACE": ogr.wkbPolyhedralSurface,
+    "TIN": ogr.wkbTIN,
+    "TRIANGLE": ogr.wkbTriangle,
+}
+
+# GDAL drivers whose files all share the stem of the dataset main file, so that the
+# sibling files given by the listing are complete and GDAL can skip reading the folder
+GDAL_DRIVERS_STEM_SIDECARS: frozenset[str] = frozenset(
+    (
+        "DXF",
+        "ESRI Shapefile",
+        "ESRIJSON",
+        "Geoconcept",
+        "GeoJSON",
+        "GeoJSONSeq",
+        "GML",
+        "GPKG",
+        "KML",
+        "LIBKML",
+        "MapInfo File",
+        "SQLite",
+    )
+)
+
+# ##############################################################################
+# ########## Functions #############
+# ##################################
+
+
+@lru_cache
+def register_gdal_drivers():
+    """Register GDAL drivers and enable exceptions, once per process."""
+    gdal.AllRegister()
+    gdal.UseExceptions()
+    ogr.UseExceptions()
+
 
 # ##############################################################################
 # ########## Classes ###############
@@ -37,6 +95,11 @@ logger = logging.getLogger(__name__)
 class GeoReaderBase:
     """Base class for geographic dataset readers."""
 
+    # bounds of geometry types sampling, for layers without a declared geometry type:
+    # maximum number of features read and maximum duration in seconds
+    GEOMETRY_SAMPLE_SIZE: int = 100
+    GEOMETRY_SAMPLE_TIMEOUT: float = 2.0
+
     def __init__(
         self,
         dataset_type: Literal[
@@ -48,35 +111,95 @@ class GeoReaderBase:
             "sgbd_postgis",
         ],
         localized_strings: dict | None = None,
+        stats_mode: StatisticsModes | str = StatisticsModes.exact,
     ) -> None:
         """Initialization.
 
         Args:
             dataset_type: type of dataset to read
             localized_strings: translated strings
+            stats_mode: how to get features count and spatial extent of vector
+                layers: exact, fast (only driver-provided values) or skip.
+                Defaults to exact.
         """
         # store args as attributes
         self.dataset_type = dataset_type
+        self.stats_mode = StatisticsModes(stats_mode)
+        # estimated statistics are an outcome of the fast mode
+        if self.stats_mode == StatisticsModes.estimated:
+            self.stats_mode = StatisticsModes.fast
 
         # i18n
         self.localized_strings = localized_strings
         if self.localized_strings is None:
-            self.localized_strings = TextsManager().load_texts(
-                language_code=getlocale()
-            )
+            self.localized_strings = txt_manager.load_texts(language_code=getlocale())
         # attributes to be used later
         self.counter_alerts: int = 0
+        # layers read at the same time in multi-layers datasets, by readers which
+        # support it, each one with its own dataset handle
+        self.max_layers_jobs: int = 1
 
-        # GDAL customization and error handling
-        gdal.AllRegister()
+        # GDAL customization and error handling: the handler is pushed when the
+        # reading session is opened
+        register_gdal_drivers()
         self.gdal_err = GdalErrorHandler()
-        errhandler = self.gdal_err.handler
-        gdal.PushErrorHandler(errhandler)
-        gdal.UseExceptions()
-        ogr.UseExceptions()
+        self.session_opened: bool = False
+
+    def __enter__(self):
+        """Open a reading session when entering the context manager.
+
+        Returns:
+            the georeader itself
+        """
+        self.open_session()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the reading session when exiting the context manager."""
+        self.close_session()
+
+    def open_session(self):
+        """Set up the reader to read datasets: push its GDAL error handler. Nothing is
+        done if the session is already opened.
+
+        GDAL error handlers are stacked per thread: the session must be used and
+        closed in the thread which opened it.
+        """
+        if self.session_opened:
+            return
+
+        gdal.PushErrorHandler(self.gdal_err.handler)
+        self.session_opened = True
+
+    def close_session(self):
+        """Tear down the reader: pop its GDAL error handler."""
+        if not self.session_opened:
+            return
+
+        gdal.PopErrorHandler()
+        self.session_opened = False
+
+    def prepare_reading(self, metadataset: MetaDataset | None = None):
+        """Make the reader ready to read a new dataset: open the session if needed and
+        reset the error state left by the previous dataset.
+
+        Args:
+            metadataset: metadataset being filled. If set, GDAL messages raised in the
+                current thread until the next reset are attached to it.
+                Defaults to None.
+        """
+        self.open_session()
+        self.counter_alerts = 0
+        self.gdal_err.reset()
+        if metadataset is not None:
+            metadataset.processing_messages = self.gdal_err.messages
+            metadataset.statistics_mode = self.stats_mode.value
 
     def calc_size_full_dataset(
-        self, source_path: Path | str, dependencies: list[Path] | None = None
+        self,
+        source_path: Path | str,
+        dependencies: list[Path] | None = None,
+        sibling_files: dict[str, int | None] | None = None,
     ) -> int:
         """Calculate size of dataset and its dependencies.
 
@@ -84,6 +207,9 @@ class GeoReaderBase:
             source_path (str): path to the dataset or a folder.
             dependencies (list, optional): list of dataset's dependencies.
                 Defaults to None.
+            sibling_files: files next to the dataset with their size, as known from
+                the listing. Known sizes are used instead of querying the file
+                system. Defaults to None.
 
         Returns:
             int: size in octets
@@ -95,9 +221,20 @@ class GeoReaderBase:
         if dependencies is None:
             dependencies = []
 
-        if source_path.is_file():
-            total_size = (
-                sum(f.stat().st_size for f in dependencies) + source_path.stat().st_size
+        def get_file_size(file_path: Path) -> int:
+            if (
+                sibling_files is not None
+                and file_path.parent == source_path.parent
+                and (file_size := sibling_files.get(file_path.name)) is not None
+            ):
+                return file_size
+            return file_path.stat().st_size
+
+        if (
+            sibling_files is not None and source_path.name in sibling_files
+        ) or source_path.is_file():
+            total_size = sum(get_file_size(f) for f in dependencies) + get_file_size(
+                source_path
             )
         elif source_path.is_dir():
             total_size = sum(
@@ -143,17 +280,76 @@ class GeoReaderBase:
             # method end
             return target_container
 
+    def get_catalog_srs_details(
+        self,
+        srid: int,
+        srs_auth_name: str | None,
+        srs_auth_srid: int | None,
+        srs_wkt: str | None,
+    ) -> tuple[str, str, str, str]:
+        """Get coordinates system name, type and registry code from a spatial_ref_sys
+        entry of a spatial database (PostGIS, GeoPackage), loaded as OGR drivers do.
+        Details are cached on the entry, without loading it with OSR.
+
+        Args:
+            srid: SRID of the geometry column
+            srs_auth_name: authority name
+            srs_auth_srid: code in the authority
+            srs_wkt: WKT definition
+
+        Returns:
+            crs_name, crs_registry, crs_code, crs_type
+        """
+        fingerprint = srs_cache.compute_fingerprint(
+            "catalog",
+            gdal.VersionInfo(),
+            srid,
+            srs_auth_name,
+            srs_auth_srid,
+            srs_wkt,
+        )
+        srs_details = srs_cache.get(fingerprint=fingerprint)
+        if srs_details is not None:
+            return srs_details
+
+        spatial_reference: osr.SpatialReference | None = None
+        if srid > 0 and (srs_auth_srid or srs_wkt):
+            spatial_reference = osr.SpatialReference()
+            try:
+                if f"{srs_auth_name}".upper() == "EPSG" and srs_auth_srid:
+                    spatial_reference.ImportFromEPSG(int(srs_auth_srid))
+                else:
+                    spatial_reference.ImportFromWkt(srs_wkt)
+            except (RuntimeError, TypeError, ValueError) as err:
+                logger.debug(f"Unable to load SRS {srid}. Trace: {err}")
+                try:
+                    spatial_reference.ImportFromWkt(srs_wkt)
+                except (RuntimeError, TypeError):
+                    spatial_reference = None
+
+        srs_details = self.get_srs_details_from_spatial_reference(
+            spatial_reference=spatial_reference
+        )
+        srs_cache.store(fingerprint=fingerprint, srs_details=srs_details)
+        return srs_details
+
     def get_extent_as_tuple(
         self, dataset_or_layer: ogr.Layer | gdal.Dataset
     ) -> tuple[float | None, float | None, float | None, float | None]:
-        """Get spatial extent (bounding box)."""
-        if hasattr(dataset_or_layer, "GetExtent"):
-            return (
-                round(dataset_or_layer.GetExtent()[0], 2),
-                round(dataset_or_layer.GetExtent()[1], 2),
-                round(dataset_or_layer.GetExtent()[2], 2),
-                round(dataset_or_layer.GetExtent()[3], 2),
+        """Get spatial extent (bounding box). For vector layers, depends on the
+        statistics mode: computed once (exact), only if the driver provides it (fast)
+        or not at all (skip)."""
+        if isinstance(dataset_or_layer, ogr.Layer):
+            if self.stats_mode == StatisticsModes.skip:
+                return (None, None, None, None)
+
+            extent = dataset_or_layer.GetExtent(
+                force=self.stats_mode == StatisticsModes.exact, can_return_null=True
             )
+            if extent is None:
+                return (None, None, None, None)
+
+            return tuple(round(coordinate, 2) for coordinate in extent)
         elif hasattr(dataset_or_layer, "GetGeoTransform"):
             """
             Returns the minimum and maximum coordinate values in the sequence expected
@@ -169,6 +365,29 @@ class GeoReaderBase:
         else:
             return (None, None, None, None)
 
+    def get_features_count(self, layer: ogr.Layer) -> int | None:
+        """Get features count of a vector layer, depending on the statistics mode:
+        counted if needed (exact), only if the driver provides it (fast) or not at
+        all (skip).
+
+        Args:
+            layer: OGR layer
+
+        Returns:
+            features count or None if it's unknown
+        """
+        if self.stats_mode == StatisticsModes.skip:
+            return None
+
+        features_count = layer.GetFeatureCount(
+            force=self.stats_mode == StatisticsModes.exact
+        )
+        # -1 means the driver can't provide the count without reading the layer
+        if features_count < 0:
+            return None
+
+        return features_count
+
     def get_fields_details(
         self, ogr_layer_definition: ogr.FeatureDefn
     ) -> tuple[AttributeField]:
@@ -189,13 +408,14 @@ class GeoReaderBase:
         return tuple(li_feature_attributes)
 
     def get_geometry_type(self, layer: ogr.Layer) -> str | None:
-        """Get geometry type for a given ogr layer.
+        """Get geometry type for a given ogr layer. If the layer doesn't declare a
+        specific type, geometry types found in a sample of features are listed.
 
         Args:
             layer: OGR layer
 
         Returns:
-            geometry type or None
+            geometry type (comma-separated types for mixed layers) or None
         """
         geometry_type: str | None = None
         try:
@@ -213,27 +433,76 @@ class GeoReaderBase:
         ):
             return geometry_type
 
+        geometry_types = self.get_sampled_geometry_types(layer=layer)
+        if not geometry_types:
+            return None
+        return ", ".join(geometry_types)
+
+    def get_ogr_geometry_type_name(
+        self, geometry_type: str, has_z: bool = False, has_m: bool = False
+    ) -> str:
+        """Get OGR name of an OGC geometry type, as declared in a spatial database.
+
+        Args:
+            geometry_type: OGC geometry type, e.g. 'MULTIPOLYGON'
+            has_z: geometries have Z coordinates. Defaults to False.
+            has_m: geometries have M coordinates. Defaults to False.
+
+        Returns:
+            OGR geometry type name, e.g. '3D Multi Polygon'
+        """
+        ogr_geometry_type = OGC_GEOMETRY_TYPES_OGR.get(
+            geometry_type.upper(), ogr.wkbUnknown
+        )
+        if has_z:
+            ogr_geometry_type = ogr.GT_SetZ(ogr_geometry_type)
+        if has_m:
+            ogr_geometry_type = ogr.GT_SetM(ogr_geometry_type)
+        return ogr.GeometryTypeToName(ogr_geometry_type)
+
+    def get_sampled_geometry_types(self, layer: ogr.Layer) -> list[str] | None:
+        """Get geometry types of the first features of a layer, reading at most
+        GEOMETRY_SAMPLE_SIZE features for at most GEOMETRY_SAMPLE_TIMEOUT seconds.
+
+        Args:
+            layer: OGR layer
+
+        Returns:
+            sorted distinct geometry types or None if sampling failed
+        """
+        geometry_types: set[str] = set()
+        deadline = monotonic() + self.GEOMETRY_SAMPLE_TIMEOUT
         try:
-            first_feature_object: ogr.Feature = layer.GetNextFeature()
-        except AttributeError as err:
+            layer.ResetReading()
+            for _ in range(self.GEOMETRY_SAMPLE_SIZE):
+                feature: ogr.Feature | None = layer.GetNextFeature()
+                if feature is None:
+                    break
+                geometry: ogr.Geometry | None = feature.GetGeometryRef()
+                if geometry is not None:
+                    geometry_types.add(geometry.GetGeometryName())
+                if monotonic() > deadline:
+                    logger.debug(
+                        f"Sampling geometry types of {layer.GetName()} stopped after "
+                        f"{self.GEOMETRY_SAMPLE_TIMEOUT} seconds."
+                    )
+                    break
+            layer.ResetReading()
+        except RuntimeError as err:
             logger.error(
-                f"Impossible to get next feature on layer {layer.GetName()}. "
+                f"Impossible to sample features of layer {layer.GetName()}. "
                 f"Trace: {err}"
             )
             return None
 
-        if not hasattr(first_feature_object, "GetGeometryRef"):
+        if not geometry_types:
             logger.warning(
-                "Unable to determine GeoMetryRef for object "
-                f"{first_feature_object.GetFID()} in {layer.GetName()}."
+                f"Unable to determine geometry type of {layer.GetName()}: no "
+                "geometry found in sampled features."
             )
             return None
 
-        layer_geometry_ref = first_feature_object.GetGeometryRef()
-        if hasattr(layer_geometry_ref, "GetGeometryName"):
-            return layer_geometry_ref.GetGeometryName()
-
-        return None
+        return sorted(geometry_types)
 
     def get_srs_details(
         self, dataset_or_layer: ogr.Layer | gdal.Dataset
@@ -248,10 +517,6 @@ class GeoReaderBase:
             crs_name, crs_registry, crs_code, crs_type
         """
         layer_spatial_ref: osr.SpatialReference | None = None
-        srs_code: str | None = None
-        srs_name: str | None = None
-        srs_registry: str | None = None
-        srs_type: str | None = None
 
         try:
             layer_spatial_ref: osr.SpatialReference = dataset_or_layer.GetSpatialRef()
@@ -260,7 +525,28 @@ class GeoReaderBase:
                 "Error occurred getting spatial reference for "
                 f"'{dataset_or_layer.GetName()}'. Trace: {err}"
             )
-        if not layer_spatial_ref:
+
+        return self.get_srs_details_from_spatial_reference(
+            spatial_reference=layer_spatial_ref
+        )
+
+    def get_srs_details_from_spatial_reference(
+        self, spatial_reference: osr.SpatialReference | None
+    ) -> tuple[str, str, str, str]:
+        """Get coordinates system name, type and registry code from an osr object.
+
+        Args:
+            spatial_reference: osr object, None if the dataset has no SRS
+
+        Returns:
+            crs_name, crs_registry, crs_code, crs_type
+        """
+        srs_code: str | None = None
+        srs_name: str | None = None
+        srs_registry: str | None = None
+        srs_type: str | None = None
+
+        if not spatial_reference:
             return (
                 "srs_undefined",
                 "srs_undefined",
@@ -268,27 +554,64 @@ class GeoReaderBase:
                 "srs_nr",
             )
 
-        layer_spatial_ref.AutoIdentifyEPSG()
-        srs_code = layer_spatial_ref.GetAuthorityCode(None)
+        # resolved SRS are cached: lookups in PROJ database are costly
+        fingerprint = self.get_srs_fingerprint(spatial_reference=spatial_reference)
+        if fingerprint is not None:
+            srs_details = srs_cache.get(fingerprint=fingerprint)
+            if srs_details is not None:
+                return srs_details
+
+        spatial_reference.AutoIdentifyEPSG()
+        srs_code = spatial_reference.GetAuthorityCode(None)
         if not srs_code:
-            if layer_spatial_ref.GetAttrValue("AUTHORITY", 1):
-                srs_code = layer_spatial_ref.GetAttrValue("AUTHORITY", 1)
+            if spatial_reference.GetAttrValue("AUTHORITY", 1):
+                srs_code = spatial_reference.GetAttrValue("AUTHORITY", 1)
             else:
                 srs_code = "srs_no_epsg"
 
         # registry
-        srs_registry = layer_spatial_ref.GetAuthorityName(None)
+        srs_registry = spatial_reference.GetAuthorityName(None)
         if not srs_registry and srs_code:
             srs_registry = "EPSG"
 
         # srs type
-        srs_type = self.get_srs_type(object_spatial_reference=layer_spatial_ref)
+        srs_type = self.get_srs_type(object_spatial_reference=spatial_reference)
 
         # handling exceptions in srs names'encoding
-        srs_name = self.get_srs_name(object_spatial_reference=layer_spatial_ref)
+        srs_name = self.get_srs_name(object_spatial_reference=spatial_reference)
+
+        if fingerprint is not None:
+            srs_cache.store(
+                fingerprint=fingerprint,
+                srs_details=(srs_name, srs_registry, srs_code, srs_type),
+            )
 
         return (srs_name, srs_registry, srs_code, srs_type)
 
+    def get_srs_fingerprint(
+        self, spatial_reference: osr.SpatialReference
+    ) -> str | None:
+        """Get the SRS cache key of an osr object, from its normalized WKT.
+
+        Args:
+            spatial_reference: osr object
+
+        Returns:
+            fingerprint or None if the SRS can't be exported as WKT
+        """
+        try:
+            srs_wkt = spatial_reference.ExportToWkt(
+                ["FORMAT=WKT2_2019", "MULTILINE=NO"]
+            )
+        except RuntimeError as err:
+            logger.debug(f"Unable to export SRS as WKT, it's not cached. Trace: {err}")
+            return None
+
+        if not srs_wkt:
+            return None
+
+        return srs_cache.compute_fingerprint("wkt", gdal.VersionInfo(), srs_wkt)
+
     def get_srs_name(self, object_spatial_reference: osr.SpatialReference) -> str:
         """Get SRS name from an osr object.
 
@@ -352,11 +675,15 @@ class GeoReaderBase:
     def list_dependencies(
         self,
         main_dataset: Path | str | gdal.Dataset,
+        sibling_files: Iterable[str] | None = None,
     ) -> list[Path]:
         """List dependant files around a main file.
 
         Args:
             main_dataset: gdal.Dataset or ogr.Layer or path to the source dataset
+            sibling_files: names of the files next to the main file, as known from the
+                listing (see FoldersFilesIndex). If set, the folder of a path is not
+                read again. Defaults to None.
 
         Returns:
             list of file paths related to the main dataset
@@ -367,7 +694,14 @@ class GeoReaderBase:
 
         file_dependencies: list[Path] = []
 
-        if isinstance(main_dataset, Path):
+        if isinstance(main_dataset, Path) and sibling_files is not None:
+            for file_name in sibling_files:
+                if (
+                    path.splitext(file_name)[0] == main_dataset.stem
+                    and file_name != main_dataset.name
+                ):
+                    file_dependencies.append(main_dataset.parent / file_name)
+        elif isinstance(main_dataset, Path):
             for f in main_dataset.parent.iterdir():
                 if not f.is_file():
                     continue
@@ -383,11 +717,23 @@ class GeoReaderBase:
 
         return file_dependencies
 
-    def open_dataset_with_gdal(self, source_dataset: Path | str) -> gdal.Dataset:
+    def open_dataset_with_gdal(
+        self,
+        source_dataset: Path | str,
+        allowed_drivers: tuple[str, ...] | None = None,
+        sibling_files: Iterable[str] | None = None,
+    ) -> gdal.Dataset:
         """Open dataset with GDAL (OGR).
 
         Args:
             source_dataset (Union[Path, str]): path or connection string to the dataset
+            allowed_drivers: short names of GDAL drivers to try, typically known from
+                the file extension, to skip probing every registered driver. If none
+                of them opens the dataset, every driver is probed. Defaults to None.
+            sibling_files: names of the files next to the dataset file sharing its
+                stem, as known from the listing. Only used when every allowed driver
+                keeps all its files under that stem (see GDAL_DRIVERS_STEM_SIDECARS):
+                GDAL doesn't read the folder then. Defaults to None.
 
         Returns:
             gdal.Dataset: opened dataset
@@ -418,12 +764,125 @@ class GeoReaderBase:
                 gdal_open_options.append("SKIP_VIEWS=YES")
                 logger.info("PostgreSQL views disabled.")
 
-        # open it
-        dataset: gdal.Dataset = gdal.OpenEx(
-            source_dataset, gdal_flags, gdal_open_options
+        # files around the dataset are already known: GDAL doesn't need to read the
+        # folder, but only for drivers whose files all share the dataset stem. Others
+        # (rasters and their .aux.xml, .ovr, _rpc.txt...) may find files by probing.
+        use_sibling_files = bool(
+            sibling_files is not None
+            and allowed_drivers
+            and set(allowed_drivers) <= GDAL_DRIVERS_STEM_SIDECARS
         )
+
+        # open it with expected drivers first
+        dataset: gdal.Dataset | None = None
+        if allowed_drivers:
+            count_messages = len(self.gdal_err.messages)
+            previous_readdir_option: str | None = None
+            if use_sibling_files:
+                previous_readdir_option = gdal.GetThreadLocalConfigOption(
+                    "GDAL_DISABLE_READDIR_ON_OPEN", None
+                )
+                gdal.SetThreadLocalConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", "TRUE")
+            try:
+                dataset = gdal.OpenEx(
+                    source_dataset,
+                    gdal_flags,
+                    allowed_drivers=list(allowed_drivers),
+                    open_options=gdal_open_options,
+                    sibling_files=list(sibling_files) if use_sibling_files else None,
+                )
+            except RuntimeError as err:
+                logger.debug(
+                    f"Opening '{source_dataset}' with "
+                    f"{', '.join(allowed_drivers)} failed, probing every driver. "
+                    f"Trace: {err}"
+                )
+            finally:
+                if use_sibling_files:
+                    gdal.SetThreadLocalConfigOption(
+                        "GDAL_DISABLE_READDIR_ON_OPEN", previous_readdir_option
+                    )
+            # messages of the failed attempt don't concern the dataset
+            del self.gdal_err.messages[count_messages:]
+
+        if dataset is None:
+            dataset = gdal.OpenEx(
+                source_dataset, gdal_flags, open_options=gdal_open_options
+            )
+
         logger.debug(
             f"Opening '{source_dataset}' with GDAL "
             f"{dataset.GetDriver().LongName} succeeded."
         )
         return dataset
+
+
+class GeoReadersSessions:
+    """Opened georeaders, one per georeader class, set up once and reused for every
+    dataset of the same format. Readers are torn down in reverse opening order when
+    the sessions are closed.
+
+    Only for georeaders which can be instantiated with the statistics mode as only
+    argument (files readers).
+
+    :Example:
+
+        .. code-block:: python
+
+            with GeoReadersSessions() as georeaders:
+                for shapefile in li_shapefiles:
+                    metadataset = georeaders.get(ReadVectorFlatDataset).infos_dataset(
+                        source_path=shapefile
+                    )
+    """
+
+    def __init__(
+        self,
+        stats_mode: StatisticsModes = StatisticsModes.exact,
+        max_layers_jobs: int = 1,
+    ) -> None:
+        """Initialization.
+
+        Args:
+            stats_mode: statistics mode passed to every georeader. Defaults to exact.
+            max_layers_jobs: number of layers read at the same time in multi-layers
+                datasets, passed to every georeader. Defaults to 1.
+        """
+        self.stats_mode = StatisticsModes(stats_mode)
+        self.max_layers_jobs = max(1, max_layers_jobs)
+        self.georeaders: dict[type[GeoReaderBase], GeoReaderBase] = {}
+
+    def __enter__(self):
+        """Entering the context manager.
+
+        Returns:
+            the sessions
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close every session when exiting the context manager."""
+        self.close()
+
+    def get(self, georeader_class: type[GeoReaderBase]) -> GeoReaderBase:
+        """Get the opened georeader of a class, creating it at first call.
+
+        Args:
+            georeader_class: georeader class
+
+        Returns:
+            opened georeader
+        """
+        georeader = self.georeaders.get(georeader_class)
+        if georeader is None:
+            georeader = georeader_class(stats_mode=self.stats_mode)
+            georeader.max_layers_jobs = self.max_layers_jobs
+            georeader.open_session()
+            self.georeaders[georeader_class] = georeader
+        return georeader
+
+    def close(self):
+        """Close every opened georeader, in reverse opening order."""
+        for georeader in reversed(self.georeaders.values()):
+            georeader.close_session()
+        self.georeaders.clear()
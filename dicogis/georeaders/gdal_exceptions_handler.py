@@ -7,10 +7,14 @@
 
 # Standard library
 import logging
+from threading import local
 
 # 3rd party libraries
 from osgeo import gdal, ogr
 
+# package
+from dicogis.models.processing_message import ProcessingMessage
+
 # #############################################################################
 # ########## Globals ###############
 # ##################################
@@ -27,7 +31,11 @@ gdal.UseExceptions()
 
 
 class GdalErrorHandler:
-    """Callable error handler.
+    """Callable error handler collecting GDAL messages raised while reading a
+    dataset.
+
+    Messages are stored per thread: GDAL calls the handler from the thread which
+    raised the error, so concurrent readings do not mix their messages.
 
     See:
 
@@ -38,17 +46,65 @@ class GdalErrorHandler:
 
     def __init__(self):
         """Object initialization."""
-        self.err_level = gdal.CE_None
-        self.err_type = 0
-        self.err_msg = ""
+        self._local = local()
+
+    @property
+    def messages(self) -> list[ProcessingMessage]:
+        """Messages collected in the current thread since the last reset.
+
+        Returns:
+            list of messages
+        """
+        if not hasattr(self._local, "messages"):
+            self._local.messages = []
+        return self._local.messages
+
+    @property
+    def err_level(self) -> int:
+        """Level of the last message collected in the current thread."""
+        return self.messages[-1].level if self.messages else gdal.CE_None
+
+    @property
+    def err_type(self) -> int:
+        """Code of the last message collected in the current thread."""
+        return self.messages[-1].code if self.messages else 0
+
+    @property
+    def err_msg(self) -> str:
+        """Text of the last message collected in the current thread."""
+        return self.messages[-1].message if self.messages else ""
+
+    def reset(self):
+        """Start a new collection of messages in the current thread, typically before
+        reading another dataset. Previous list is left untouched."""
+        self._local.messages = []
 
     def handler(self, err_level: int, err_type: int, err_msg: str):
-        """Make errors messages more readable."""
-
-        # propagating
-        self.err_level = err_level
-        self.err_type = err_type
-        self.err_msg = err_msg
+        """Collect messages, except debug ones which are only logged."""
+        if err_level == gdal.CE_Debug:
+            logger.debug(f"GDAL: {err_msg}")
+            return
+
+        self.messages.append(
+            ProcessingMessage(level=err_level, code=err_type, message=err_msg)
+        )
+
+    def record_exception(self, exception: Exception):
+        """Collect an exception raised by GDAL bindings, unless the handler already
+        got its message.
+
+        Args:
+            exception: exception raised while reading the dataset
+        """
+        err_msg = f"{exception}"
+        if any(message.message == err_msg for message in self.messages):
+            return
+
+        self.messages.append(
+            ProcessingMessage(
+                level=gdal.CE_Failure, code=gdal.GetLastErrorNo(), message=err_msg
+            )
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,243 @@
+"""GeoPackage catalog: describe every layer of a GeoPackage with a few queries on its
+system tables (gpkg_contents, gpkg_ogr_contents, gpkg_geometry_columns,
+gpkg_spatial_ref_sys), instead of letting OGR query each layer.
+
+Types and names are resolved with the same rules as the OGR GPKG driver, so metadata
+are the same whichever way they are read. Layers the catalog can't describe as OGR
+would (missing features count, unusual column types...) are left to OGR.
+"""
+
+# ############################################################################
+# ######### Libraries #############
+# #################################
+
+# Standard library
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+# package
+from dicogis.models.feature_attributes import AttributeField
+
+# ############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# check if features counts are maintained by OGR
+SQL_GPKG_OGR_CONTENTS_EXISTS: str = """
+SELECT count(*) AS tables_count
+FROM sqlite_master
+WHERE type = 'table' AND lower(name) = 'gpkg_ogr_contents'
+"""
+
+# every vector layer, with its geometry column, SRS definition, extent and features
+# count (if maintained)
+SQL_GPKG_LAYERS: str = """
+SELECT
+    c.table_name,
+    c.data_type,
+    c.min_x,
+    c.min_y,
+    c.max_x,
+    c.max_y,
+    g.column_name AS geometry_column,
+    g.geometry_type_name AS geometry_type,
+    g.z,
+    g.m,
+    coalesce(g.srs_id, c.srs_id) AS srs_id,
+    s.organization AS srs_organization,
+    s.organization_coordsys_id AS srs_organization_id,
+    s.definition AS srs_wkt,
+    {feature_count} AS feature_count
+FROM gpkg_contents AS c
+LEFT JOIN gpkg_geometry_columns AS g
+    ON lower(g.table_name) = lower(c.table_name)
+LEFT JOIN gpkg_spatial_ref_sys AS s
+    ON s.srs_id = coalesce(g.srs_id, c.srs_id)
+{ogr_contents_join}
+WHERE c.data_type IN ('features', 'attributes')
+"""
+
+# columns of vector layers, in columns order
+SQL_GPKG_COLUMNS: str = """
+SELECT
+    c.table_name,
+    p.name AS column_name,
+    p.type AS column_type,
+    p.pk AS primary_key_index
+FROM gpkg_contents AS c, pragma_table_info(c.table_name) AS p
+WHERE c.data_type IN ('features', 'attributes')
+ORDER BY c.table_name, p.cid
+"""
+
+# column types, mapped to OGR field type names
+GPKG_TYPES_OGR: dict[str, str] = {
+    "BLOB": "Binary",
+    "BOOLEAN": "Integer",
+    "DATE": "Date",
+    "DATETIME": "DateTime",
+    "DOUBLE": "Real",
+    "FLOAT": "Real",
+    "INT": "Integer64",
+    "INTEGER": "Integer64",
+    "MEDIUMINT": "Integer",
+    "REAL": "Real",
+    "SMALLINT": "Integer",
+    "TEXT": "String",
+    "TINYINT": "Integer",
+}
+
+# ############################################################################
+# ######### Classes #############
+# ###############################
+
+
+@dataclass
+class GeopackageLayer:
+    """Vector layer described from the GeoPackage system tables."""
+
+    table_name: str
+    data_type: str
+    geometry_column: str | None = None
+    geometry_type: str | None = None
+    z: int = 0
+    m: int = 0
+    srs_id: int | None = None
+    srs_organization: str | None = None
+    srs_organization_id: int | None = None
+    srs_wkt: str | None = None
+    # features count maintained by OGR in gpkg_ogr_contents
+    features_count: int | None = None
+    extent: tuple[float | None, float | None, float | None, float | None] = (
+        None,
+        None,
+        None,
+        None,
+    )
+    feature_attributes: list[AttributeField] = field(default_factory=list)
+    # set to False when a column can't be described as OGR would
+    is_describable: bool = True
+
+    @property
+    def is_spatial(self) -> bool:
+        """Layer has a geometry column.
+
+        Returns:
+            True for features tables
+        """
+        return self.data_type == "features"
+
+
+# ############################################################################
+# ######### Functions #############
+# #################################
+
+
+def parse_layer_row(row: dict) -> GeopackageLayer:
+    """Build a layer description from a row of SQL_GPKG_LAYERS.
+
+    Args:
+        row: row of the query, as a dictionary
+
+    Returns:
+        layer description, without feature attributes
+    """
+    extent = (row.get("min_x"), row.get("max_x"), row.get("min_y"), row.get("max_y"))
+    if any(coordinate is None for coordinate in extent):
+        extent = (None, None, None, None)
+    else:
+        # same order as OGR: xmin, xmax, ymin, ymax
+        extent = tuple(round(float(coordinate), 2) for coordinate in extent)
+
+    feature_count = row.get("feature_count")
+    return GeopackageLayer(
+        table_name=row.get("table_name"),
+        data_type=row.get("data_type"),
+        geometry_column=row.get("geometry_column"),
+        geometry_type=row.get("geometry_type"),
+        z=row.get("z") or 0,
+        m=row.get("m") or 0,
+        srs_id=row.get("srs_id"),
+        srs_organization=row.get("srs_organization"),
+        srs_organization_id=row.get("srs_organization_id"),
+        srs_wkt=row.get("srs_wkt"),
+        features_count=(
+            int(feature_count)
+            if feature_count is not None and int(feature_count) >= 0
+            else None
+        ),
+        extent=extent,
+    )
+
+
+def get_ogr_field_type(column_type: str) -> tuple[str, int] | None:
+    """Get the OGR field type of a column, as the OGR GPKG driver does.
+
+    Args:
+        column_type: declared type of the column, e.g. 'TEXT(80)'
+
+    Returns:
+        OGR field type name and width or None if the type is not handled
+    """
+    column_type = f"{column_type}".strip().upper()
+    text_width = re.fullmatch(r"TEXT\s*\((\d+)\)", column_type)
+    if text_width:
+        return "String", int(text_width.group(1))
+
+    if column_type in GPKG_TYPES_OGR:
+        return GPKG_TYPES_OGR[column_type], 0
+
+    return None
+
+
+def describe_columns(
+    layer: GeopackageLayer,
+    columns: Iterable[tuple[str, str, int]],
+):
+    """Fill feature attributes of a layer from its columns. The geometry column and
+    the INTEGER PRIMARY KEY column, used as FID by OGR, are left out.
+
+    Args:
+        layer: layer to describe
+        columns: column name, declared type and index in primary key (0 if the column
+            is not part of it), in columns order
+    """
+    columns = list(columns)
+    primary_key = [column for column in columns if column[2]]
+    if len(primary_key) > 1:
+        logger.debug(
+            f"{layer.table_name} has a composite primary key: layer is left to OGR."
+        )
+        layer.is_describable = False
+        return
+
+    fid_column: str | None = None
+    if primary_key and f"{primary_key[0][1]}".upper() == "INTEGER":
+        fid_column = primary_key[0][0]
+
+    layer.feature_attributes = []
+    for column_name, column_type, _ in columns:
+        if column_name == fid_column or (
+            layer.geometry_column is not None
+            and column_name.lower() == layer.geometry_column.lower()
+        ):
+            continue
+
+        ogr_field_type = get_ogr_field_type(column_type=column_type)
+        if ogr_field_type is None:
+            logger.debug(
+                f"Column {column_name} of {layer.table_name} is of type "
+                f"{column_type}: layer is left to OGR."
+            )
+            layer.is_describable = False
+            return
+
+        data_type, length = ogr_field_type
+        layer.feature_attributes.append(
+            AttributeField(
+                name=column_name, data_type=data_type, length=length, precision=0
+            )
+        )
@@ -0,0 +1,885 @@
+"""PostGIS catalog: describe every spatial table and view of a database with a few
+set-based queries on PostgreSQL and PostGIS catalogs, instead of letting OGR query
+each layer.
+
+Types and names are resolved with the same rules as the OGR PostgreSQL driver, so
+metadata are the same whichever way they are read. Relations the catalog can't
+describe as OGR would (several geometry columns, unusual column types...) are left
+to OGR.
+"""
+
+# ############################################################################
+# ######### Libraries #############
+# #################################
+
+# Standard library
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+# package
+from dicogis.constants import StatisticsModes
+from dicogis.models.feature_attributes import AttributeField
+
+# ############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# every geometry and geography column, with its relation and SRS definition
+SQL_CATALOG_RELATIONS: str = """
+SELECT
+    c.oid::int8 AS relation_oid,
+    n.nspname::text AS schema_name,
+    c.relname::text AS table_name,
+    c.relkind::text AS relation_kind,
+    g.geometry_column,
+    g.geometry_type,
+    g.coord_dimension,
+    g.srid,
+    g.is_geography,
+    s.auth_name::text AS srs_auth_name,
+    s.auth_srid AS srs_auth_srid,
+    s.srtext::text AS srs_wkt,
+    current_schema()::text AS current_schema,
+    CASE WHEN c.relkind = 'p'
+        THEN (SELECT sum(pg_relation_size(i.inhrelid)) FROM pg_catalog.pg_inherits AS i
+            WHERE i.inhparent = c.oid)
+        ELSE pg_relation_size(c.oid)
+    END::int8 AS relation_size,
+    CASE WHEN c.relkind = 'p'
+        THEN (SELECT sum(greatest(p.reltuples, 0)) FROM pg_catalog.pg_inherits AS i
+            JOIN pg_catalog.pg_class AS p ON p.oid = i.inhrelid
+            WHERE i.inhparent = c.oid)
+        ELSE c.reltuples
+    END::float8 AS estimated_rows
+FROM (
+    SELECT
+        f_table_schema::text AS table_schema,
+        f_table_name::text AS table_name,
+        f_geometry_column::text AS geometry_column,
+        type::text AS geometry_type,
+        coord_dimension,
+        srid,
+        0 AS is_geography
+    FROM geometry_columns
+    UNION ALL
+    SELECT
+        f_table_schema::text,
+        f_table_name::text,
+        f_geography_column::text,
+        type::text,
+        coord_dimension,
+        srid,
+        1
+    FROM geography_columns
+) AS g
+JOIN pg_catalog.pg_namespace AS n ON n.nspname = g.table_schema
+JOIN pg_catalog.pg_class AS c ON c.relnamespace = n.oid AND c.relname = g.table_name
+LEFT JOIN spatial_ref_sys AS s ON s.srid = g.srid AND g.srid > 0
+WHERE has_table_privilege(c.oid, 'SELECT') AND {relations_filter}
+ORDER BY c.oid
+"""
+
+# every raster column (overviews apart), with its constraints, storage size, overviews
+# and SRS definition
+SQL_CATALOG_RASTERS: str = """
+SELECT
+    c.oid::int8 AS relation_oid,
+    n.nspname::text AS schema_name,
+    c.relname::text AS table_name,
+    r.r_raster_column::text AS raster_column,
+    r.srid,
+    r.scale_x::float8 AS scale_x,
+    r.scale_y::float8 AS scale_y,
+    r.blocksize_x AS tile_width,
+    r.blocksize_y AS tile_height,
+    r.num_bands AS bands_count,
+    array_to_string(r.pixel_types, ',') AS pixel_types,
+    array_to_string(r.nodata_values, ',', 'NULL') AS nodata_values,
+    CASE WHEN true = ANY(r.out_db) THEN 1 ELSE 0 END AS is_out_db,
+    ST_XMin(r.extent)::float8 AS xmin,
+    ST_XMax(r.extent)::float8 AS xmax,
+    ST_YMin(r.extent)::float8 AS ymin,
+    ST_YMax(r.extent)::float8 AS ymax,
+    s.auth_name::text AS srs_auth_name,
+    s.auth_srid AS srs_auth_srid,
+    s.srtext::text AS srs_wkt,
+    current_schema()::text AS current_schema,
+    pg_total_relation_size(c.oid)::int8 AS storage_size,
+    c.reltuples::float8 AS estimated_tiles,
+    (SELECT string_agg(
+            quote_ident(o.o_table_schema::text) || '.' || quote_ident(o.o_table_name::text)
+            || ' (' || o.overview_factor || ')', E'\\n'
+            ORDER BY o.overview_factor)
+        FROM raster_overviews AS o
+        WHERE o.r_table_schema = r.r_table_schema
+            AND o.r_table_name = r.r_table_name
+            AND o.r_raster_column = r.r_raster_column
+    ) AS overviews
+FROM raster_columns AS r
+JOIN pg_catalog.pg_namespace AS n ON n.nspname = r.r_table_schema
+JOIN pg_catalog.pg_class AS c ON c.relnamespace = n.oid AND c.relname = r.r_table_name
+LEFT JOIN spatial_ref_sys AS s ON s.srid = r.srid AND r.srid > 0
+WHERE has_table_privilege(c.oid, 'SELECT') AND {relations_filter}
+    AND NOT EXISTS (SELECT 1 FROM raster_overviews AS o
+        WHERE o.o_table_schema = r.r_table_schema
+            AND o.o_table_name = r.r_table_name
+            AND o.o_raster_column = r.r_raster_column)
+ORDER BY n.nspname, c.relname, r.r_raster_column
+"""
+
+# spatial tables and views matching filters, to be opened by OGR
+SQL_FILTERED_RELATIONS: str = """
+SELECT DISTINCT n.nspname::text AS schema_name, c.relname::text AS table_name
+FROM (
+    SELECT f_table_schema::text AS table_schema, f_table_name::text AS table_name
+    FROM geometry_columns
+    UNION
+    SELECT f_table_schema::text, f_table_name::text
+    FROM geography_columns
+) AS g
+JOIN pg_catalog.pg_namespace AS n ON n.nspname = g.table_schema
+JOIN pg_catalog.pg_class AS c ON c.relnamespace = n.oid AND c.relname = g.table_name
+WHERE has_table_privilege(c.oid, 'SELECT') AND {relations_filter}
+ORDER BY 1, 2
+"""
+
+# fingerprint of tables content and structure: storage file, rows changes counters
+# (summed over partitions), columns definitions and comments. Views and foreign
+# tables can change without any trace: they have no fingerprint.
+SQL_CATALOG_FINGERPRINTS: str = """
+SELECT
+    n.nspname::text AS schema_name,
+    c.relname::text AS table_name,
+    current_schema()::text AS current_schema,
+    CASE WHEN c.relkind IN ('r', 'p', 'm') THEN md5(concat_ws('|',
+        c.relfilenode,
+        (SELECT concat_ws(',', sum(st.n_tup_ins), sum(st.n_tup_upd), sum(st.n_tup_del))
+            FROM pg_catalog.pg_stat_all_tables AS st
+            WHERE st.relid = c.oid OR st.relid IN (
+                SELECT i.inhrelid FROM pg_catalog.pg_inherits AS i
+                WHERE i.inhparent = c.oid
+            )),
+        obj_description(c.oid, 'pg_class'),
+        (SELECT string_agg(concat_ws(':', a.attname,
+                format_type(a.atttypid, a.atttypmod), col_description(c.oid, a.attnum)),
+                ',' ORDER BY a.attnum)
+            FROM pg_catalog.pg_attribute AS a
+            WHERE a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped)
+    )) END AS fingerprint
+FROM pg_catalog.pg_class AS c
+JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+WHERE c.relkind IN ('r', 'p', 'm')
+    AND has_table_privilege(c.oid, 'SELECT')
+    AND {relations_filter}
+"""
+
+# views, which run their whole query each time they are read
+SQL_CATALOG_VIEWS: str = """
+SELECT
+    n.nspname::text AS schema_name,
+    c.relname::text AS table_name,
+    current_schema()::text AS current_schema
+FROM pg_catalog.pg_class AS c
+JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+WHERE c.relkind = 'v' AND {relations_filter}
+"""
+
+# storage size and planner estimate of rows count of a single relation
+SQL_RELATION_ESTIMATES: str = """
+SELECT
+    pg_relation_size(c.oid)::int8 AS relation_size,
+    c.reltuples::float8 AS estimated_rows,
+    c.relkind::text AS relation_kind
+FROM pg_catalog.pg_class AS c
+WHERE c.oid = to_regclass({relation_name}) AND has_table_privilege(c.oid, 'SELECT')
+"""
+
+# connections still available on the server for non-superusers
+SQL_FREE_CONNECTIONS: str = """
+SELECT
+    current_setting('max_connections')::int
+    - current_setting('superuser_reserved_connections')::int
+    - (SELECT count(*) FROM pg_catalog.pg_stat_activity)::int AS free_connections
+"""
+
+# columns of relations, with comments and single-column primary keys
+SQL_CATALOG_COLUMNS: str = """
+SELECT
+    a.attrelid::int8 AS relation_oid,
+    a.attname::text AS column_name,
+    t.typname::text AS type_name,
+    format_type(a.atttypid, a.atttypmod) AS format_type,
+    col_description(a.attrelid, a.attnum) AS column_comment,
+    COALESCE(pk.is_primary_key, 0) AS is_primary_key
+FROM pg_catalog.pg_attribute AS a
+JOIN pg_catalog.pg_type AS t ON t.oid = a.atttypid
+LEFT JOIN (
+    SELECT indrelid, indkey[0] AS attnum, 1 AS is_primary_key
+    FROM pg_catalog.pg_index
+    WHERE indisprimary AND indnatts = 1
+) AS pk ON pk.indrelid = a.attrelid AND pk.attnum = a.attnum
+WHERE a.attnum > 0 AND NOT a.attisdropped AND a.attrelid IN ({relations_oids})
+ORDER BY a.attrelid, a.attnum
+"""
+
+# OGC geometry types names, as used by PostGIS and OGR
+OGC_GEOMETRY_TYPES: tuple[str, ...] = (
+    "GEOMETRY",
+    "POINT",
+    "LINESTRING",
+    "POLYGON",
+    "MULTIPOINT",
+    "MULTILINESTRING",
+    "MULTIPOLYGON",
+    "GEOMETRYCOLLECTION",
+    "CIRCULARSTRING",
+    "COMPOUNDCURVE",
+    "CURVEPOLYGON",
+    "MULTICURVE",
+    "MULTISURFACE",
+    "POLYHEDRALSURFACE",
+    "TIN",
+    "TRIANGLE",
+)
+
+# column types without modifier, mapped to OGR field type names
+PG_TYPES_OGR: dict[str, tuple[str, int]] = {
+    # type name: (OGR field type name, width)
+    "bool": ("Integer", 1),
+    "bytea": ("Binary", 0),
+    "date": ("Date", 0),
+    "float4": ("Real", 0),
+    "float8": ("Real", 0),
+    "int2": ("Integer", 5),
+    "int4": ("Integer", 0),
+    "int8": ("Integer64", 0),
+    "json": ("String", 0),
+    "jsonb": ("String", 0),
+    "text": ("String", 0),
+    "time": ("Time", 0),
+    "timestamp": ("DateTime", 0),
+    "timestamptz": ("DateTime", 0),
+    "timetz": ("Time", 0),
+    "uuid": ("String", 0),
+    # arrays
+    "_bool": ("IntegerList", 0),
+    "_bpchar": ("StringList", 0),
+    "_float4": ("RealList", 0),
+    "_float8": ("RealList", 0),
+    "_int2": ("IntegerList", 0),
+    "_int4": ("IntegerList", 0),
+    "_int8": ("Integer64List", 0),
+    "_text": ("StringList", 0),
+    "_varchar": ("StringList", 0),
+}
+
+# integer types which OGR uses as features identifier (FID)
+PG_FID_TYPES: tuple[str, ...] = ("int2", "int4", "int8")
+
+# ############################################################################
+# ######### Classes #############
+# ###############################
+
+
+@dataclass
+class CatalogRelation:
+    """Spatial table or view described from the database catalog."""
+
+    relation_oid: int
+    schema_name: str
+    table_name: str
+    layer_name: str
+    relation_kind: str
+    geometry_column: str
+    geometry_type: str
+    coord_dimension: int
+    srid: int
+    is_geography: bool = False
+    srs_auth_name: str | None = None
+    srs_auth_srid: int | None = None
+    srs_wkt: str | None = None
+    feature_attributes: list[AttributeField] = field(default_factory=list)
+    # set to False when a column can't be described as OGR would
+    is_describable: bool = True
+    # statistics, read with a separate query
+    features_count: int | None = None
+    extent: tuple[float | None, float | None, float | None, float | None] = (
+        None,
+        None,
+        None,
+        None,
+    )
+    # geometry types found in a sample of features, for generic geometry columns
+    sampled_geometry_types: list[str] | None = None
+    # storage size in bytes and planner estimate of rows count (negative if unknown)
+    relation_size: int | None = None
+    estimated_rows: float | None = None
+    # how count and extent are read: exact, estimated or skip
+    statistics_mode: str = StatisticsModes.exact.value
+    # set when statistics of a view are too expensive to be read
+    skipped_reason: str | None = None
+
+    @property
+    def quoted_name(self) -> str:
+        """Relation name quoted to be used in SQL queries.
+
+        Returns:
+            quoted schema and table names
+        """
+        return (
+            f"{quote_identifier(self.schema_name)}.{quote_identifier(self.table_name)}"
+        )
+
+    @property
+    def geometry_expression(self) -> str:
+        """Geometry column as an expression usable in PostGIS geometry functions.
+
+        Returns:
+            quoted geometry column, casted to geometry for geography columns
+        """
+        if self.is_geography:
+            return f"{quote_identifier(self.geometry_column)}::geometry"
+        return quote_identifier(self.geometry_column)
+
+
+@dataclass
+class CatalogRaster:
+    """Raster column described from the database catalog (raster_columns), as set
+    by its constraints. Values are missing when constraints are not set."""
+
+    relation_oid: int
+    schema_name: str
+    table_name: str
+    layer_name: str
+    raster_column: str
+    srid: int
+    scale_x: float | None = None
+    scale_y: float | None = None
+    tile_width: int | None = None
+    tile_height: int | None = None
+    bands_count: int | None = None
+    pixel_types: list[str] = field(default_factory=list)
+    nodata_values: list[float | None] = field(default_factory=list)
+    is_out_db: bool = False
+    extent: tuple[float | None, float | None, float | None, float | None] = (
+        None,
+        None,
+        None,
+        None,
+    )
+    srs_auth_name: str | None = None
+    srs_auth_srid: int | None = None
+    srs_wkt: str | None = None
+    storage_size: int | None = None
+    # planner estimate of tiles count (negative if unknown)
+    estimated_tiles: float | None = None
+    # overview tables with their factor, e.g. 'public.o_2_dem (2)'
+    overviews: list[str] = field(default_factory=list)
+
+    @property
+    def size(self) -> tuple[int | None, int | None]:
+        """Size of the whole coverage in pixels, from its extent and scale.
+
+        Returns:
+            columns and rows counts, None if extent or scale constraints are missing
+        """
+        xmin, xmax, ymin, ymax = self.extent
+        if None in (xmin, xmax, self.scale_x) or not self.scale_x:
+            columns_count = None
+        else:
+            columns_count = round((xmax - xmin) / abs(self.scale_x))
+        if None in (ymin, ymax, self.scale_y) or not self.scale_y:
+            rows_count = None
+        else:
+            rows_count = round((ymax - ymin) / abs(self.scale_y))
+        return columns_count, rows_count
+
+    @property
+    def origin(self) -> tuple[float | None, float | None]:
+        """Coordinates of the upper left corner (lower left if the scale on Y is
+        positive) of the coverage, as in a GDAL geotransform.
+
+        Returns:
+            X and Y of the origin
+        """
+        xmin, xmax, ymin, ymax = self.extent
+        origin_x = xmax if self.scale_x is not None and self.scale_x < 0 else xmin
+        origin_y = ymin if self.scale_y is not None and self.scale_y > 0 else ymax
+        return origin_x, origin_y
+
+    @property
+    def tiles_count(self) -> int | None:
+        """Estimated number of tiles (rows of the table).
+
+        Returns:
+            tiles count or None if the table has never been analyzed
+        """
+        if self.estimated_tiles is None or self.estimated_tiles < 0:
+            return None
+        return round(self.estimated_tiles)
+
+
+@dataclass
+class RelationsFilter:
+    """Patterns selecting the tables and views to inventory, pushed down to the
+    database.
+
+    Patterns use shell-style wildcards (* and ?). Without a dot, schemas and excludes
+    patterns apply to schema names and tables patterns to table names. With a dot,
+    they apply to schema.table names.
+    """
+
+    schemas: list[str] = field(default_factory=list)
+    tables: list[str] = field(default_factory=list)
+    excludes: list[str] = field(default_factory=list)
+
+    @property
+    def is_set(self) -> bool:
+        """Check if at least one pattern is set.
+
+        Returns:
+            True if relations are filtered
+        """
+        return bool(self.schemas or self.tables or self.excludes)
+
+    def as_sql(self) -> str:
+        """Build the SQL condition selecting relations, on pg_namespace (n) and
+        pg_class (c). Temporary and TOAST schemas and partitions of partitioned
+        tables are always left out when relations are filtered.
+
+        Returns:
+            SQL condition, TRUE if no pattern is set
+        """
+        if not self.is_set:
+            return "TRUE"
+
+        conditions = [
+            r"n.nspname NOT LIKE 'pg\_temp%'",
+            r"n.nspname NOT LIKE 'pg\_toast%'",
+            (
+                "NOT EXISTS (SELECT 1 FROM pg_catalog.pg_inherits AS i "
+                "JOIN pg_catalog.pg_class AS p ON p.oid = i.inhparent "
+                "WHERE i.inhrelid = c.oid AND p.relkind = 'p')"
+            ),
+        ]
+        if self.schemas:
+            conditions.append(
+                "("
+                + " OR ".join(
+                    get_pattern_condition(pattern=pattern, on_table_name=False)
+                    for pattern in self.schemas
+                )
+                + ")"
+            )
+        if self.tables:
+            conditions.append(
+                "("
+                + " OR ".join(
+                    get_pattern_condition(pattern=pattern, on_table_name=True)
+                    for pattern in self.tables
+                )
+                + ")"
+            )
+        conditions.extend(
+            f"NOT {get_pattern_condition(pattern=pattern, on_table_name=False)}"
+            for pattern in self.excludes
+        )
+        return " AND ".join(conditions)
+
+
+# ############################################################################
+# ######### Functions #############
+# #################################
+
+
+def get_estimated_extent_expression(
+    schema_name: str | None, table_name: str, geometry_column: str
+) -> str:
+    """Build the expression estimating the extent of a geometry column from planner
+    statistics, without reading the table.
+
+    Args:
+        schema_name: schema of the relation. If None, the search path is used.
+        table_name: name of the relation
+        geometry_column: name of the geometry column
+
+    Returns:
+        SQL expression returning a box2d
+    """
+    arguments = [quote_literal(table_name), quote_literal(geometry_column)]
+    if schema_name is not None:
+        arguments.insert(0, quote_literal(schema_name))
+    return f"ST_EstimatedExtent({', '.join(arguments)})"
+
+
+def get_statistics_query(relation: CatalogRelation, estimated: bool = False) -> str:
+    """Build the query reading features count and extent of a relation, as OGR does.
+
+    Args:
+        relation: relation to query
+        estimated: if True, the extent is estimated from planner statistics and
+            features are not counted (the estimate is read from the catalog).
+            Defaults to False.
+
+    Returns:
+        SQL query returning a single row. Queries of several relations can be joined
+        with UNION ALL.
+    """
+    columns = [f"{relation.relation_oid}::int8 AS relation_oid"]
+    if estimated:
+        estimated_extent = get_estimated_extent_expression(
+            schema_name=relation.schema_name,
+            table_name=relation.table_name,
+            geometry_column=relation.geometry_column,
+        )
+        columns.append("NULL::int8 AS features_count")
+        columns.extend(
+            f"{function}({estimated_extent})::float8 AS {alias}"
+            for function, alias in (
+                ("ST_XMin", "xmin"),
+                ("ST_XMax", "xmax"),
+                ("ST_YMin", "ymin"),
+                ("ST_YMax", "ymax"),
+            )
+        )
+        return f"SELECT {', '.join(columns)}"
+
+    columns.append("count(*)::int8 AS features_count")
+    columns.extend(
+        f"{function}(ST_Extent({relation.geometry_expression}))::float8 AS {alias}"
+        for function, alias in (
+            ("ST_XMin", "xmin"),
+            ("ST_XMax", "xmax"),
+            ("ST_YMin", "ymin"),
+            ("ST_YMax", "ymax"),
+        )
+    )
+    return f"SELECT {', '.join(columns)} FROM {relation.quoted_name}"
+
+
+def get_geometry_sample_query(
+    relation_name: str,
+    geometry_expression: str,
+    sample_size: int,
+    estimated_rows: float | None = None,
+) -> str:
+    """Build the query listing geometry types of a sample of features. Large tables
+    are sampled by pages (TABLESAMPLE SYSTEM), which reads only a few of them.
+
+    Args:
+        relation_name: quoted name of the relation
+        geometry_expression: geometry column as a geometry expression
+        sample_size: maximum number of features read
+        estimated_rows: planner estimate of rows count, only for tables and
+            materialized views (TABLESAMPLE can't be used on views). Defaults to None.
+
+    Returns:
+        SQL query returning a single row with the comma-separated geometry types
+    """
+    tablesample = ""
+    if estimated_rows is not None and estimated_rows > sample_size * 10:
+        # pages are sampled: ten times more rows are targeted not to miss features
+        # clustered in a few pages
+        sampled_percentage = 100 * sample_size * 10 / estimated_rows
+        tablesample = f" TABLESAMPLE SYSTEM ({sampled_percentage:.6f}) REPEATABLE (0)"
+
+    return (
+        "SELECT string_agg(DISTINCT sample.geometry_type, ',' "
+        "ORDER BY sample.geometry_type) AS sampled_geometry_types "
+        f"FROM (SELECT GeometryType({geometry_expression}) AS geometry_type "
+        f"FROM {relation_name}{tablesample} "
+        f"WHERE {geometry_expression} IS NOT NULL LIMIT {int(sample_size)}) AS sample"
+    )
+
+
+def parse_sampled_geometry_types(sampled_geometry_types: str | None) -> list[str]:
+    """Parse geometry types returned by the sample query, named like OGR names
+    geometries of features: measured types are not suffixed.
+
+    Args:
+        sampled_geometry_types: comma-separated geometry types, as PostGIS names them
+
+    Returns:
+        sorted distinct geometry types
+    """
+    if not sampled_geometry_types:
+        return []
+    geometry_types: set[str] = set()
+    for geometry_type in sampled_geometry_types.upper().split(","):
+        geometry_types.add(geometry_type.removesuffix("M"))
+    return sorted(geometry_types)
+
+
+def parse_raster_row(row: dict) -> CatalogRaster:
+    """Build a raster description from a row of the rasters catalog query.
+
+    Args:
+        row: row of SQL_CATALOG_RASTERS
+
+    Returns:
+        raster description
+    """
+    return CatalogRaster(
+        relation_oid=row.get("relation_oid"),
+        schema_name=row.get("schema_name"),
+        table_name=row.get("table_name"),
+        layer_name=get_layer_name(
+            schema_name=row.get("schema_name"),
+            table_name=row.get("table_name"),
+            current_schema=row.get("current_schema"),
+        ),
+        raster_column=row.get("raster_column"),
+        srid=row.get("srid") or 0,
+        scale_x=row.get("scale_x"),
+        scale_y=row.get("scale_y"),
+        tile_width=row.get("tile_width"),
+        tile_height=row.get("tile_height"),
+        bands_count=row.get("bands_count"),
+        pixel_types=(
+            row.get("pixel_types").split(",") if row.get("pixel_types") else []
+        ),
+        nodata_values=[
+            None if value == "NULL" else float(value)
+            for value in (
+                row.get("nodata_values").split(",") if row.get("nodata_values") else []
+            )
+        ],
+        is_out_db=bool(row.get("is_out_db")),
+        extent=tuple(
+            None if row.get(coord) is None else round(row.get(coord), 2)
+            for coord in ("xmin", "xmax", "ymin", "ymax")
+        ),
+        srs_auth_name=row.get("srs_auth_name"),
+        srs_auth_srid=row.get("srs_auth_srid"),
+        srs_wkt=row.get("srs_wkt"),
+        storage_size=row.get("storage_size"),
+        estimated_tiles=row.get("estimated_tiles"),
+        overviews=row.get("overviews").splitlines() if row.get("overviews") else [],
+    )
+
+
+def quote_identifier(identifier: str) -> str:
+    """Quote a SQL identifier (schema, table or column name).
+
+    Args:
+        identifier: identifier to quote
+
+    Returns:
+        quoted identifier
+    """
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def quote_literal(value: str) -> str:
+    """Quote a SQL string literal.
+
+    Args:
+        value: string to quote
+
+    Returns:
+        quoted string
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+def get_plan_total_cost(query_plan: str) -> float | None:
+    """Extract the total cost estimated by the planner from the first line of an
+    EXPLAIN output.
+
+    Args:
+        query_plan: first line of the plan, e.g. "Aggregate  (cost=0.00..123.45
+            rows=1 width=8)"
+
+    Returns:
+        total cost or None if it can't be found
+    """
+    match = re.search(r"cost=[\d.]+\.\.([\d.]+)", f"{query_plan}")
+    if match is None:
+        return None
+    return float(match.group(1))
+
+
+def get_like_pattern(pattern: str) -> str:
+    """Convert a shell-style pattern into a SQL LIKE pattern.
+
+    Args:
+        pattern: pattern with * and ? wildcards
+
+    Returns:
+        LIKE pattern, quoted as a literal
+    """
+    like_pattern = (
+        pattern.replace("\\", "\\\\")
+        .replace("%", "\\%")
+        .replace("_", "\\_")
+        .replace("*", "%")
+        .replace("?", "_")
+    )
+    return quote_literal(like_pattern)
+
+
+def get_pattern_condition(pattern: str, on_table_name: bool) -> str:
+    """Build the SQL condition matching relations with a pattern.
+
+    Args:
+        pattern: shell-style pattern. With a dot, it applies to schema.table names.
+        on_table_name: apply a pattern without dot to table names instead of schema
+            names
+
+    Returns:
+        SQL condition on pg_namespace (n) and pg_class (c)
+    """
+    if "." in pattern:
+        return f"(n.nspname || '.' || c.relname) LIKE {get_like_pattern(pattern)}"
+    if on_table_name:
+        return f"c.relname LIKE {get_like_pattern(pattern)}"
+    return f"n.nspname LIKE {get_like_pattern(pattern)}"
+
+
+def get_layer_name(schema_name: str, table_name: str, current_schema: str) -> str:
+    """Get the name OGR gives to a relation: the table name alone for relations in
+    the current schema, prefixed by the schema name otherwise.
+
+    Args:
+        schema_name: schema of the relation
+        table_name: name of the relation
+        current_schema: current schema of the connection
+
+    Returns:
+        OGR layer name
+    """
+    if schema_name == current_schema:
+        return table_name
+    return f"{schema_name}.{table_name}"
+
+
+def parse_geometry_type(
+    geometry_type: str, coord_dimension: int
+) -> tuple[str, bool, bool] | None:
+    """Parse a geometry type as stored in geometry_columns (POINTM with 3 dimensions)
+    or geography_columns (PointZ, PointZM...) views.
+
+    Args:
+        geometry_type: type of the geometry column
+        coord_dimension: number of dimensions of coordinates
+
+    Returns:
+        OGC base type, has Z, has M or None if the type is unknown
+    """
+    geometry_type = f"{geometry_type}".upper()
+    has_m = False
+    if geometry_type.endswith("ZM") and geometry_type[:-2] in OGC_GEOMETRY_TYPES:
+        geometry_type, has_m = geometry_type[:-2], True
+    elif geometry_type.endswith("M") and geometry_type[:-1] in OGC_GEOMETRY_TYPES:
+        geometry_type, has_m = geometry_type[:-1], True
+    elif geometry_type.endswith("Z") and geometry_type[:-1] in OGC_GEOMETRY_TYPES:
+        geometry_type = geometry_type[:-1]
+
+    if geometry_type not in OGC_GEOMETRY_TYPES:
+        return None
+
+    if coord_dimension == 4:
+        return geometry_type, True, True
+    if coord_dimension == 3:
+        return geometry_type, not has_m, has_m
+    return geometry_type, False, has_m
+
+
+def get_ogr_field_type(type_name: str, format_type: str) -> tuple[str, int, int] | None:
+    """Get the OGR field type of a column, as the OGR PostgreSQL driver does.
+
+    Args:
+        type_name: name of the column type (pg_type.typname)
+        format_type: column type with modifiers (format_type())
+
+    Returns:
+        OGR field type name, width and precision or None if the type is not handled
+    """
+    if type_name in ("bpchar", "varchar"):
+        width = re.search(r"\((\d+)\)", format_type)
+        return "String", int(width.group(1)) if width else 0, 0
+
+    if type_name in ("numeric", "_numeric"):
+        suffix = "List" if type_name == "_numeric" else ""
+        modifiers = re.search(r"numeric\((\d+)(?:,(\d+))?\)", format_type)
+        if modifiers is None:
+            return f"Real{suffix}", 0, 0
+        width = int(modifiers.group(1))
+        precision = int(modifiers.group(2) or 0)
+        if precision:
+            return f"Real{suffix}", width, precision
+        if width >= 10:
+            return f"Integer64{suffix}", width, 0
+        return f"Integer{suffix}", width, 0
+
+    if type_name in PG_TYPES_OGR:
+        ogr_type_name, width = PG_TYPES_OGR[type_name]
+        return ogr_type_name, width, 0
+
+    return None
+
+
+def describe_columns(
+    relation: CatalogRelation,
+    columns: Iterable[tuple[str, str, str, str | None, bool]],
+    fid_column_name: str = "ogc_fid",
+):
+    """Fill feature attributes of a relation from its columns. Geometry columns and
+    the column used as FID by OGR are left out.
+
+    Args:
+        relation: relation to describe
+        columns: column name, type name, format type, comment and primary key flag,
+            in columns order
+        fid_column_name: column used as FID when there is no integer primary key.
+            Defaults to "ogc_fid" (PGSQL_OGR_FID configuration option).
+    """
+    columns = list(columns)
+    fid_column = next(
+        (
+            column_name
+            for column_name, type_name, _, _, is_primary_key in columns
+            if is_primary_key and type_name in PG_FID_TYPES
+        ),
+        None,
+    )
+    if fid_column is None:
+        fid_column = next(
+            (
+                column_name
+                for column_name, type_name, _, _, _ in columns
+                if column_name == fid_column_name and type_name in PG_FID_TYPES
+            ),
+            None,
+        )
+
+    relation.feature_attributes = []
+    for column_name, type_name, format_type, column_comment, _ in columns:
+        if column_name == fid_column or type_name in ("geometry", "geography"):
+            continue
+
+        ogr_field_type = get_ogr_field_type(
+            type_name=type_name, format_type=format_type
+        )
+        if ogr_field_type is None:
+            logger.debug(
+                f"Column {column_name} of {relation.layer_name} is of type "
+                f"{format_type}: relation is left to OGR."
+            )
+            relation.is_describable = False
+            return
+
+        data_type, length, precision = ogr_field_type
+        relation.feature_attributes.append(
+            AttributeField(
+                name=column_name,
+                data_type=data_type,
+                description=column_comment,
+                length=length,
+                precision=precision,
+            )
+        )
@@ -0,0 +1,272 @@
+"""Read several PostGIS databases concurrently, yielding their metadatasets in the
+order databases were given.
+
+Each database is read by a thread, within its own reading session. A global limit
+bounds the number of databases read at the same time and a second one the number of
+databases read at the same time on a same server.
+"""
+
+# ##############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from queue import Full, Queue
+from threading import Condition, Event
+from typing import TYPE_CHECKING
+
+# package
+from dicogis.models.metadataset import MetaDataset
+
+if TYPE_CHECKING:
+    from dicogis.georeaders.read_postgis import ReadPostGIS
+
+# ##############################################################################
+# ############ Globals ############
+# #################################
+
+# LOG
+logger = logging.getLogger(__name__)
+
+# marks the end of a database reading into its queue
+_DATABASE_READ = object()
+
+# ##############################################################################
+# ############ Classes ############
+# #################################
+
+
+@dataclass
+class DatabaseToProcess:
+    """Model of a database to process."""
+
+    reader: "ReadPostGIS"
+    server_address: str
+    processed: bool = False
+    process_error: str | None = None
+    count_metadatasets: int = 0
+
+    @property
+    def name(self) -> str:
+        """Name of the database, as given by the user.
+
+        Returns:
+            service name or database name
+        """
+        return (
+            self.reader.db_connection.service_name
+            or self.reader.db_connection.database_name
+        )
+
+
+class ProcessingDatabases:
+    """PostGIS databases processor."""
+
+    def __init__(
+        self,
+        readers: list["ReadPostGIS"],
+        max_databases: int = 1,
+        max_databases_per_server: int = 0,
+        max_pending_metadatasets: int = 1000,
+    ):
+        """Initialization.
+
+        Args:
+            readers: PostGIS readers, one per database, not connected yet
+            max_databases: maximum number of databases read at the same time. 1
+                reads databases one after another. Defaults to 1.
+            max_databases_per_server: maximum number of databases read at the same
+                time on a same server. 0 means no other limit than max_databases.
+                Defaults to 0.
+            max_pending_metadatasets: maximum number of metadatasets read but not
+                yielded yet, per database. Defaults to 1000.
+        """
+        self.max_databases = max(1, max_databases)
+        self.max_databases_per_server = max_databases_per_server
+        self.max_pending_metadatasets = max(1, max_pending_metadatasets)
+        self.li_databases_to_process: list[DatabaseToProcess] = [
+            DatabaseToProcess(
+                reader=reader, server_address=reader.db_connection.server_address
+            )
+            for reader in readers
+        ]
+
+        # scheduling state, shared by reading threads
+        self._condition = Condition()
+        self._stop_event = Event()
+        self._pending: list[DatabaseToProcess] = []
+        self._running_per_server: dict[str, int] = {}
+
+    @property
+    def count_metadatasets(self) -> int:
+        """Number of metadatasets read from every database.
+
+        Returns:
+            metadatasets count
+        """
+        return sum(
+            database.count_metadatasets for database in self.li_databases_to_process
+        )
+
+    def read_database(self, database: DatabaseToProcess) -> Iterator[MetaDataset]:
+        """Connect to a database and read its tables within a reading session. Must be
+        consumed by a single thread. If reading fails, the error is stored in the
+        database and the reading stops there, without raising.
+
+        Args:
+            database: database to read
+
+        Yields:
+            metadatasets of the database tables
+        """
+        logger.info(f"Start processing database: {database.name}")
+        database.reader.get_connection()
+        if database.reader.conn is None:
+            database.process_error = database.reader.db_connection.state_msg
+            logger.error(
+                f"Connection failed using {database.name}. Trace: "
+                f"{database.process_error}."
+            )
+            return
+
+        try:
+            with database.reader:
+                for metadataset in database.reader.iter_metadatasets():
+                    if self._stop_event.is_set():
+                        return
+                    database.count_metadatasets += 1
+                    yield metadataset
+        except Exception as err:
+            database.process_error = f"KO: {err}"
+            logger.exception(
+                f"Reading database {database.name} failed after "
+                f"{database.count_metadatasets} tables. Other databases are still "
+                "read."
+            )
+            return
+
+        database.processed = True
+        logger.info(
+            f"Database {database.name} processed: {database.count_metadatasets} "
+            "tables read."
+        )
+
+    def get_next_database(self) -> DatabaseToProcess | None:
+        """Take the first pending database whose server can accept another reading,
+        waiting until one is available.
+
+        Returns:
+            database to read or None if there is nothing left to read
+        """
+        with self._condition:
+            while self._pending and not self._stop_event.is_set():
+                for database in self._pending:
+                    count_running = self._running_per_server.get(
+                        database.server_address, 0
+                    )
+                    if (
+                        not self.max_databases_per_server
+                        or count_running < self.max_databases_per_server
+                    ):
+                        self._pending.remove(database)
+                        self._running_per_server[database.server_address] = (
+                            count_running + 1
+                        )
+                        return database
+                self._condition.wait()
+            return None
+
+    def release_database(self, database: DatabaseToProcess):
+        """Free the server slot taken by a database reading.
+
+        Args:
+            database: database read
+        """
+        with self._condition:
+            self._running_per_server[database.server_address] -= 1
+            self._condition.notify_all()
+
+    def read_databases_worker(self, queues: list[Queue]):
+        """Read pending databases until none is left, putting metadatasets in the
+        queue of each database.
+
+        Args:
+            queues: one queue per database, in the same order as databases
+        """
+        while (database := self.get_next_database()) is not None:
+            queue = queues[self.li_databases_to_process.index(database)]
+            try:
+                for metadataset in self.read_database(database=database):
+                    if not self.put_or_stop(queue=queue, item=metadataset):
+                        break
+            finally:
+                self.put_or_stop(queue=queue, item=_DATABASE_READ)
+                self.release_database(database=database)
+
+    def put_or_stop(self, queue: Queue, item: MetaDataset | object) -> bool:
+        """Put an item in a bounded queue, waiting for room unless the reading is
+        stopped.
+
+        Args:
+            queue: queue of a database
+            item: metadataset or end of database reading mark
+
+        Returns:
+            True if the item has been put, False if the reading has been stopped
+        """
+        while not self._stop_event.is_set():
+            try:
+                queue.put(item, timeout=1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def iter_metadatasets(self) -> Iterator[MetaDataset]:
+        """Read databases, concurrently if allowed, and yield metadatasets database
+        after database in the order databases were given. Metadatasets of a database
+        are yielded as soon as they are read, the following databases being read in
+        the meantime.
+
+        Yields:
+            metadatasets of every database
+        """
+        max_workers = min(self.max_databases, len(self.li_databases_to_process))
+        if max_workers <= 1:
+            for database in self.li_databases_to_process:
+                yield from self.read_database(database=database)
+            return
+
+        logger.info(
+            f"Reading {len(self.li_databases_to_process)} databases with "
+            f"{max_workers} threads (at most {self.max_databases_per_server or 'all'} "
+            "per server)."
+        )
+        queues: list[Queue] = [
+            Queue(maxsize=self.max_pending_metadatasets)
+            for _ in self.li_databases_to_process
+        ]
+        self._stop_event.clear()
+        self._pending = list(self.li_databases_to_process)
+        self._running_per_server = {}
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="DicoGIS-PostGIS"
+        )
+        try:
+            for _ in range(max_workers):
+                executor.submit(self.read_databases_worker, queues)
+
+            for queue in queues:
+                while (item := queue.get()) is not _DATABASE_READ:
+                    yield item
+        finally:
+            # stop readings still running if the consumer stopped early or failed
+            with self._condition:
+                self._stop_event.set()
+                self._condition.notify_all()
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -8,19 +8,34 @@
 
 # standard library
 import logging
-from collections.abc import Callable, Iterable
+import sqlite3
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
+from functools import partial
 from locale import getlocale
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import get_context
+from multiprocessing.util import Finalize
 from os import path
 from pathlib import Path
+from queue import Empty, Full, Queue
+from threading import BoundedSemaphore, Event, Thread, local
 from tkinter import IntVar, StringVar
+from typing import ClassVar
 
 # package
+from dicogis.cache.inventory_cache import InventoryCache, get_inventory_cache
+from dicogis.cache.srs_cache import srs_cache
+from dicogis.constants import StatisticsModes
 from dicogis.export.base_serializer import MetadatasetSerializerBase
+from dicogis.georeaders.base_georeader import GeoReaderBase, GeoReadersSessions
 from dicogis.georeaders.read_dxf import ReadCadDxf
 from dicogis.georeaders.read_raster import ReadRasters
+from dicogis.georeaders.read_shapefile import ReadShapefile
 from dicogis.georeaders.read_vector_flat_dataset import ReadVectorFlatDataset
 from dicogis.georeaders.read_vector_flat_geodatabase import ReadFlatDatabase
+from dicogis.listing.folder_files import folders_files_index
 from dicogis.models.metadataset import MetaDataset
 from dicogis.utils.texts import TextsManager
 from dicogis.utils.utils import Utilities
@@ -35,6 +50,9 @@ utils_global = Utilities()
 # LOG
 logger = logging.getLogger(__name__)
 
+# georeaders sessions are bound to a thread: GDAL error handlers are thread-local
+georeaders_sessions_holder = local()
+
 # ##############################################################################
 # ############ Classes ############
 # #################################
@@ -47,50 +65,74 @@ class DatasetToProcess:
     file_path: Path
     file_format: str
     georeader: object
+    allowed_drivers: tuple[str, ...] | None = None
+    # files next to the dataset with their size, known from the listing
+    sibling_files: dict[str, int | None] | None = None
     processed: bool = False
     process_error: str | None = None
     exported: bool = False
     export_error: str | None = None
+    from_cache: bool = False
 
 
 class ProcessingFiles:
     """Geofiles processor."""
 
-    MATRIX_FORMAT_GEOREADER = {
-        "dxf": ReadCadDxf,
-        "esri_shapefile": ReadVectorFlatDataset,
-        "file_geodatabase_esri": ReadFlatDatabase,
-        "file_geodatabase_spatialite": ReadFlatDatabase,
-        "file_geodatabase_geopackage": ReadFlatDatabase,
-        "geotiff": ReadRasters,
-        "gxt": ReadVectorFlatDataset,
-        "geojson": ReadVectorFlatDataset,
-        "gml": ReadVectorFlatDataset,
-        "kml": ReadVectorFlatDataset,
-        "mapinfo_tab": ReadVectorFlatDataset,
-        "raster": ReadRasters,
+    # dataset format to georeader and GDAL drivers (short names) expected to open
+    # it, tried before probing every driver. None to probe every driver.
+    MATRIX_FORMAT_GEOREADER: ClassVar[
+        dict[str, tuple[type[GeoReaderBase], tuple[str, ...] | None]]
+    ] = {
+        "dxf": (ReadCadDxf, ("DXF",)),
+        "esri_shapefile": (ReadShapefile, ("ESRI Shapefile",)),
+        "file_geodatabase_esri": (ReadFlatDatabase, ("OpenFileGDB", "FileGDB")),
+        "file_geodatabase_spatialite": (ReadFlatDatabase, ("SQLite",)),
+        "file_geodatabase_geopackage": (ReadFlatDatabase, ("GPKG",)),
+        "geotiff": (ReadRasters, ("GTiff",)),
+        "gxt": (ReadVectorFlatDataset, ("Geoconcept",)),
+        "geojson": (ReadVectorFlatDataset, ("GeoJSON", "GeoJSONSeq", "ESRIJSON")),
+        "gml": (ReadVectorFlatDataset, ("GML",)),
+        "kml": (ReadVectorFlatDataset, ("LIBKML", "KML")),
+        "mapinfo_tab": (ReadVectorFlatDataset, ("MapInfo File",)),
+        "raster": (ReadRasters, None),
     }
 
+    # formats in processing order, with related analysis option and output family
+    FORMATS_PROCESSING_ORDER: tuple[tuple[str, str, str], ...] = (
+        ("esri_shapefile", "opt_analyze_shapefiles", "has_vector"),
+        ("mapinfo_tab", "opt_analyze_mapinfo_tab", "has_vector"),
+        ("kml", "opt_analyze_kml", "has_vector"),
+        ("gml", "opt_analyze_gml", "has_vector"),
+        ("geojson", "opt_analyze_geojson", "has_vector"),
+        ("geotiff", "opt_analyze_geotiff", "has_raster"),
+        ("gxt", "opt_analyze_gxt", "has_vector"),
+        ("raster", "opt_analyze_raster", "has_raster"),
+        ("file_geodatabase_esri", "opt_analyze_esri_filegdb", "has_filedb"),
+        ("file_geodatabase_geopackage", "opt_analyze_geopackage", "has_filedb"),
+        ("file_geodatabase_spatialite", "opt_analyze_spatialite", "has_filedb"),
+        ("file_cad", "opt_analyze_cdao", "has_cad"),
+    )
+
     def __init__(
         self,
         serializer: MetadatasetSerializerBase,
         localized_strings: dict | None,
         # input lists of files to process
-        li_cdao: Iterable | None,
-        li_dxf: Iterable | None,
-        li_flat_geodatabase_esri_filegdb: Iterable | None,
-        li_flat_geodatabase_geopackage: Iterable | None,
-        li_flat_geodatabase_spatialite: Iterable | None,
-        li_geojson: Iterable | None,
-        li_geotiff: Iterable | None,
-        li_gxt: Iterable | None,
-        li_gml: Iterable | None,
-        li_kml: Iterable | None,
-        li_mapinfo_tab: Iterable | None,
-        li_shapefiles: Iterable | None,
-        li_vectors: Iterable | None,
-        li_rasters: Iterable | None,
-        li_file_databases: Iterable | None,
+        li_cdao: Iterable | None = None,
+        li_dxf: Iterable | None = None,
+        li_flat_geodatabase_esri_filegdb: Iterable | None = None,
+        li_flat_geodatabase_geopackage: Iterable | None = None,
+        li_flat_geodatabase_spatialite: Iterable | None = None,
+        li_geojson: Iterable | None = None,
+        li_geotiff: Iterable | None = None,
+        li_gxt: Iterable | None = None,
+        li_gml: Iterable | None = None,
+        li_kml: Iterable | None = None,
+        li_mapinfo_tab: Iterable | None = None,
+        li_shapefiles: Iterable | None = None,
+        li_vectors: Iterable | None = None,
+        li_rasters: Iterable | None = None,
+        li_file_databases: Iterable | None = None,
         # options
         opt_analyze_esri_filegdb: bool = True,
         opt_analyze_geojson: bool = True,
@@ -110,6 +152,15 @@ class ProcessingFiles:
         progress_callback_cmd: Callable | None = None,
         # misc
         opt_quick_fail: bool = False,
+        opt_stats_mode: StatisticsModes = StatisticsModes.exact,
+        # parallel execution
+        opt_jobs: int = 1,
+        opt_worker_max_datasets: int | None = 200,
+        opt_layers_jobs: int = 1,
+        # cache
+        opt_cache: bool = False,
+        opt_cache_ttl: int | None = None,
+        cache_path: Path | None = None,
     ) -> None:
         self.serializer = serializer
 
@@ -155,8 +206,27 @@ class ProcessingFiles:
         self.opt_analyze_shapefiles = opt_analyze_shapefiles
         self.opt_analyze_geopackage = opt_analyze_geopackage
 
+        # parallel execution
+        self.opt_jobs = max(1, opt_jobs)
+        self.opt_worker_max_datasets = opt_worker_max_datasets
+        self.opt_layers_jobs = max(1, opt_layers_jobs)
+
+        # cache of previously read datasets
+        self.opt_cache = opt_cache
+        self.opt_cache_ttl = opt_cache_ttl
+        self.inventory_cache: InventoryCache | None = None
+        if self.opt_cache:
+            # same arguments as in read_dataset_with_georeader to share the instance
+            self.inventory_cache = get_inventory_cache(
+                database_path=cache_path or InventoryCache.default_database_path(),
+                ttl_hours=opt_cache_ttl,
+            )
+        self.count_cache_hits: int = 0
+        self.count_cache_misses: int = 0
+
         # others
         self.opt_quick_fail = opt_quick_fail
+        self.opt_stats_mode = StatisticsModes(opt_stats_mode)
         self.total_files: int | None = None
         self.li_files_to_process: list[DatasetToProcess | None] = []
         self.localized_strings = localized_strings
@@ -170,13 +240,15 @@ class ProcessingFiles:
 
     def process_datasets_in_queue(self):
         """Process datasets in queue."""
+        datasets_to_read = []
         for geofile in self.li_files_to_process:
             if geofile.processed is True:
                 logger.warning(f"File has already been processed: {geofile.file_path}")
                 continue
+            datasets_to_read.append(geofile)
 
-            # extract dataset metadata
-            geofile, metadataset = self.read_dataset(dataset_to_process=geofile)
+        # results are yielded in queue order, whatever the number of jobs
+        for geofile, metadataset in self.read_datasets(datasets=datasets_to_read):
             if metadataset is None:
                 logger.error(
                     f"Reading {geofile.file_path} failed. It can't be serialized."
@@ -189,6 +261,260 @@ class ProcessingFiles:
             )
 
         self.serializer.post_serializing()
+        self.report_cache_usage()
+
+    def process_datasets_from_stream(
+        self,
+        listed_geofiles: Iterable[tuple[str, str]],
+        max_pending_datasets: int = 1000,
+    ):
+        """Process datasets while they are being listed.
+
+        Listing runs in a separate thread and feeds readers through a bounded queue,
+        so reading starts as soon as the first dataset is found. Each metadataset is
+        serialized as soon as it's read, into the output family of its format, and
+        isn't kept afterwards.
+
+        Datasets are read in listing order: ordering happens at serialization time,
+        the serializer sorting rows of each output family by dataset path once
+        everything has been read.
+
+        Args:
+            listed_geofiles: iterable of (dataset format, path), typically a
+                GeodataFilesLister
+            max_pending_datasets: maximum number of datasets listed but not read yet.
+                Defaults to 1000.
+        """
+        queue_listed_datasets: Queue = Queue(maxsize=max_pending_datasets)
+        # bounds datasets taken from the queue but not read yet (worker pool input)
+        semaphore_pending = BoundedSemaphore(max_pending_datasets)
+        # set to stop listing and feeding readers, whatever happens
+        event_stop = Event()
+
+        listing_thread = Thread(
+            target=self.enqueue_listed_datasets,
+            kwargs={
+                "listed_geofiles": listed_geofiles,
+                "queue_listed_datasets": queue_listed_datasets,
+                "event_stop": event_stop,
+            },
+            daemon=True,
+        )
+        listing_thread.start()
+
+        def iter_listed_datasets() -> Iterator[DatasetToProcess]:
+            while not event_stop.is_set():
+                try:
+                    listed_dataset = queue_listed_datasets.get(timeout=1)
+                except Empty:
+                    continue
+                if listed_dataset is None:
+                    return
+                if isinstance(listed_dataset, Exception):
+                    raise listed_dataset
+                while not semaphore_pending.acquire(timeout=1):
+                    if event_stop.is_set():
+                        return
+                yield listed_dataset
+
+        formats_output_families: dict[str, str] = {
+            dataset_format: output_family
+            for dataset_format, _, output_family in self.FORMATS_PROCESSING_ORDER
+        }
+        # output families prepared by the serializer, as the first dataset comes
+        prepared_families: set[str] = set()
+
+        self.total_files = 0
+        reading = self.read_datasets(datasets=iter_listed_datasets())
+        try:
+            for geofile, metadataset in reading:
+                semaphore_pending.release()
+                self.total_files += 1
+                if metadataset is None:
+                    logger.error(
+                        f"Reading {geofile.file_path} failed. It can't be serialized."
+                    )
+                    continue
+
+                output_family = formats_output_families.get(geofile.file_format)
+                if output_family not in prepared_families:
+                    self.serializer.pre_serializing(**{output_family: 1})
+                    prepared_families.add(output_family)
+                self.export_metadataset(
+                    dataset_to_process=geofile, metadataset_to_serialize=metadataset
+                )
+        finally:
+            event_stop.set()
+            reading.close()
+            listing_thread.join()
+
+        self.serializer.post_serializing(sort_rows=True)
+        self.report_cache_usage()
+
+    def enqueue_listed_datasets(
+        self,
+        listed_geofiles: Iterable[tuple[str, str]],
+        queue_listed_datasets: Queue,
+        event_stop: Event,
+    ):
+        """Put listed geofiles into the processing queue, skipping formats which are
+        not to be analyzed. None is put at the end of listing and the exception if
+        listing fails. Folders are removed from the folders files index once their
+        datasets have been put into the queue.
+
+        Args:
+            listed_geofiles: iterable of (dataset format, path)
+            queue_listed_datasets: queue where to put datasets to process
+            event_stop: event set by the consumer to interrupt listing
+        """
+        analysis_options = {
+            dataset_format: getattr(self, option_name)
+            for dataset_format, option_name, _ in self.FORMATS_PROCESSING_ORDER
+        }
+
+        def put_or_stop(item: DatasetToProcess | Exception | None) -> bool:
+            while not event_stop.is_set():
+                try:
+                    queue_listed_datasets.put(item, timeout=1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        # datasets of a folder are listed one after another
+        dispatched_folder: str | None = None
+        try:
+            for listed_format, geofile in listed_geofiles:
+                geofile_folder = path.dirname(path.abspath(geofile))
+                if geofile_folder != dispatched_folder:
+                    if dispatched_folder is not None:
+                        folders_files_index.remove_folder(folder=dispatched_folder)
+                    dispatched_folder = geofile_folder
+
+                # CAD formats are processed together
+                dataset_format = (
+                    "file_cad"
+                    if listed_format in ("dxf", "dwg", "dgn")
+                    else listed_format
+                )
+                if not analysis_options.get(dataset_format):
+                    continue
+                georeader, allowed_drivers = self.MATRIX_FORMAT_GEOREADER.get(
+                    dataset_format, (None, None)
+                )
+                if not put_or_stop(
+                    DatasetToProcess(
+                        file_path=geofile,
+                        file_format=dataset_format,
+                        georeader=georeader,
+                        allowed_drivers=allowed_drivers,
+                        sibling_files=folders_files_index.get_sibling_files(
+                            file_path=geofile
+                        ),
+                    )
+                ):
+                    logger.info("Listing interrupted.")
+                    return
+        except Exception as err:
+            logger.exception("Listing geofiles failed.")
+            put_or_stop(err)
+            return
+        finally:
+            if dispatched_folder is not None:
+                folders_files_index.remove_folder(folder=dispatched_folder)
+
+        put_or_stop(None)
+
+    def read_datasets(
+        self, datasets: Iterable[DatasetToProcess]
+    ) -> Iterator[tuple[DatasetToProcess, MetaDataset | None]]:
+        """Read datasets, sequentially or using a pool of worker processes depending
+        on opt_jobs. Results are always yielded in the same order as input datasets.
+
+        Args:
+            datasets: datasets to read
+
+        Yields:
+            dataset and metadataset, None if an error occurred
+        """
+        if self.opt_jobs <= 1:
+            try:
+                for dataset_to_process in datasets:
+                    yield self.read_dataset(dataset_to_process=dataset_to_process)
+            finally:
+                close_georeaders_sessions()
+            return
+
+        yield from self.read_datasets_in_parallel(datasets=datasets)
+
+    def read_datasets_in_parallel(
+        self, datasets: Iterable[DatasetToProcess]
+    ) -> Iterator[tuple[DatasetToProcess, MetaDataset | None]]:
+        """Read datasets using a pool of worker processes.
+
+        Workers are spawned (not forked) so each one initializes its own GDAL state
+        and they are recycled after opt_worker_max_datasets datasets to contain GDAL
+        memory leaks. Only the calling process serializes.
+
+        Args:
+            datasets: datasets to read
+
+        Yields:
+            dataset and metadataset in the same order as input datasets
+        """
+        mp_context = get_context("spawn")
+
+        # workers logs are forwarded to the handlers of the main process
+        log_queue = mp_context.Queue()
+        root_logger = logging.getLogger()
+        log_listener = QueueListener(
+            log_queue, *root_logger.handlers, respect_handler_level=True
+        )
+        log_listener.start()
+
+        logger.info(
+            f"Reading datasets with {self.opt_jobs} worker processes (recycled "
+            f"every {self.opt_worker_max_datasets} datasets)."
+        )
+        # workers get copies of datasets: keep originals to report status on them
+        sent_datasets: deque[DatasetToProcess] = deque()
+
+        def feed_workers() -> Iterator[DatasetToProcess]:
+            for dataset_to_process in datasets:
+                sent_datasets.append(dataset_to_process)
+                yield dataset_to_process
+
+        try:
+            with mp_context.Pool(
+                processes=self.opt_jobs,
+                initializer=init_reading_worker,
+                initargs=(log_queue, root_logger.getEffectiveLevel()),
+                maxtasksperchild=self.opt_worker_max_datasets,
+            ) as pool:
+                for processed_dataset, metadataset in pool.imap(
+                    partial(
+                        read_dataset_with_georeader,
+                        opt_quick_fail=self.opt_quick_fail,
+                        stats_mode=self.opt_stats_mode,
+                        layers_jobs=self.opt_layers_jobs,
+                        cache_path=self.cache_path,
+                        cache_ttl=self.opt_cache_ttl,
+                    ),
+                    feed_workers(),
+                ):
+                    dataset_to_process = sent_datasets.popleft()
+                    dataset_to_process.processed = processed_dataset.processed
+                    dataset_to_process.process_error = processed_dataset.process_error
+                    dataset_to_process.from_cache = processed_dataset.from_cache
+                    self.update_cache_after_reading(
+                        dataset_to_process=dataset_to_process, metadataset=metadataset
+                    )
+                    self.update_progress_after_reading(
+                        dataset_to_process=dataset_to_process
+                    )
+                    yield dataset_to_process, metadataset
+        finally:
+            log_listener.stop()
 
     def read_dataset(
         self, dataset_to_process: DatasetToProcess
@@ -201,48 +527,94 @@ class ProcessingFiles:
         Returns:
             dataset and metadataset, None if an error occurs
         """
-        metadataset = None
+        self.update_progress(
+            message_to_display=f"Reading {dataset_to_process.file_path}..."
+        )
+        dataset_to_process, metadataset = read_dataset_with_georeader(
+            dataset_to_process=dataset_to_process,
+            opt_quick_fail=self.opt_quick_fail,
+            stats_mode=self.opt_stats_mode,
+            layers_jobs=self.opt_layers_jobs,
+            cache_path=self.cache_path,
+            cache_ttl=self.opt_cache_ttl,
+        )
+        self.update_cache_after_reading(
+            dataset_to_process=dataset_to_process, metadataset=metadataset
+        )
+        self.update_progress_after_reading(dataset_to_process=dataset_to_process)
 
-        if self.opt_quick_fail:
-            self.update_progress(
-                message_to_display=f"Reading {dataset_to_process.file_path}..."
-            )
-            metadataset = dataset_to_process.georeader().infos_dataset(
-                source_path=path.abspath(dataset_to_process.file_path),
-            )
-            logger.debug(f"Reading {dataset_to_process} succeeded.")
-            self.update_progress(
-                message_to_display=f"Reading {dataset_to_process.file_path}: OK",
-                increment_counter=True,
-            )
-            dataset_to_process.processed = True
-            return dataset_to_process, metadataset
+        return dataset_to_process, metadataset
 
-        try:
-            self.update_progress(
-                message_to_display=f"Reading {dataset_to_process.file_path}..."
-            )
-            metadataset = dataset_to_process.georeader().infos_dataset(
-                source_path=path.abspath(dataset_to_process.file_path),
-            )
-            logger.debug(f"Reading {dataset_to_process} succeeded.")
+    @property
+    def cache_path(self) -> Path | None:
+        """Path to the inventory cache database, used to open it from worker
+        processes.
+
+        Returns:
+            path to the cache database or None if cache is disabled
+        """
+        if self.inventory_cache is None:
+            return None
+        return self.inventory_cache.database_path
+
+    def update_cache_after_reading(
+        self, dataset_to_process: DatasetToProcess, metadataset: MetaDataset | None
+    ):
+        """Count cache hits and misses and store freshly read metadatasets into the
+        cache. Only the calling process writes into the cache.
+
+        Args:
+            dataset_to_process: dataset which has just been read
+            metadataset: resulting metadataset
+        """
+        if self.inventory_cache is None:
+            return
+
+        if dataset_to_process.from_cache:
+            self.count_cache_hits += 1
+            return
+
+        self.count_cache_misses += 1
+        if metadataset is not None and dataset_to_process.process_error is None:
+            try:
+                self.inventory_cache.store(
+                    dataset_path=dataset_to_process.file_path, metadataset=metadataset
+                )
+            except sqlite3.Error as err:
+                logger.warning(
+                    f"Storing {dataset_to_process.file_path} into inventory cache "
+                    f"failed. Trace: {err}"
+                )
+
+    def report_cache_usage(self):
+        """Save pending cache writes and log cache hits and misses. SRS cache usage
+        is only known for datasets read by the current process."""
+        srs_cache.log_usage()
+        if self.inventory_cache is None:
+            return
+
+        self.inventory_cache.flush()
+        logger.info(
+            f"Inventory cache: {self.count_cache_hits} hits - "
+            f"{self.count_cache_misses} misses."
+        )
+
+    def update_progress_after_reading(self, dataset_to_process: DatasetToProcess):
+        """Update progress depending on reading status.
+
+        Args:
+            dataset_to_process: dataset which has just been read
+        """
+        if dataset_to_process.process_error is None:
             self.update_progress(
-                message_to_display=f"Reading {dataset_to_process.file_path}: OK",
+                message_to_display=f"Reading {dataset_to_process.file_path}: "
+                f"{'OK (cache)' if dataset_to_process.from_cache else 'OK'}",
                 increment_counter=True,
             )
-            dataset_to_process.processed = True
-        except Exception as err:
+        else:
             self.update_progress(
                 message_to_display=f"Reading {dataset_to_process.file_path}: FAIL"
             )
-            logger.error(
-                f"Reading {dataset_to_process.file_path} "
-                f"(format: {dataset_to_process.file_format}) failed. Trace: {err}"
-            )
-            dataset_to_process.processed = True
-            dataset_to_process.process_error = err
-
-        return dataset_to_process, metadataset
 
     def export_metadataset(
         self,
@@ -311,13 +683,20 @@ class ProcessingFiles:
             list of files to process
         """
         out_list: list = []
+        georeader, allowed_drivers = self.MATRIX_FORMAT_GEOREADER.get(
+            dataset_format, (None, None)
+        )
 
         for geofile in list_of_datasets:
             out_list.append(
                 DatasetToProcess(
                     file_path=geofile,
                     file_format=dataset_format,
-                    georeader=self.MATRIX_FORMAT_GEOREADER.get(dataset_format),
+                    georeader=georeader,
+                    allowed_drivers=allowed_drivers,
+                    sibling_files=folders_files_index.get_sibling_files(
+                        file_path=geofile
+                    ),
                 )
             )
 
@@ -335,63 +714,63 @@ class ProcessingFiles:
             total of files to process
         """
         total_files: int = 0
-        if self.opt_analyze_shapefiles and len(self.li_shapefiles):
+        if self.opt_analyze_shapefiles and self.li_shapefiles:
             total_files += len(self.li_shapefiles)
             self.serializer.pre_serializing(has_vector=1)
             self.add_files_to_process_queue(
                 list_of_datasets=self.li_shapefiles, dataset_format="esri_shapefile"
             )
 
-        if self.opt_analyze_mapinfo_tab and len(self.li_mapinfo_tab):
+        if self.opt_analyze_mapinfo_tab and self.li_mapinfo_tab:
             total_files += len(self.li_mapinfo_tab)
             self.serializer.pre_serializing(has_vector=1)
             self.add_files_to_process_queue(
                 list_of_datasets=self.li_mapinfo_tab, dataset_format="mapinfo_tab"
             )
 
-        if self.opt_analyze_kml and len(self.li_kml):
+        if self.opt_analyze_kml and self.li_kml:
             total_files += len(self.li_kml)
             self.serializer.pre_serializing(has_vector=1)
             self.add_files_to_process_queue(
                 list_of_datasets=self.li_kml, dataset_format="kml"
             )
 
-        if self.opt_analyze_gml and len(self.li_gml):
+        if self.opt_analyze_gml and self.li_gml:
             total_files += len(self.li_gml)
             self.serializer.pre_serializing(has_vector=1)
             self.add_files_to_process_queue(
                 list_of_datasets=self.li_gml, dataset_format="gml"
             )
 
-        if self.opt_analyze_geojson and len(self.li_geojson):
+        if self.opt_analyze_geojson and self.li_geojson:
             total_files += len(self.li_geojson)
             self.serializer.pre_serializing(has_vector=1)
             self.add_files_to_process_queue(
                 list_of_datasets=self.li_geojson, dataset_format="geojson"
             )
 
-        if self.opt_analyze_geotiff and len(self.li_geotiff):
+        if self.opt_analyze_geotiff and self.li_geotiff:
             total_files += len(self.li_geotiff)
             self.serializer.pre_serializing(has_raster=1)
             self.add_files_to_process_queue(
                 list_of_datasets=self.li_geotiff, dataset_format="geotiff"
             )
 
-        if self.opt_analyze_gxt and len(self.li_gxt):
+        if self.opt_analyze_gxt and self.li_gxt:
             total_files += len(self.li_gxt)
             self.serializer.pre_serializing(has_vector=1)
             self.add_files_to_process_queue(
                 list_of_datasets=self.li_gxt, dataset_format="gxt"
             )
 
-        if self.opt_analyze_raster and len(self.li_rasters):
+        if self.opt_analyze_raster and self.li_rasters:
             total_files += len(self.li_rasters)
             self.serializer.pre_serializing(has_raster=1)
             self.add_files_to_process_queue(
                 list_of_datasets=self.li_tif, dataset_format="raster"
             )
 
-        if self.opt_analyze_esri_filegdb and len(self.li_flat_geodatabase_esri_filegdb):
+        if self.opt_analyze_esri_filegdb and self.li_flat_geodatabase_esri_filegdb:
             total_files += len(self.li_flat_geodatabase_esri_filegdb)
             self.serializer.pre_serializing(has_filedb=1)
             self.add_files_to_process_queue(
@@ -399,7 +778,7 @@ class ProcessingFiles:
                 dataset_format="file_geodatabase_esri",
             )
 
-        if self.opt_analyze_geopackage and len(self.li_flat_geodatabase_geopackage):
+        if self.opt_analyze_geopackage and self.li_flat_geodatabase_geopackage:
             total_files += len(self.li_flat_geodatabase_geopackage)
             self.serializer.pre_serializing(has_filedb=1)
             self.add_files_to_process_queue(
@@ -407,7 +786,7 @@ class ProcessingFiles:
                 dataset_format="file_geodatabase_geopackage",
             )
 
-        if self.opt_analyze_spatialite and len(self.li_flat_geodatabase_spatialite):
+        if self.opt_analyze_spatialite and self.li_flat_geodatabase_spatialite:
             total_files += len(self.li_flat_geodatabase_spatialite)
             self.serializer.pre_serializing(has_filedb=1)
             self.add_files_to_process_queue(
@@ -415,7 +794,7 @@ class ProcessingFiles:
                 dataset_format="file_geodatabase_spatialite",
             )
 
-        if self.opt_analyze_cdao and len(self.li_cdao):
+        if self.opt_analyze_cdao and self.li_cdao:
             total_files += len(self.li_cdao)
             self.serializer.pre_serializing(has_cad=1)
             self.add_files_to_process_queue(
@@ -445,3 +824,157 @@ class ProcessingFiles:
                 self.progress_counter += 1
         if self.progress_callback_cmd is not None:
             self.progress_callback_cmd()
+
+
+# ##############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def init_reading_worker(log_queue, log_level: int):
+    """Initialize a reading worker process: route its logs to the main process.
+
+    Args:
+        log_queue: multiprocessing queue listened by the main process
+        log_level: logging level to apply to the worker
+    """
+    root_logger = logging.getLogger()
+    root_logger.handlers = [QueueHandler(log_queue)]
+    root_logger.setLevel(log_level)
+
+    # tear down georeaders when the worker exits (including when it's recycled)
+    Finalize(None, close_georeaders_sessions, exitpriority=10)
+
+
+def get_georeaders_sessions(
+    stats_mode: StatisticsModes = StatisticsModes.exact,
+    layers_jobs: int = 1,
+) -> GeoReadersSessions:
+    """Get georeaders sessions of the current thread, opening them at first call.
+    Sessions opened with other settings are closed and opened again.
+
+    Args:
+        stats_mode: statistics mode of georeaders. Defaults to exact.
+        layers_jobs: number of layers read at the same time in multi-layers
+            datasets. Defaults to 1.
+
+    Returns:
+        georeaders sessions of the current thread
+    """
+    georeaders_sessions = getattr(georeaders_sessions_holder, "sessions", None)
+    if georeaders_sessions is not None and (
+        georeaders_sessions.stats_mode != stats_mode
+        or georeaders_sessions.max_layers_jobs != max(1, layers_jobs)
+    ):
+        close_georeaders_sessions()
+        georeaders_sessions = None
+    if georeaders_sessions is None:
+        georeaders_sessions = GeoReadersSessions(
+            stats_mode=stats_mode, max_layers_jobs=layers_jobs
+        )
+        georeaders_sessions_holder.sessions = georeaders_sessions
+    return georeaders_sessions
+
+
+def close_georeaders_sessions():
+    """Close georeaders sessions of the current thread, if any."""
+    georeaders_sessions = getattr(georeaders_sessions_holder, "sessions", None)
+    if georeaders_sessions is not None:
+        georeaders_sessions.close()
+        georeaders_sessions_holder.sessions = None
+
+
+def read_dataset_with_georeader(
+    dataset_to_process: DatasetToProcess,
+    opt_quick_fail: bool = False,
+    stats_mode: StatisticsModes = StatisticsModes.exact,
+    layers_jobs: int = 1,
+    cache_path: Path | None = None,
+    cache_ttl: int | None = None,
+) -> tuple[DatasetToProcess, MetaDataset | None]:
+    """Read dataset using its georeader and store into metadataset. If a cache is
+    set and the dataset has not changed since it was cached, the cached metadataset
+    is returned without opening the dataset, unless its statistics are less accurate
+    than required.
+
+    Defined at module level to be usable from worker processes. Georeaders are
+    reused from the sessions of the current thread: one per format.
+
+    Args:
+        dataset_to_process: dataset path or URI to read
+        opt_quick_fail: if True, errors are raised instead of being stored
+        stats_mode: statistics mode for features count and extent
+        layers_jobs: number of layers read at the same time in multi-layers
+            datasets. Defaults to 1.
+        cache_path: path to the inventory cache database. None to disable cache.
+        cache_ttl: maximum age of cache entries, in hours
+
+    Returns:
+        dataset and metadataset, None if an error occurs
+    """
+    metadataset = None
+
+    if cache_path is not None:
+        # caches only save time: if they fail, the dataset is read
+        try:
+            # resolved SRS are shared between processes next to the inventory cache
+            srs_cache.open_database(database_path=cache_path.with_name("srs.sqlite"))
+            metadataset = get_inventory_cache(
+                database_path=cache_path, ttl_hours=cache_ttl
+            ).get(dataset_path=dataset_to_process.file_path)
+        except (sqlite3.Error, OSError, UnicodeError) as err:
+            logger.warning(
+                f"Looking for {dataset_to_process.file_path} in inventory cache "
+                f"failed: it's read. Trace: {err}"
+            )
+            metadataset = None
+        # statistics computed exactly are good for every mode
+        if metadataset is not None and metadataset.statistics_mode not in (
+            None,
+            StatisticsModes.exact.value,
+            StatisticsModes(stats_mode).value,
+        ):
+            logger.debug(
+                f"Cached metadata of {dataset_to_process} were read with "
+                f"'{metadataset.statistics_mode}' statistics: reading it again."
+            )
+            metadataset = None
+        if metadataset is not None:
+            logger.debug(f"Reading {dataset_to_process} from cache.")
+            dataset_to_process.from_cache = True
+            dataset_to_process.processed = True
+            return dataset_to_process, metadataset
+
+    if opt_quick_fail:
+        georeader = get_georeaders_sessions(
+            stats_mode=stats_mode, layers_jobs=layers_jobs
+        ).get(dataset_to_process.georeader)
+        metadataset = georeader.infos_dataset(
+            source_path=path.abspath(dataset_to_process.file_path),
+            allowed_drivers=dataset_to_process.allowed_drivers,
+            sibling_files=dataset_to_process.sibling_files,
+        )
+        logger.debug(f"Reading {dataset_to_process} succeeded.")
+        dataset_to_process.processed = True
+        return dataset_to_process, metadataset
+
+    try:
+        georeader = get_georeaders_sessions(
+            stats_mode=stats_mode, layers_jobs=layers_jobs
+        ).get(dataset_to_process.georeader)
+        metadataset = georeader.infos_dataset(
+            source_path=path.abspath(dataset_to_process.file_path),
+            allowed_drivers=dataset_to_process.allowed_drivers,
+            sibling_files=dataset_to_process.sibling_files,
+        )
+        logger.debug(f"Reading {dataset_to_process} succeeded.")
+    except Exception as err:
+        logger.error(
+            f"Reading {dataset_to_process.file_path} "
+            f"(format: {dataset_to_process.file_format}) failed. Trace: {err}"
+        )
+        # stored as string to be safely sent back from worker processes
+        dataset_to_process.process_error = f"{err}"
+
+    dataset_to_process.processed = True
+    return dataset_to_process, metadataset
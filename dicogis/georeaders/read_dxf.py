@@ -10,6 +10,7 @@
 import logging
 
 # package
+from dicogis.constants import StatisticsModes
 from dicogis.georeaders.read_vector_flat_dataset import ReadVectorFlatDataset
 
 # #############################################################################
@@ -26,9 +27,9 @@ logger = logging.getLogger(__name__)
 class ReadCadDxf(ReadVectorFlatDataset):
     """Reader for geographic dataset stored as flat database files or folders."""
 
-    def __init__(self):
+    def __init__(self, stats_mode: StatisticsModes | str = StatisticsModes.exact):
         """Class constructor."""
-        super().__init__(dataset_type="flat_cad")
+        super().__init__(dataset_type="flat_cad", stats_mode=stats_mode)
 
 
 # ###########################################################################
@@ -8,16 +8,47 @@
 
 # Standard library
 import logging
-from functools import lru_cache
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import replace
+from queue import Empty, SimpleQueue
+from threading import Condition, Event
 
 # 3rd party libraries
 from osgeo import gdal, ogr
 
 # package
-from dicogis.constants import GDAL_POSTGIS_OPEN_OPTIONS
+from dicogis.cache.inventory_cache import InventoryCache
+from dicogis.constants import GDAL_POSTGIS_OPEN_OPTIONS, StatisticsModes
 from dicogis.georeaders.base_georeader import GeoReaderBase
+from dicogis.georeaders.postgis_catalog import (
+    SQL_CATALOG_COLUMNS,
+    SQL_CATALOG_FINGERPRINTS,
+    SQL_CATALOG_RASTERS,
+    SQL_CATALOG_RELATIONS,
+    SQL_CATALOG_VIEWS,
+    SQL_FILTERED_RELATIONS,
+    SQL_FREE_CONNECTIONS,
+    SQL_RELATION_ESTIMATES,
+    CatalogRaster,
+    CatalogRelation,
+    RelationsFilter,
+    describe_columns,
+    get_estimated_extent_expression,
+    get_geometry_sample_query,
+    get_layer_name,
+    get_plan_total_cost,
+    get_statistics_query,
+    parse_geometry_type,
+    parse_raster_row,
+    parse_sampled_geometry_types,
+    quote_identifier,
+    quote_literal,
+)
 from dicogis.models.database_connection import DatabaseConnection
-from dicogis.models.metadataset import MetaDatabaseTable
+from dicogis.models.metadataset import MetaDatabaseRaster, MetaDatabaseTable
 
 # ############################################################################
 # ######### Globals ############
@@ -27,6 +58,7 @@ from dicogis.models.metadataset import MetaDatabaseTable
 
 logger = logging.getLogger(__name__)
 
+
 # ############################################################################
 # ######### Classes #############
 # #################################
@@ -35,6 +67,11 @@ logger = logging.getLogger(__name__)
 class ReadPostGIS(GeoReaderBase):
     """Read PostGIS database."""
 
+    # number of relations whose statistics are read with a single query
+    CATALOG_STATISTICS_BATCH_SIZE: int = 50
+    # hard limit of connections opened at the same time by a reader
+    POOL_MAX_CONNECTIONS: int = 16
+
     def __init__(
         self,
         # connection parameters
@@ -45,6 +82,13 @@ class ReadPostGIS(GeoReaderBase):
         password: str | None = None,
         service: str | None = None,
         views_included: bool = True,
+        stats_mode: StatisticsModes | str = StatisticsModes.exact,
+        exact_stats_below_mb: int = 50,
+        max_connections: int = 1,
+        relations_filter: RelationsFilter | None = None,
+        inventory_cache: InventoryCache | None = None,
+        view_max_cost: float = 1_000_000,
+        view_statement_timeout: int = 60,
     ):
         """Uses OGR to extract basic informations about geodata stored into a PostGIS
             database.
@@ -61,12 +105,51 @@ class ReadPostGIS(GeoReaderBase):
                 the database. If defined, other connection parameters are ignored. \
                 Defaults to None.
             views_included (bool, optional): option to include views. Defaults to True.
+            stats_mode (StatisticsModes, optional): how to get features count and
+                spatial extent of tables: exact, fast or skip. In fast mode, they are
+                estimated from planner statistics for large tables. Defaults to exact.
+            exact_stats_below_mb (int, optional): in fast mode, size (in megabytes)
+                under which features count and extent of tables are still computed
+                exactly. Defaults to 50.
+            max_connections (int, optional): maximum number of connections used to
+                read tables concurrently, capped to POOL_MAX_CONNECTIONS and to half
+                of the connections still available on the server. 1 means tables
+                are read one after another. Defaults to 1.
+            relations_filter (RelationsFilter, optional): schemas and tables patterns
+                to include or exclude. Relations left out are never listed. Defaults
+                to None.
+            inventory_cache (InventoryCache, optional): cache of previously read
+                tables. If set, only tables whose fingerprint (storage, rows changes,
+                columns and comments) has changed are read again. Defaults to None.
+            view_max_cost (float, optional): planner cost above which features count
+                and extent of a view are not read. 0 disables the check. Defaults to
+                1 000 000.
+            view_statement_timeout (int, optional): maximum duration (in seconds) of
+                each query reading a view. 0 disables the timeout. Defaults to 60.
         """
 
         # Creating variables
         self.conn: ogr.DataSource | None = None
-        self.counter_alerts = 0
         self.views_included = views_included
+        self.exact_stats_below_mb = exact_stats_below_mb
+        self.max_connections = max(1, min(max_connections, self.POOL_MAX_CONNECTIONS))
+        self.relations_filter = relations_filter or RelationsFilter()
+        # tables matching filters, resolved when connecting
+        self.filtered_tables: list[str] | None = None
+        # read once per connection
+        self.schemas_names: set[str] | None = None
+        self.views_names: frozenset[str] | None = None
+        self.postgis_version: str | None = None
+
+        # cost guard of views, read after tables
+        self.view_max_cost = view_max_cost
+        self.view_statement_timeout = view_statement_timeout
+
+        # incremental reading
+        self.inventory_cache = inventory_cache
+        self.tables_fingerprints: dict[str, str] = {}
+        self.count_cache_hits: int = 0
+        self.count_cache_misses: int = 0
 
         # connection infos as attributes
         self.db_connection = DatabaseConnection(
@@ -80,15 +163,19 @@ class ReadPostGIS(GeoReaderBase):
             is_postgis=True,
         )
 
-        super().__init__(dataset_type="sgbd_postgis")
+        super().__init__(dataset_type="sgbd_postgis", stats_mode=stats_mode)
 
-    def get_connection(self) -> ogr.DataSource | None:
+    def get_connection(self, log_layers_count: bool = True) -> ogr.DataSource | None:
         """Open a connection to the PostgreSQL database using GDAL.
 
+        Args:
+            log_layers_count: log the number of tables, which makes OGR list every
+                table of the database. Defaults to True.
+
         Returns:
             Optional[ogr.DataSource]: OGR connection
         """
-        gdal_open_options = GDAL_POSTGIS_OPEN_OPTIONS
+        gdal_open_options = list(GDAL_POSTGIS_OPEN_OPTIONS)
         gdal_version_major, gdal_version_minor, _ = gdal.__version__.split(".")
         if int(gdal_version_major) >= 3 and int(gdal_version_minor) >= 7:
             if self.views_included:
@@ -103,51 +190,1270 @@ class ReadPostGIS(GeoReaderBase):
             )
 
         try:
-            conn: gdal.Dataset = gdal.OpenEx(
-                self.db_connection.pg_connection_uri,
-                gdal.OF_READONLY | gdal.OF_VECTOR | gdal.OF_VERBOSE_ERROR,
-                open_options=gdal_open_options,
-            )
-            logger.info(
-                f"Access granted: connecting people to {conn.GetLayerCount()} tables!"
-            )
+            # OGR lists tables lazily: tables matching filters are listed with a
+            # first connection, then opened alone
+            if self.filtered_tables is None or not self.relations_filter.is_set:
+                conn: gdal.Dataset = gdal.OpenEx(
+                    self.db_connection.pg_connection_uri,
+                    gdal.OF_READONLY | gdal.OF_VECTOR | gdal.OF_VERBOSE_ERROR,
+                    open_options=gdal_open_options,
+                )
+            if self.relations_filter.is_set:
+                if self.filtered_tables is None:
+                    self.conn = conn
+                    self.filtered_tables = self.get_filtered_tables()
+                if not self.filtered_tables:
+                    raise ValueError("no table matches schemas and tables filters.")
+                conn = gdal.OpenEx(
+                    self.db_connection.pg_connection_uri,
+                    gdal.OF_READONLY | gdal.OF_VECTOR | gdal.OF_VERBOSE_ERROR,
+                    open_options=[
+                        *gdal_open_options,
+                        f"TABLES={','.join(self.filtered_tables)}",
+                    ],
+                )
+            if log_layers_count:
+                logger.info(
+                    f"Access granted: connecting people to {conn.GetLayerCount()} "
+                    "tables!"
+                )
             self.db_connection.state_msg = "OK"
             self.conn = conn
+            self.schemas_names = None
+            self.views_names = None
+            self.postgis_version = None
             return conn
         except Exception as err:
             self.db_connection.state_msg = f"KO: {err}"
             logger.error(f"Connection failed. Check settings. Trace: {err}")
+            self.conn = None
             return None
 
-    @lru_cache
+    def get_filtered_tables(self) -> list[str]:
+        """List spatial tables and views matching filters, as expected by the TABLES
+        open option of the OGR PostgreSQL driver.
+
+        Returns:
+            schema.table names
+        """
+        relations_filter = self.relations_filter.as_sql()
+        if not self.views_included:
+            relations_filter += " AND c.relkind NOT IN ('v', 'm')"
+        rows = self.execute_sql(
+            SQL_FILTERED_RELATIONS.format(relations_filter=relations_filter)
+        )
+
+        filtered_tables: list[str] = []
+        for row in rows:
+            table_name = f"{row.get('schema_name')}.{row.get('table_name')}"
+            # the TABLES open option can't express these names
+            if any(character in table_name for character in ",()"):
+                logger.warning(f"Table {table_name} can't be filtered: it's skipped.")
+                continue
+            filtered_tables.append(table_name)
+
+        logger.info(f"{len(filtered_tables)} tables match schemas and tables filters.")
+        return filtered_tables
+
     def get_postgis_version(self) -> str | None:
-        """Returns the version of PostGIS extension.
+        """Returns the version of PostGIS extension, read once per connection.
 
         Returns:
             Optional[str]: PostGIS version
         """
+        if self.postgis_version is not None:
+            return self.postgis_version
         try:
             sql: ogr.Layer = self.conn.ExecuteSQL("SELECT PostGIS_full_version();")
             pgis_version: ogr.Feature = sql.GetNextFeature()
             pgis_version = pgis_version.GetFieldAsString(0)
             logger.debug(f"PostGIS full version: {pgis_version}")
             self.db_connection.state_msg = "OK"
+            self.postgis_version = pgis_version
             return pgis_version
         except Exception as err:
             self.db_connection.state_msg = f"KO: {err}"
             logger.error(f"Trying to retrieve PostGIS versions failed. Trace: {err}")
             return None
 
-    @lru_cache
     def get_schemas(self) -> set[str]:
-        """Return unique set of schemas names accessible by the logged user.
+        """Return unique set of schemas names accessible by the logged user, read
+        once per connection.
 
         Returns:
             set[str]: set of schemas names
         """
-        sql_schemas = "select nspname from pg_catalog.pg_namespace;"
-        pg_schemas: ogr.Layer = self.conn.ExecuteSQL(sql_schemas)
-        return {feature["nspname"] for feature in pg_schemas}
+        if self.schemas_names is None:
+            sql_schemas = "select nspname from pg_catalog.pg_namespace;"
+            pg_schemas: ogr.Layer = self.conn.ExecuteSQL(sql_schemas)
+            self.schemas_names = {feature["nspname"] for feature in pg_schemas}
+        return self.schemas_names
+
+    def execute_sql(self, sql: str) -> list[dict]:
+        """Execute a SQL query on the database and fetch every row.
+
+        Args:
+            sql: SQL query
+
+        Returns:
+            rows as dictionaries of column names and values
+        """
+        result_set: ogr.Layer | None = self.conn.ExecuteSQL(sql)
+        if result_set is None:
+            return []
+        try:
+            return [feature.items() for feature in result_set]
+        finally:
+            self.conn.ReleaseResultSet(result_set)
+
+    def read_catalog(
+        self, with_statistics: bool = True, skipped_layers: set[str] | None = None
+    ) -> dict[str, CatalogRelation]:
+        """Describe spatial tables and views from the database catalog with a few
+        set-based queries. Relations which can't be described as OGR would are left
+        out: they have to be read with OGR.
+
+        Args:
+            with_statistics: also read features count and extent. If False, they have
+                to be read with read_catalog_statistics. Defaults to True.
+            skipped_layers: names of layers not to describe, e.g. unchanged tables.
+                Defaults to None.
+
+        Returns:
+            relations described from the catalog, by OGR layer name
+        """
+        try:
+            rows = self.execute_sql(
+                SQL_CATALOG_RELATIONS.format(
+                    relations_filter=self.relations_filter.as_sql()
+                )
+            )
+        except RuntimeError as err:
+            logger.warning(
+                f"Unable to read the database catalog, every table is read with OGR. "
+                f"Trace: {err}"
+            )
+            return {}
+
+        # tables with several geometry columns are read by OGR as multi-geometry
+        # fields layers
+        geometry_columns_count = Counter(row.get("relation_oid") for row in rows)
+        relations: dict[int, CatalogRelation] = {
+            row.get("relation_oid"): CatalogRelation(
+                relation_oid=row.get("relation_oid"),
+                schema_name=row.get("schema_name"),
+                table_name=row.get("table_name"),
+                layer_name=get_layer_name(
+                    schema_name=row.get("schema_name"),
+                    table_name=row.get("table_name"),
+                    current_schema=row.get("current_schema"),
+                ),
+                relation_kind=row.get("relation_kind"),
+                geometry_column=row.get("geometry_column"),
+                geometry_type=row.get("geometry_type"),
+                coord_dimension=row.get("coord_dimension"),
+                srid=row.get("srid") or 0,
+                is_geography=bool(row.get("is_geography")),
+                srs_auth_name=row.get("srs_auth_name"),
+                srs_auth_srid=row.get("srs_auth_srid"),
+                srs_wkt=row.get("srs_wkt"),
+                relation_size=row.get("relation_size"),
+                estimated_rows=row.get("estimated_rows"),
+            )
+            for row in rows
+            if geometry_columns_count[row.get("relation_oid")] == 1
+            and get_layer_name(
+                schema_name=row.get("schema_name"),
+                table_name=row.get("table_name"),
+                current_schema=row.get("current_schema"),
+            )
+            not in (skipped_layers or ())
+            and parse_geometry_type(
+                geometry_type=row.get("geometry_type"),
+                coord_dimension=row.get("coord_dimension"),
+            )
+        }
+        if not relations:
+            return {}
+
+        # fields
+        try:
+            rows = self.execute_sql(
+                SQL_CATALOG_COLUMNS.format(
+                    relations_oids=", ".join(f"{oid}" for oid in relations)
+                )
+            )
+        except RuntimeError as err:
+            logger.warning(
+                f"Unable to read columns from the database catalog, every table is "
+                f"read with OGR. Trace: {err}"
+            )
+            return {}
+
+        columns_by_relation: dict[int, list[tuple]] = {}
+        for row in rows:
+            columns_by_relation.setdefault(row.get("relation_oid"), []).append(
+                (
+                    row.get("column_name"),
+                    row.get("type_name"),
+                    row.get("format_type"),
+                    row.get("column_comment"),
+                    bool(row.get("is_primary_key")),
+                )
+            )
+        fid_column_name = gdal.GetConfigOption("PGSQL_OGR_FID", "ogc_fid")
+        for relation_oid, relation in relations.items():
+            describe_columns(
+                relation=relation,
+                columns=columns_by_relation.get(relation_oid, []),
+                fid_column_name=fid_column_name,
+            )
+
+        # features count, extent and sampled geometry type
+        described_relations = [
+            relation for relation in relations.values() if relation.is_describable
+        ]
+        if with_statistics:
+            self.read_catalog_statistics(relations=described_relations)
+
+        catalog = {
+            relation.layer_name: relation
+            for relation in described_relations
+            if relation.is_describable
+        }
+        logger.info(
+            f"{len(catalog)} tables described from the database catalog, the others "
+            "are read with OGR."
+        )
+        return catalog
+
+    def read_catalog_statistics(self, relations: list[CatalogRelation]):
+        """Read features count and extent of relations, with batched queries, and
+        sample geometry types of generic geometry columns. Statistics of large
+        relations are estimated in fast mode. Relations whose exact query fails are
+        marked as not describable.
+
+        Args:
+            relations: relations to complete
+        """
+        queries: dict[int, str] = {}
+        sampled_relations: list[CatalogRelation] = []
+        for relation in relations:
+            relation.statistics_mode = self.get_relation_statistics_mode(
+                relation_size=relation.relation_size
+            )
+            if relation.statistics_mode == StatisticsModes.estimated.value:
+                relation.features_count = self.get_estimated_features_count(
+                    estimated_rows=relation.estimated_rows
+                )
+
+            if (
+                parse_geometry_type(
+                    geometry_type=relation.geometry_type,
+                    coord_dimension=relation.coord_dimension,
+                )[0]
+                == "GEOMETRY"
+            ):
+                sampled_relations.append(relation)
+            # extent of geography columns can't be estimated
+            if relation.statistics_mode == StatisticsModes.exact.value or (
+                relation.statistics_mode == StatisticsModes.estimated.value
+                and not relation.is_geography
+            ):
+                queries[relation.relation_oid] = get_statistics_query(
+                    relation=relation,
+                    estimated=relation.statistics_mode
+                    == StatisticsModes.estimated.value,
+                )
+
+        self.read_catalog_geometry_samples(relations=sampled_relations)
+        if not queries:
+            return
+
+        relations_by_oid = {relation.relation_oid: relation for relation in relations}
+
+        # views run their whole query: they are read one by one, under cost guard
+        for relation_oid in [
+            oid for oid in queries if relations_by_oid[oid].relation_kind == "v"
+        ]:
+            for row in self.read_view_statistics(
+                relation=relations_by_oid[relation_oid], sql=queries.pop(relation_oid)
+            ):
+                self.set_catalog_statistics(
+                    relation=relations_by_oid[relation_oid], row=row
+                )
+
+        queries_oids = list(queries)
+        for idx_batch in range(
+            0, len(queries_oids), self.CATALOG_STATISTICS_BATCH_SIZE
+        ):
+            batch_oids = queries_oids[
+                idx_batch : idx_batch + self.CATALOG_STATISTICS_BATCH_SIZE
+            ]
+            try:
+                rows = self.execute_sql(
+                    " UNION ALL ".join(queries[oid] for oid in batch_oids)
+                )
+            except RuntimeError as err:
+                logger.debug(
+                    f"Reading statistics of {len(batch_oids)} tables failed, they are "
+                    f"read one by one. Trace: {err}"
+                )
+                rows = []
+                for relation_oid in batch_oids:
+                    try:
+                        rows.extend(self.execute_sql(queries[relation_oid]))
+                    except RuntimeError as err:
+                        logger.debug(
+                            f"Reading statistics of "
+                            f"{relations_by_oid[relation_oid].layer_name} failed. "
+                            f"Trace: {err}"
+                        )
+                        # planner statistics may be missing: estimated extent is
+                        # then left empty
+                        if relations_by_oid[relation_oid].statistics_mode != (
+                            StatisticsModes.estimated.value
+                        ):
+                            relations_by_oid[relation_oid].is_describable = False
+
+            for row in rows:
+                self.set_catalog_statistics(
+                    relation=relations_by_oid[row.get("relation_oid")], row=row
+                )
+
+    def read_catalog_geometry_samples(self, relations: list[CatalogRelation]):
+        """Sample geometry types of relations with a generic geometry column, one
+        relation at a time under the sampling timeout. Relations whose sample fails
+        are marked as not describable.
+
+        Args:
+            relations: relations to complete
+        """
+        if not relations:
+            return
+
+        with self.statement_timeout(timeout=self.GEOMETRY_SAMPLE_TIMEOUT):
+            for relation in relations:
+                try:
+                    rows = self.execute_sql(
+                        get_geometry_sample_query(
+                            relation_name=relation.quoted_name,
+                            geometry_expression=relation.geometry_expression,
+                            sample_size=self.GEOMETRY_SAMPLE_SIZE,
+                            estimated_rows=(
+                                relation.estimated_rows
+                                if relation.relation_kind in ("r", "m")
+                                else None
+                            ),
+                        )
+                    )
+                except RuntimeError as err:
+                    logger.debug(
+                        f"Sampling geometry types of {relation.layer_name} failed: "
+                        f"it's left to OGR. Trace: {err}"
+                    )
+                    relation.is_describable = False
+                    continue
+                relation.sampled_geometry_types = parse_sampled_geometry_types(
+                    rows[0].get("sampled_geometry_types") if rows else None
+                )
+
+    @staticmethod
+    def set_catalog_statistics(relation: CatalogRelation, row: dict):
+        """Complete a relation with a row of its statistics query.
+
+        Args:
+            relation: relation to complete
+            row: features count and extent
+        """
+        if relation.statistics_mode == StatisticsModes.exact.value:
+            relation.features_count = row.get("features_count")
+        relation.extent = tuple(
+            None if row.get(coord) is None else round(row.get(coord), 2)
+            for coord in ("xmin", "xmax", "ymin", "ymax")
+        )
+
+    def read_view_statistics(self, relation: CatalogRelation, sql: str) -> list[dict]:
+        """Run the statistics query of a view if its planner cost is acceptable, with
+        a statement timeout. Too expensive views are marked as skipped.
+
+        Args:
+            relation: view to read
+            sql: statistics query
+
+        Returns:
+            rows of the statistics query, empty if it has not been run or failed
+        """
+        skipped_reason = self.check_query_cost(sql=sql)
+        if skipped_reason is None:
+            try:
+                with self.statement_timeout():
+                    return self.execute_sql(sql)
+            except RuntimeError as err:
+                if "statement timeout" not in f"{err}":
+                    logger.debug(
+                        f"Reading statistics of {relation.layer_name} failed. "
+                        f"Trace: {err}"
+                    )
+                    relation.is_describable = False
+                    return []
+                skipped_reason = (
+                    f"too expensive: longer than {self.view_statement_timeout} s"
+                )
+
+        logger.warning(f"View {relation.layer_name} skipped: {skipped_reason}.")
+        relation.skipped_reason = skipped_reason
+        relation.statistics_mode = StatisticsModes.skip.value
+        return []
+
+    def check_query_cost(self, sql: str) -> str | None:
+        """Compare the planner cost estimate of a query with the maximum cost of views.
+
+        Args:
+            sql: query to check
+
+        Returns:
+            reason to skip the query if it's too expensive, None otherwise
+        """
+        if not self.view_max_cost:
+            return None
+
+        try:
+            rows = self.execute_sql(f"EXPLAIN {sql}")
+            total_cost = get_plan_total_cost(
+                query_plan=next(iter(rows[0].values()), None)
+            )
+        except (RuntimeError, IndexError) as err:
+            logger.debug(f"Unable to get the cost of query. Trace: {err}")
+            return None
+
+        if total_cost is None or total_cost <= self.view_max_cost:
+            return None
+        return (
+            f"too expensive: planner cost {total_cost:.0f} > {self.view_max_cost:.0f}"
+        )
+
+    @contextmanager
+    def statement_timeout(
+        self, enabled: bool = True, timeout: float | None = None
+    ) -> Iterator[None]:
+        """Context manager limiting the duration of each query run within it,
+        restoring the previous timeout when exiting.
+
+        Args:
+            enabled: apply the timeout. Defaults to True.
+            timeout: timeout in seconds. Defaults to None, which uses the views
+                statement timeout.
+        """
+        if timeout is None:
+            timeout = self.view_statement_timeout
+        if not enabled or not timeout:
+            yield
+            return
+
+        previous_timeout = self.execute_sql(
+            "SELECT current_setting('statement_timeout') AS statement_timeout"
+        )[0].get("statement_timeout")
+        self.execute_sql(f"SET statement_timeout = {int(timeout * 1000)}")
+        try:
+            yield
+        finally:
+            self.execute_sql(
+                f"SET statement_timeout = {quote_literal(previous_timeout)}"
+            )
+
+    @staticmethod
+    def mark_skipped(metadataset: MetaDatabaseTable, reason: str):
+        """Record a view whose statistics have not been read, keeping its structure.
+
+        Args:
+            metadataset: metadataset of the view
+            reason: why statistics have been skipped
+        """
+        metadataset.statistics_mode = StatisticsModes.skip.value
+        metadataset.features_objects_count = None
+        metadataset.bbox = (None, None, None, None)
+        metadataset.processing_succeeded = False
+        metadataset.processing_error_type = "skipped"
+        metadataset.processing_error_msg = f"skipped: {reason}"
+
+    def get_views_names(self) -> frozenset[str]:
+        """List views of the database, read after tables and under cost guard. Views
+        are listed once per connection.
+
+        Returns:
+            OGR layer names of views
+        """
+        if not self.views_included:
+            return frozenset()
+        if self.views_names is not None:
+            return self.views_names
+
+        try:
+            rows = self.execute_sql(
+                SQL_CATALOG_VIEWS.format(
+                    relations_filter=self.relations_filter.as_sql()
+                )
+            )
+        except RuntimeError as err:
+            logger.warning(f"Unable to list views. Trace: {err}")
+            self.views_names = frozenset()
+            return self.views_names
+
+        self.views_names = frozenset(
+            get_layer_name(
+                schema_name=row.get("schema_name"),
+                table_name=row.get("table_name"),
+                current_schema=row.get("current_schema"),
+            )
+            for row in rows
+        )
+        return self.views_names
+
+    def get_relation_statistics_mode(self, relation_size: int | None) -> str:
+        """Determine how features count and extent of a relation are read. In fast
+        mode, they are estimated from planner statistics for relations larger than
+        the threshold and computed for smaller ones.
+
+        Args:
+            relation_size: storage size of the relation, in bytes. None or 0 for
+                views.
+
+        Returns:
+            exact, estimated or skip
+        """
+        if self.stats_mode == StatisticsModes.skip:
+            return StatisticsModes.skip.value
+        if (
+            self.stats_mode == StatisticsModes.fast
+            and relation_size
+            and relation_size >= self.exact_stats_below_mb * 1024 * 1024
+        ):
+            return StatisticsModes.estimated.value
+        return StatisticsModes.exact.value
+
+    @staticmethod
+    def get_estimated_features_count(estimated_rows: float | None) -> int | None:
+        """Convert the planner estimate of rows count into a features count.
+
+        Args:
+            estimated_rows: pg_class.reltuples, negative (or 0 before PostgreSQL 14)
+                if the relation has never been analyzed
+
+        Returns:
+            estimated features count or None if unknown
+        """
+        if estimated_rows is None or estimated_rows <= 0:
+            return None
+        return round(estimated_rows)
+
+    def get_sampled_geometry_types(self, layer: ogr.Layer) -> list[str] | None:
+        """Get geometry types of a sample of features of a layer read with OGR, with
+        a SQL query bounded in rows and duration instead of an OGR cursor.
+
+        Args:
+            layer: PostGIS layer
+
+        Returns:
+            sorted distinct geometry types or None if sampling failed
+        """
+        layer_name: str = layer.GetName()
+        if not (geometry_column := layer.GetGeometryColumn()):
+            return None
+        relation_name = self.get_relation_name(layer_name=layer_name)
+
+        try:
+            rows = self.execute_sql(
+                SQL_RELATION_ESTIMATES.format(
+                    relation_name=quote_literal(relation_name)
+                )
+            )
+            with self.statement_timeout(timeout=self.GEOMETRY_SAMPLE_TIMEOUT):
+                sample_rows = self.execute_sql(
+                    get_geometry_sample_query(
+                        relation_name=relation_name,
+                        geometry_expression=f"{quote_identifier(geometry_column)}"
+                        "::geometry",
+                        sample_size=self.GEOMETRY_SAMPLE_SIZE,
+                        estimated_rows=(
+                            rows[0].get("estimated_rows")
+                            if rows and rows[0].get("relation_kind") in ("r", "m")
+                            else None
+                        ),
+                    )
+                )
+        except (RuntimeError, IndexError) as err:
+            logger.error(
+                f"Impossible to sample geometry types of {layer_name}. Trace: {err}"
+            )
+            return None
+
+        geometry_types = parse_sampled_geometry_types(
+            sample_rows[0].get("sampled_geometry_types") if sample_rows else None
+        )
+        if not geometry_types:
+            logger.warning(
+                f"Unable to determine geometry type of {layer_name}: no geometry "
+                "found in sampled features."
+            )
+            return None
+        return geometry_types
+
+    def get_layer_estimates(
+        self, layer: ogr.Layer
+    ) -> tuple[int | None, tuple[float | None, ...]] | None:
+        """Estimate features count and extent of a layer read with OGR, from planner
+        statistics, if the relation is larger than the threshold.
+
+        Args:
+            layer: PostGIS layer
+
+        Returns:
+            estimated features count and extent or None if they have to be computed
+        """
+        layer_name: str = layer.GetName()
+        schema_name, table_name = self.split_layer_name(layer_name=layer_name)
+        relation_name = self.get_relation_name(layer_name=layer_name)
+
+        try:
+            rows = self.execute_sql(
+                SQL_RELATION_ESTIMATES.format(
+                    relation_name=quote_literal(relation_name)
+                )
+            )
+        except RuntimeError as err:
+            logger.debug(f"Unable to get size of {layer_name}. Trace: {err}")
+            return None
+        if not rows:
+            return None
+        if (
+            self.get_relation_statistics_mode(
+                relation_size=rows[0].get("relation_size")
+            )
+            != StatisticsModes.estimated.value
+        ):
+            return None
+
+        extent = (None, None, None, None)
+        if geometry_column := layer.GetGeometryColumn():
+            estimated_extent = get_estimated_extent_expression(
+                schema_name=schema_name,
+                table_name=table_name,
+                geometry_column=geometry_column,
+            )
+            try:
+                extent_rows = self.execute_sql(
+                    f"SELECT ST_XMin({estimated_extent})::float8 AS xmin, "
+                    f"ST_XMax({estimated_extent})::float8 AS xmax, "
+                    f"ST_YMin({estimated_extent})::float8 AS ymin, "
+                    f"ST_YMax({estimated_extent})::float8 AS ymax"
+                )
+                extent = tuple(
+                    (
+                        None
+                        if extent_rows[0].get(coord) is None
+                        else round(extent_rows[0].get(coord), 2)
+                    )
+                    for coord in ("xmin", "xmax", "ymin", "ymax")
+                )
+            except (RuntimeError, IndexError, TypeError) as err:
+                logger.debug(f"Unable to estimate extent of {layer_name}. Trace: {err}")
+
+        return (
+            self.get_estimated_features_count(
+                estimated_rows=rows[0].get("estimated_rows")
+            ),
+            extent,
+        )
+
+    @staticmethod
+    def split_layer_name(layer_name: str) -> tuple[str | None, str]:
+        """Split an OGR layer name into schema and table names.
+
+        Args:
+            layer_name: OGR layer name, prefixed with the schema if it's not the
+                current one
+
+        Returns:
+            schema name (None for the current schema) and table name
+        """
+        if "." in layer_name:
+            schema_name, table_name = layer_name.split(".", 1)
+            return schema_name, table_name
+        return None, layer_name
+
+    def get_relation_name(self, layer_name: str) -> str:
+        """Get the quoted relation name of an OGR layer, to be used in SQL queries.
+
+        Args:
+            layer_name: OGR layer name
+
+        Returns:
+            quoted relation name
+        """
+        schema_name, table_name = self.split_layer_name(layer_name=layer_name)
+        if schema_name is None:
+            return quote_identifier(table_name)
+        return f"{quote_identifier(schema_name)}.{quote_identifier(table_name)}"
+
+    def get_catalog_geometry_type(self, relation: CatalogRelation) -> str | None:
+        """Get the geometry type of a relation described from the catalog, named as
+        OGR does.
+
+        Args:
+            relation: relation described from the catalog
+
+        Returns:
+            geometry type or None
+        """
+        geometry_type, has_z, has_m = parse_geometry_type(
+            geometry_type=relation.geometry_type,
+            coord_dimension=relation.coord_dimension,
+        )
+        if geometry_type != "GEOMETRY":
+            return self.get_ogr_geometry_type_name(
+                geometry_type=geometry_type, has_z=has_z, has_m=has_m
+            )
+
+        if not relation.sampled_geometry_types:
+            return None
+        return ", ".join(relation.sampled_geometry_types)
+
+    def infos_dataset_from_catalog(
+        self, relation: CatalogRelation
+    ) -> MetaDatabaseTable:
+        """Build metadata of a PostGIS table or view described from the catalog, the
+        same way as infos_dataset does from an OGR layer.
+
+        Args:
+            relation: relation described from the catalog
+
+        Returns:
+            metadataset
+        """
+        metadataset = MetaDatabaseTable(
+            format_gdal_long_name=self.conn.GetDriver().LongName,
+            format_gdal_short_name=self.conn.GetDriver().ShortName,
+            database_connection=self.db_connection,
+            dataset_type="sgbd_postgis",
+        )
+        self.prepare_reading(metadataset=metadataset)
+
+        # sgbd info
+        if not self.db_connection.sgbd_schemas:
+            self.db_connection.sgbd_schemas = self.get_schemas()
+        if not self.db_connection.sgbd_version:
+            self.db_connection.sgbd_version = self.get_postgis_version()
+
+        metadataset.name = relation.layer_name
+        logger.info(f"Analyzing layer (from catalog): {metadataset.name}")
+        if "." in metadataset.name:
+            metadataset.schema_name = metadataset.name.split(".")[0]
+
+        metadataset.statistics_mode = relation.statistics_mode
+        metadataset.features_objects_count = relation.features_count
+        if (
+            metadataset.features_objects_count == 0
+            and relation.statistics_mode == StatisticsModes.exact.value
+        ):
+            self.counter_alerts += 1
+            self.erratum(target_container=metadataset, err_msg="err_nobjet")
+            return metadataset
+
+        if relation.skipped_reason is not None:
+            self.mark_skipped(metadataset=metadataset, reason=relation.skipped_reason)
+
+        metadataset.feature_attributes = tuple(relation.feature_attributes)
+        metadataset.geometry_type = self.get_catalog_geometry_type(relation=relation)
+        (
+            metadataset.crs_name,
+            metadataset.crs_registry,
+            metadataset.crs_registry_code,
+            metadataset.crs_type,
+        ) = self.get_catalog_srs_details(
+            srid=relation.srid,
+            srs_auth_name=relation.srs_auth_name,
+            srs_auth_srid=relation.srs_auth_srid,
+            srs_wkt=relation.srs_wkt,
+        )
+        metadataset.bbox = relation.extent
+
+        return metadataset
+
+    def read_catalog_rasters(self) -> list[CatalogRaster]:
+        """Describe raster columns from the raster_columns view with a single query,
+        instead of opening each coverage with the PostGISRaster driver.
+
+        Returns:
+            raster columns matching filters, overview tables apart
+        """
+        try:
+            rows = self.execute_sql(
+                SQL_CATALOG_RASTERS.format(
+                    relations_filter=self.relations_filter.as_sql()
+                )
+            )
+        except RuntimeError as err:
+            logger.info(
+                "Unable to list PostGIS rasters (postgis_raster extension may be "
+                f"missing). Trace: {err}"
+            )
+            return []
+
+        logger.info(f"{len(rows)} raster tables described from the database catalog.")
+        return [parse_raster_row(row=row) for row in rows]
+
+    def infos_raster_from_catalog(self, raster: CatalogRaster) -> MetaDatabaseRaster:
+        """Build metadata of a PostGIS raster column described from the catalog.
+
+        Args:
+            raster: raster column described from the catalog
+
+        Returns:
+            metadataset
+        """
+        metadataset = MetaDatabaseRaster(
+            name=raster.layer_name,
+            format_gdal_long_name="PostGIS Raster driver",
+            format_gdal_short_name="PostGISRaster",
+            database_connection=self.db_connection,
+            dataset_type="sgbd_postgis",
+            schema_name=raster.schema_name,
+            raster_column=raster.raster_column,
+        )
+        self.prepare_reading(metadataset=metadataset)
+        logger.info(f"Analyzing raster (from catalog): {metadataset.name}")
+        # no features statistics: size and extent come from raster constraints
+        metadataset.statistics_mode = None
+
+        metadataset.columns_count, metadataset.rows_count = raster.size
+        metadataset.pixel_width = (
+            None if raster.scale_x is None else round(raster.scale_x, 3)
+        )
+        metadataset.pixel_height = (
+            None if raster.scale_y is None else round(raster.scale_y, 3)
+        )
+        metadataset.origin_x, metadataset.origin_y = raster.origin
+        metadataset.bbox = raster.extent
+        metadataset.bands_count = raster.bands_count
+        metadataset.data_type = ", ".join(sorted(set(raster.pixel_types))) or None
+        metadataset.pixel_types = raster.pixel_types
+        metadataset.nodata_values = raster.nodata_values
+        metadataset.is_out_db = raster.is_out_db
+
+        metadataset.tile_width = raster.tile_width
+        metadataset.tile_height = raster.tile_height
+        metadataset.tiles_count = raster.tiles_count
+        metadataset.overviews = raster.overviews
+        metadataset.storage_size = raster.storage_size
+
+        (
+            metadataset.crs_name,
+            metadataset.crs_registry,
+            metadataset.crs_registry_code,
+            metadataset.crs_type,
+        ) = self.get_catalog_srs_details(
+            srid=raster.srid,
+            srs_auth_name=raster.srs_auth_name,
+            srs_auth_srid=raster.srs_auth_srid,
+            srs_wkt=raster.srs_wkt,
+        )
+
+        return metadataset
+
+    def iter_metadatasets(self) -> Iterator[MetaDatabaseTable | MetaDatabaseRaster]:
+        """Read every table and view of the database: from the catalog when
+        possible, with OGR otherwise. Layers are yielded in OGR order, views after
+        tables, then rasters described from the catalog.
+
+        Yields:
+            metadataset of each layer
+        """
+        cached_metadatasets = self.get_cached_metadatasets()
+
+        pool_size = self.get_pool_size()
+        if pool_size > 1:
+            metadatasets = self.iter_metadatasets_pooled(
+                pool_size=pool_size, cached_metadatasets=cached_metadatasets
+            )
+        else:
+            metadatasets = self.iter_metadatasets_sequential(
+                cached_metadatasets=cached_metadatasets
+            )
+
+        for metadataset in metadatasets:
+            if cached_metadatasets.get(metadataset.name) is metadataset:
+                self.count_cache_hits += 1
+            else:
+                self.store_in_cache(metadataset=metadataset)
+            yield metadataset
+
+        # rasters are described by a single catalog query: they are not cached
+        for raster in self.read_catalog_rasters():
+            yield self.infos_raster_from_catalog(raster=raster)
+
+        if self.inventory_cache is not None:
+            self.inventory_cache.flush()
+            logger.info(
+                f"PostGIS tables: {self.count_cache_hits} unchanged (from cache) - "
+                f"{self.count_cache_misses} read."
+            )
+
+    def iter_metadatasets_sequential(
+        self, cached_metadatasets: dict[str, MetaDatabaseTable]
+    ) -> Iterator[MetaDatabaseTable]:
+        """Read tables, then views, one after another with the current connection.
+
+        Args:
+            cached_metadatasets: metadatasets of unchanged tables, by layer name
+
+        Yields:
+            metadataset of each layer
+        """
+        catalog = self.read_catalog(skipped_layers=set(cached_metadatasets))
+        views_names = self.get_views_names()
+        layers: list[ogr.Layer] = [
+            self.conn.GetLayerByIndex(idx_layer)
+            for idx_layer in range(self.conn.GetLayerCount())
+        ]
+        # views are queued behind tables, so that cheap objects finish first
+        for layer in sorted(layers, key=lambda layer: layer.GetName() in views_names):
+            if layer.GetName() in cached_metadatasets:
+                yield cached_metadatasets[layer.GetName()]
+                continue
+            relation = catalog.get(layer.GetName())
+            if relation is None:
+                yield self.infos_dataset(layer=layer)
+            else:
+                yield self.infos_dataset_from_catalog(relation=relation)
+
+    def get_cache_key(self, layer_name: str) -> str:
+        """Build the inventory cache key of a table, without credentials.
+
+        Args:
+            layer_name: OGR layer name
+
+        Returns:
+            cache key
+        """
+        if self.db_connection.service_name:
+            database = f"service={self.db_connection.service_name}"
+        else:
+            database = (
+                f"{self.db_connection.user_name}@{self.db_connection.host}:"
+                f"{self.db_connection.port}/{self.db_connection.database_name}"
+            )
+        return f"postgis://{database}/{layer_name}"
+
+    def read_fingerprints(self) -> dict[str, str]:
+        """Read fingerprints of tables from the database statistics and catalog.
+
+        Returns:
+            fingerprints by OGR layer name, for tables which have one
+        """
+        try:
+            rows = self.execute_sql(
+                SQL_CATALOG_FINGERPRINTS.format(
+                    relations_filter=self.relations_filter.as_sql()
+                )
+            )
+        except RuntimeError as err:
+            logger.warning(
+                f"Unable to read tables fingerprints, every table is read. Trace: {err}"
+            )
+            return {}
+
+        return {
+            get_layer_name(
+                schema_name=row.get("schema_name"),
+                table_name=row.get("table_name"),
+                current_schema=row.get("current_schema"),
+            ): row.get("fingerprint")
+            for row in rows
+            if row.get("fingerprint")
+        }
+
+    def get_cached_metadatasets(self) -> dict[str, MetaDatabaseTable]:
+        """Get metadatasets of tables which have not changed since they were cached.
+        Statistics computed exactly are good for every mode.
+
+        Returns:
+            cached metadatasets by OGR layer name
+        """
+        if self.inventory_cache is None:
+            return {}
+
+        self.tables_fingerprints = self.read_fingerprints()
+        reusable_statistics_modes = {None, StatisticsModes.exact.value}
+        reusable_statistics_modes.add(self.stats_mode.value)
+        if self.stats_mode == StatisticsModes.fast:
+            reusable_statistics_modes.add(StatisticsModes.estimated.value)
+
+        cached_metadatasets: dict[str, MetaDatabaseTable] = {}
+        for layer_name, fingerprint in self.tables_fingerprints.items():
+            metadataset = self.inventory_cache.get(
+                dataset_path=self.get_cache_key(layer_name=layer_name),
+                fingerprint=fingerprint,
+            )
+            if (
+                metadataset is None
+                or metadataset.statistics_mode not in reusable_statistics_modes
+            ):
+                continue
+            metadataset.database_connection = self.db_connection
+            cached_metadatasets[layer_name] = metadataset
+
+        logger.info(
+            f"{len(cached_metadatasets)} tables have not changed since the previous "
+            "run: they are not read again."
+        )
+        return cached_metadatasets
+
+    def store_in_cache(self, metadataset: MetaDatabaseTable):
+        """Store the metadataset of a table freshly read into the inventory cache, if
+        it has a fingerprint and has been read without error.
+
+        Args:
+            metadataset: metadataset to store
+        """
+        if self.inventory_cache is None:
+            return
+
+        self.count_cache_misses += 1
+        fingerprint = self.tables_fingerprints.get(metadataset.name)
+        if fingerprint is None or metadataset.processing_succeeded is False:
+            return
+
+        # connection parameters (password included) are not stored
+        self.inventory_cache.store(
+            dataset_path=self.get_cache_key(layer_name=metadataset.name),
+            metadataset=replace(metadataset, database_connection=None),
+            fingerprint=fingerprint,
+        )
+
+    def get_pool_size(self) -> int:
+        """Determine how many connections are used to read tables, within the
+        requested maximum and leaving half of the free server connections to other
+        clients.
+
+        Returns:
+            number of connections, including the current one
+        """
+        if self.max_connections <= 1:
+            return 1
+
+        try:
+            rows = self.execute_sql(SQL_FREE_CONNECTIONS)
+            free_connections = rows[0].get("free_connections")
+        except (RuntimeError, IndexError) as err:
+            logger.warning(
+                f"Unable to check available connections on the server: tables are "
+                f"read with a single connection. Trace: {err}"
+            )
+            return 1
+
+        pool_size = 1 + min(self.max_connections - 1, max(free_connections, 0) // 2)
+        if pool_size < self.max_connections:
+            logger.warning(
+                f"Only {free_connections} connections available on the server: "
+                f"{pool_size} connections used instead of {self.max_connections}."
+            )
+        return pool_size
+
+    def get_pooled_reader(self, conn: ogr.DataSource | None = None) -> "ReadPostGIS":
+        """Create a reader with the same settings and database connection model, to
+        read tables in another thread.
+
+        Args:
+            conn: OGR connection to use. If None, a new connection is opened.
+                Defaults to None.
+
+        Returns:
+            reader, whose connection is None if it failed
+        """
+        reader = ReadPostGIS(
+            views_included=self.views_included,
+            stats_mode=self.stats_mode,
+            exact_stats_below_mb=self.exact_stats_below_mb,
+            relations_filter=self.relations_filter,
+            view_max_cost=self.view_max_cost,
+            view_statement_timeout=self.view_statement_timeout,
+        )
+        reader.filtered_tables = self.filtered_tables
+        # share connection model, to fill schemas and version only once
+        reader.db_connection = self.db_connection
+        if conn is None:
+            reader.get_connection(log_layers_count=False)
+        else:
+            reader.conn = conn
+        return reader
+
+    def read_pooled_partitions(
+        self,
+        partitions: SimpleQueue,
+        layers_names: list[str],
+        catalog: dict[str, CatalogRelation],
+        results: dict[int, MetaDatabaseTable],
+        results_ready: Condition,
+        stop_reading: Event,
+    ):
+        """Read tables of partitions taken from a shared queue until it's empty. Run
+        in a worker thread, with the reader's own connection.
+
+        Args:
+            partitions: queue of layers indexes lists, one per schema
+            layers_names: layers names in OGR order
+            catalog: relations described from the catalog, without statistics
+            results: metadatasets by layer index, shared with the other workers
+            results_ready: condition notified when a metadataset is stored
+            stop_reading: event set when results are no longer expected
+        """
+        with self:
+            while not stop_reading.is_set():
+                try:
+                    layers_indexes: list[int] = partitions.get_nowait()
+                except Empty:
+                    return
+
+                relations = [
+                    catalog[layers_names[idx_layer]]
+                    for idx_layer in layers_indexes
+                    if layers_names[idx_layer] in catalog
+                ]
+                self.read_catalog_statistics(relations=relations)
+
+                for idx_layer in layers_indexes:
+                    if stop_reading.is_set():
+                        return
+                    relation = catalog.get(layers_names[idx_layer])
+                    if relation is not None and relation.is_describable:
+                        metadataset = self.infos_dataset_from_catalog(relation=relation)
+                    else:
+                        metadataset = self.infos_dataset(
+                            layer=self.conn.GetLayerByName(layers_names[idx_layer])
+                        )
+                    with results_ready:
+                        results[idx_layer] = metadataset
+                        results_ready.notify_all()
+
+    def iter_metadatasets_pooled(
+        self,
+        pool_size: int,
+        cached_metadatasets: dict[str, MetaDatabaseTable] | None = None,
+    ) -> Iterator[MetaDatabaseTable]:
+        """Read tables and views with several connections, each one reading whole
+        schemas. Metadatasets are yielded in OGR order, views after tables, as soon as
+        they are ready.
+
+        Args:
+            pool_size: number of connections, including the current one
+            cached_metadatasets: metadatasets of unchanged tables, by layer name.
+                Defaults to None.
+
+        Yields:
+            metadataset of each layer
+        """
+        cached_metadatasets = cached_metadatasets or {}
+        catalog = self.read_catalog(
+            with_statistics=False, skipped_layers=set(cached_metadatasets)
+        )
+        layers_names: list[str] = [
+            self.conn.GetLayerByIndex(idx_layer).GetName()
+            for idx_layer in range(self.conn.GetLayerCount())
+        ]
+        results: dict[int, MetaDatabaseTable] = {
+            idx_layer: cached_metadatasets[layer_name]
+            for idx_layer, layer_name in enumerate(layers_names)
+            if layer_name in cached_metadatasets
+        }
+
+        # views are queued behind tables, so that cheap objects finish first
+        views_names = self.get_views_names()
+        ordered_indexes = sorted(
+            range(len(layers_names)),
+            key=lambda idx_layer: layers_names[idx_layer] in views_names,
+        )
+
+        # partition by schema, biggest first to balance connections
+        layers_by_schema: dict[tuple[bool, str], list[int]] = {}
+        for idx_layer in ordered_indexes:
+            if idx_layer in results:
+                continue
+            layer_name = layers_names[idx_layer]
+            schema_name = layer_name.split(".")[0] if "." in layer_name else ""
+            layers_by_schema.setdefault(
+                (layer_name in views_names, schema_name), []
+            ).append(idx_layer)
+        partitions = SimpleQueue()
+        for partition_key in sorted(
+            layers_by_schema,
+            key=lambda key: (key[0], -len(layers_by_schema[key])),
+        ):
+            partitions.put(layers_by_schema[partition_key])
+
+        # the current connection is used by the first worker
+        readers = [self.get_pooled_reader(conn=self.conn)]
+        for _ in range(min(pool_size, len(layers_by_schema)) - 1):
+            reader = self.get_pooled_reader()
+            if reader.conn is None:
+                logger.warning(
+                    f"Unable to open another connection, {len(readers)} used. "
+                    f"Trace: {self.db_connection.state_msg}"
+                )
+                break
+            readers.append(reader)
+        logger.info(
+            f"Reading {len(layers_names)} tables in {len(layers_by_schema)} partitions "
+            f"with {len(readers)} connections."
+        )
+
+        results_ready = Condition()
+        stop_reading = Event()
+
+        def notify_results(future: Future):
+            with results_ready:
+                results_ready.notify_all()
+
+        with ThreadPoolExecutor(
+            max_workers=len(readers), thread_name_prefix="dicogis-postgis"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    reader.read_pooled_partitions,
+                    partitions=partitions,
+                    layers_names=layers_names,
+                    catalog=catalog,
+                    results=results,
+                    results_ready=results_ready,
+                    stop_reading=stop_reading,
+                )
+                for reader in readers
+            ]
+            for future in futures:
+                future.add_done_callback(notify_results)
+
+            try:
+                for idx_layer in ordered_indexes:
+                    with results_ready:
+                        results_ready.wait_for(
+                            lambda idx=idx_layer: (
+                                idx in results
+                                or all(future.done() for future in futures)
+                            )
+                        )
+                        metadataset = results.pop(idx_layer, None)
+                    if metadataset is None:
+                        # a worker failed: raise its error
+                        for future in futures:
+                            future.result()
+                        break
+                    yield metadataset
+            finally:
+                stop_reading.set()
+
+        # close connections opened for the pool
+        for reader in readers[1:]:
+            reader.conn = None
 
     def infos_dataset(
         self,
@@ -168,6 +1474,7 @@ class ReadPostGIS(GeoReaderBase):
                 database_connection=self.db_connection,
                 dataset_type="sgbd_postgis",
             )
+        self.prepare_reading(metadataset=metadataset)
 
         # check layer type
         if not isinstance(layer, ogr.Layer):
@@ -192,10 +1499,36 @@ class ReadPostGIS(GeoReaderBase):
         metadataset.name = layer.GetName()
         logger.info(f"Analyzing layer: {metadataset.name}")
 
-        # raising forbidden access
+        # large tables are estimated in fast mode, without reading them
+        layer_estimates = None
+        if self.stats_mode == StatisticsModes.fast:
+            layer_estimates = self.get_layer_estimates(layer=layer)
+
+        # views run their whole query when they are read: cost guard
+        is_guarded_view = (
+            self.stats_mode != StatisticsModes.skip
+            and layer_estimates is None
+            and metadataset.name in self.get_views_names()
+        )
+        skipped_reason = None
+        if is_guarded_view:
+            skipped_reason = self.check_query_cost(
+                sql="SELECT count(*) FROM "
+                f"{self.get_relation_name(layer_name=metadataset.name)}"
+            )
+
+        # raising forbidden access. In exact mode, the count is reused below.
         try:
-            obj = layer.GetFeatureCount()  # get the first object
+            if skipped_reason is not None:
+                features_count = None
+            elif layer_estimates is None:
+                with self.statement_timeout(enabled=is_guarded_view):
+                    features_count = self.get_features_count(layer=layer)
+            else:
+                features_count = layer_estimates[0]
+                metadataset.statistics_mode = StatisticsModes.estimated.value
         except RuntimeError as err:
+            self.gdal_err.record_exception(err)
             if "permission denied" in str(err):
                 mess = str(err).split("\n")[0]
                 self.counter_alerts = self.counter_alerts + 1
@@ -204,10 +1537,16 @@ class ReadPostGIS(GeoReaderBase):
                 )
                 logger.error(f"GDAL: permission denied {layer.GetName()} - {mess}")
                 return metadataset
+            elif "statement timeout" in str(err):
+                features_count = None
+                skipped_reason = (
+                    f"too expensive: longer than {self.view_statement_timeout} s"
+                )
             else:
                 raise err
 
         except Exception as err:
+            self.gdal_err.record_exception(err)
             self.counter_alerts = self.counter_alerts + 1
             self.erratum(
                 target_container=metadataset, src_dataset_layer=layer, err_msg=err
@@ -222,8 +1561,8 @@ class ReadPostGIS(GeoReaderBase):
 
         # basic information
         # features
-        metadataset.features_objects_count = layer.GetFeatureCount()
-        if metadataset.features_objects_count == 0:
+        metadataset.features_objects_count = features_count
+        if metadataset.features_objects_count == 0 and layer_estimates is None:
             """if layer doesn't have any object, return an error"""
             self.counter_alerts += 1
             self.erratum(
@@ -256,7 +1595,19 @@ class ReadPostGIS(GeoReaderBase):
         ) = self.get_srs_details(dataset_or_layer=layer)
 
         # spatial extent
-        metadataset.bbox = self.get_extent_as_tuple(dataset_or_layer=layer)
+        if layer_estimates is not None:
+            metadataset.bbox = layer_estimates[1]
+        elif skipped_reason is None:
+            try:
+                with self.statement_timeout(enabled=is_guarded_view):
+                    metadataset.bbox = self.get_extent_as_tuple(dataset_or_layer=layer)
+            except RuntimeError as err:
+                if "statement timeout" not in str(err):
+                    raise
+                self.gdal_err.record_exception(err)
+                skipped_reason = (
+                    f"too expensive: longer than {self.view_statement_timeout} s"
+                )
 
         # warnings messages
         if self.counter_alerts:
@@ -264,7 +1615,8 @@ class ReadPostGIS(GeoReaderBase):
             metadataset.processing_error_msg = self.gdal_err.err_msg
             metadataset.processing_error_type = self.gdal_err.err_type
 
-        # clean exit
-        del obj
+        if skipped_reason is not None:
+            logger.warning(f"View {metadataset.name} skipped: {skipped_reason}.")
+            self.mark_skipped(metadataset=metadataset, reason=skipped_reason)
 
         return metadataset
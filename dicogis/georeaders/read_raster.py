@@ -13,6 +13,7 @@ from pathlib import Path
 from osgeo import gdal
 
 # package
+from dicogis.constants import StatisticsModes
 from dicogis.georeaders.base_georeader import GeoReaderBase
 from dicogis.models.metadataset import MetaRasterDataset
 from dicogis.utils.check_path import check_var_can_be_path
@@ -33,15 +34,23 @@ class ReadRasters(GeoReaderBase):
 
     def __init__(
         self,
+        stats_mode: StatisticsModes | str = StatisticsModes.exact,
     ):
-        """Initialize module."""
-        super().__init__(dataset_type="flat_raster")
+        """Initialize module.
+
+        Args:
+            stats_mode: statistics mode, only used for vector layers. Accepted to be
+                instantiated like other georeaders. Defaults to exact.
+        """
+        super().__init__(dataset_type="flat_raster", stats_mode=stats_mode)
 
     def infos_dataset(
         self,
         source_path: Path | str,
         metadataset: MetaRasterDataset | None = None,
         tipo: str | None = None,
+        allowed_drivers: tuple[str, ...] | None = None,
+        sibling_files: dict[str, int | None] | None = None,
     ):
         if isinstance(source_path, str):
             check_var_can_be_path(input_var=source_path, raise_error=True)
@@ -53,12 +62,18 @@ class ReadRasters(GeoReaderBase):
                 name=source_path.stem,
                 parent_folder_name=source_path.parent.name,
             )
+        self.prepare_reading(metadataset=metadataset)
 
         # opening dataset
         try:
-            dataset = self.open_dataset_with_gdal(source_dataset=source_path)
+            dataset = self.open_dataset_with_gdal(
+                source_dataset=source_path,
+                allowed_drivers=allowed_drivers,
+                sibling_files=sibling_files,
+            )
         except Exception as err:
             logger.error(f"An error occurred opening '{source_path}'. Trace: {err}")
+            self.gdal_err.record_exception(err)
             self.counter_alerts = self.counter_alerts + 1
             metadataset.format_gdal_long_name = tipo
             self.erratum(
@@ -99,7 +114,9 @@ class ReadRasters(GeoReaderBase):
         # dependencies and total size
         metadataset.files_dependencies = self.list_dependencies(main_dataset=dataset)
         metadataset.storage_size = self.calc_size_full_dataset(
-            source_path=source_path, dependencies=metadataset.files_dependencies
+            source_path=source_path,
+            dependencies=metadataset.files_dependencies,
+            sibling_files=sibling_files,
         )
 
         # SRS
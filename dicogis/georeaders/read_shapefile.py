@@ -0,0 +1,490 @@
+"""Reader for ESRI Shapefiles, reading headers of .shp, .shx and .dbf files instead of
+opening the dataset with OGR.
+
+See: https://www.esri.com/content/dam/esrisites/sitecore-archive/Files/Pdfs/library/whitepapers/pdfs/shapefile.pdf
+"""
+
+# ############################################################################
+# ######### Libraries #############
+# #################################
+
+# Standard library
+import logging
+import struct
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+# 3rd party
+from osgeo import gdal, ogr, osr
+
+# package
+from dicogis.cache.srs_cache import srs_cache
+from dicogis.constants import StatisticsModes
+from dicogis.georeaders.read_vector_flat_dataset import ReadVectorFlatDataset
+from dicogis.models.feature_attributes import AttributeField
+from dicogis.models.metadataset import MetaVectorDataset
+from dicogis.utils.check_path import check_var_can_be_path
+
+# ############################################################################
+# ######### Globals ############
+# ##############################
+
+logger = logging.getLogger(__name__)
+
+# shape types mapped to OGR layer geometry types. Z types are not listed: OGR reads
+# the first shape to know if M values are used, so they are read with OGR.
+SHAPE_TYPES_OGR: dict[int, int] = {
+    1: ogr.wkbPoint,
+    3: ogr.wkbLineString,
+    5: ogr.wkbPolygon,
+    8: ogr.wkbMultiPoint,
+    21: ogr.wkbPointM,
+    23: ogr.wkbLineStringM,
+    25: ogr.wkbPolygonM,
+    28: ogr.wkbMultiPointM,
+}
+
+# ############################################################################
+# ######### Classes #############
+# ###############################
+
+
+class ReadShapefile(ReadVectorFlatDataset):
+    """Reader for ESRI Shapefiles. Geometry type, extent, features count and fields
+    are read from files headers, only the SRS is read with OSR from the .prj file.
+
+    Falls back to OGR for shapefiles whose headers are corrupted or describe
+    something OGR would interpret beyond headers (Z or MultiPatch shapes, uncommon
+    fields types...).
+    """
+
+    def __init__(self, stats_mode: StatisticsModes | str = StatisticsModes.exact):
+        """Class constructor."""
+        super().__init__(dataset_type="flat_vector", stats_mode=stats_mode)
+
+    def infos_dataset(
+        self,
+        source_path: Path | str,
+        metadataset: MetaVectorDataset | None = None,
+        fallback_format: str | None = None,
+        allowed_drivers: tuple[str, ...] | None = None,
+        sibling_files: dict[str, int | None] | None = None,
+    ) -> MetaVectorDataset:
+        """Get metadata from shapefile headers.
+
+        Args:
+            source_path (Union[Path, str]): path to the .shp file.
+            metadataset (Optional[MetaVectorDataset], optional): metadataset object to
+                fill. Defaults to None.
+            fallback_format (Optional[str], optional): format name used as fallback if
+                GDAL fails to open the dataset. Defaults to None.
+            allowed_drivers: GDAL drivers to try first if OGR is used to read the
+                dataset. Defaults to None.
+            sibling_files: files next to the .shp file with their size, as known
+                from the listing. Defaults to None.
+
+        Returns:
+            MetaVectorDataset: metadataset object
+        """
+        if isinstance(source_path, str):
+            check_var_can_be_path(input_var=source_path, raise_error=True)
+            source_path = Path(source_path).resolve()
+
+        try:
+            shape_type, extent = self.read_shp_header(shp_path=source_path)
+            features_count = self.count_shx_records(
+                shx_path=self.get_sidecar_file(
+                    main_path=source_path, extension="shx", sibling_files=sibling_files
+                )
+            )
+            feature_attributes = self.read_dbf_fields(
+                dbf_path=self.get_sidecar_file(
+                    main_path=source_path, extension="dbf", sibling_files=sibling_files
+                )
+            )
+        except (OSError, ValueError, struct.error) as err:
+            logger.debug(
+                f"Shapefile headers of {source_path} can't be read natively, OGR is "
+                f"used instead. Trace: {err}"
+            )
+            return super().infos_dataset(
+                source_path=source_path,
+                metadataset=metadataset,
+                fallback_format=fallback_format,
+                allowed_drivers=allowed_drivers,
+                sibling_files=sibling_files,
+            )
+
+        if metadataset is None:
+            metadataset = MetaVectorDataset(
+                path=source_path,
+                name=source_path.stem,
+                parent_folder_name=source_path.parent.name,
+                dataset_type=self.dataset_type,
+            )
+        self.prepare_reading(metadataset=metadataset)
+
+        # same names as the OGR driver
+        metadataset.format_gdal_long_name = "ESRI Shapefile"
+        metadataset.format_gdal_short_name = "ESRI Shapefile"
+
+        # dependencies and total size
+        metadataset.files_dependencies = self.list_dependencies(
+            main_dataset=source_path, sibling_files=sibling_files
+        )
+        metadataset.storage_size = self.calc_size_full_dataset(
+            source_path=source_path,
+            dependencies=metadataset.files_dependencies,
+            sibling_files=sibling_files,
+        )
+        # Getting basic dates
+        metadataset.storage_date_created = datetime.fromtimestamp(
+            source_path.stat().st_ctime
+        )
+        metadataset.storage_date_updated = datetime.fromtimestamp(
+            source_path.stat().st_mtime
+        )
+
+        # features: header values are exact, whatever the statistics mode, unless
+        # statistics are skipped
+        if self.stats_mode == StatisticsModes.skip:
+            features_count = None
+            extent = (None, None, None, None)
+        metadataset.features_objects_count = features_count
+        if metadataset.features_objects_count == 0:
+            self.counter_alerts += 1
+            self.erratum(
+                target_container=metadataset,
+                src_path=source_path,
+                err_type="err_nobjet",
+            )
+
+        # fields
+        metadataset.feature_attributes = feature_attributes
+
+        # geometry type
+        metadataset.geometry_type = ogr.GeometryTypeToName(SHAPE_TYPES_OGR[shape_type])
+
+        # SRS
+        (
+            metadataset.crs_name,
+            metadataset.crs_registry,
+            metadataset.crs_registry_code,
+            metadataset.crs_type,
+        ) = self.get_srs_details_from_prj(
+            shp_path=source_path, sibling_files=sibling_files
+        )
+
+        # spatial extent, in the same order as OGR: xmin, xmax, ymin, ymax
+        metadataset.bbox = tuple(
+            None if extent[idx] is None else round(extent[idx], 2)
+            for idx in (0, 2, 1, 3)
+        )
+
+        # warnings messages
+        if self.counter_alerts:
+            metadataset.processing_succeeded = False
+            metadataset.processing_error_msg = self.gdal_err.err_msg
+            metadataset.processing_error_type = self.gdal_err.err_type
+
+        return metadataset
+
+    @staticmethod
+    def get_sidecar_file(
+        main_path: Path,
+        extension: str,
+        sibling_files: Iterable[str] | None = None,
+    ) -> Path:
+        """Get a file of the shapefile, looking for lower then upper case extension
+        like OGR does.
+
+        Args:
+            main_path: path to the .shp file
+            extension: extension of the file to get, without dot
+            sibling_files: names of the files next to the .shp file, as known from
+                the listing. If set, the file system is not queried. Defaults to None.
+
+        Raises:
+            FileNotFoundError: if the file doesn't exist
+
+        Returns:
+            path to the file
+        """
+        for candidate_extension in (extension.lower(), extension.upper()):
+            sidecar_path = main_path.with_suffix(f".{candidate_extension}")
+            if sibling_files is None:
+                if sidecar_path.is_file():
+                    return sidecar_path
+            elif sidecar_path.name in sibling_files:
+                return sidecar_path
+
+        raise FileNotFoundError(f"No .{extension} file found for {main_path}.")
+
+    @staticmethod
+    def read_shp_header(
+        shp_path: Path,
+    ) -> tuple[int, tuple[float, float, float, float]]:
+        """Read shape type and bounding box from the 100 bytes header of a .shp file.
+
+        Args:
+            shp_path: path to the .shp file
+
+        Raises:
+            ValueError: if the header is corrupted or the shape type not handled
+
+        Returns:
+            shape type and bounding box (xmin, ymin, xmax, ymax)
+        """
+        with shp_path.open("rb") as shp_file:
+            header = shp_file.read(100)
+
+        if len(header) < 100:
+            raise ValueError("truncated .shp header")
+
+        file_code, file_length = struct.unpack(">i20xi", header[:28])
+        version, shape_type = struct.unpack("<ii", header[28:36])
+        if file_code != 9994 or version != 1000:
+            raise ValueError(f"not a shapefile (code {file_code}, version {version})")
+        if file_length * 2 != shp_path.stat().st_size:
+            raise ValueError(
+                f"file length in header ({file_length * 2}) differs from actual size"
+            )
+        if shape_type not in SHAPE_TYPES_OGR:
+            raise ValueError(f"shape type {shape_type} is not read natively")
+
+        return shape_type, struct.unpack("<4d", header[36:68])
+
+    @staticmethod
+    def count_shx_records(shx_path: Path) -> int:
+        """Count records from the header of a .shx file, like OGR does.
+
+        Args:
+            shx_path: path to the .shx file
+
+        Raises:
+            ValueError: if the header is corrupted
+
+        Returns:
+            number of records
+        """
+        with shx_path.open("rb") as shx_file:
+            header = shx_file.read(100)
+
+        if len(header) < 100:
+            raise ValueError("truncated .shx header")
+
+        file_code, file_length = struct.unpack(">i20xi", header[:28])
+        if file_code != 9994 or file_length < 50:
+            raise ValueError(f"not a shapefile index (code {file_code})")
+        if file_length * 2 != shx_path.stat().st_size:
+            raise ValueError(
+                f"file length in header ({file_length * 2}) differs from actual size"
+            )
+
+        # 50 words of header then 4 words per record
+        return (file_length - 50) // 4
+
+    @staticmethod
+    def read_dbf_fields(dbf_path: Path) -> tuple[AttributeField, ...]:
+        """Read fields from .dbf descriptors, typed as OGR does.
+
+        Args:
+            dbf_path: path to the .dbf file
+
+        Raises:
+            ValueError: if the header is corrupted or if a field can't be typed
+                natively
+
+        Returns:
+            feature attributes
+        """
+        with dbf_path.open("rb") as dbf_file:
+            header = dbf_file.read(32)
+            if len(header) < 32:
+                raise ValueError("truncated .dbf header")
+            (header_length,) = struct.unpack("<H", header[8:10])
+            descriptors = dbf_file.read(max(header_length - 32, 0))
+
+        if header_length < 33 or len(descriptors) < header_length - 32:
+            raise ValueError(f"invalid .dbf header length ({header_length})")
+
+        li_feature_attributes: list[AttributeField] = []
+        for offset in range(0, len(descriptors), 32):
+            descriptor = descriptors[offset : offset + 32]
+            if descriptor[0] == 0x0D:
+                break
+            if len(descriptor) < 32:
+                raise ValueError("truncated .dbf field descriptor")
+
+            raw_name = descriptor[:11].split(b"\x00", 1)[0].rstrip(b" ")
+            if not raw_name.isascii():
+                # OGR recodes names using .cpg or language driver
+                raise ValueError(f"field name {raw_name!r} is not ASCII")
+
+            field_type = chr(descriptor[11])
+            if field_type == "C":
+                # like shapelib, character fields use both bytes as width
+                width = descriptor[16] + descriptor[17] * 256
+                precision = 0
+            else:
+                width = descriptor[16]
+                precision = descriptor[17] if field_type in ("N", "F") else 0
+
+            if field_type in ("N", "F"):
+                if precision == 0 and width < 10:
+                    data_type = ogr.OFTInteger
+                elif precision == 0 and width < 19:
+                    data_type = ogr.OFTInteger64
+                else:
+                    data_type = ogr.OFTReal
+            elif field_type == "D":
+                # dates are stored as YYYYMMDD and exposed as YYYY/MM/DD
+                data_type = ogr.OFTDate
+                width += 2
+            elif field_type == "C":
+                data_type = ogr.OFTString
+            else:
+                raise ValueError(f"field type {field_type} is not read natively")
+
+            li_feature_attributes.append(
+                AttributeField(
+                    name=raw_name.decode("ascii"),
+                    data_type=ogr.GetFieldTypeName(data_type),
+                    length=width,
+                    precision=precision,
+                )
+            )
+
+        return tuple(li_feature_attributes)
+
+    def get_srs_details_from_prj(
+        self, shp_path: Path, sibling_files: Iterable[str] | None = None
+    ) -> tuple[str, str, str, str]:
+        """Get coordinates system name, type and registry code from the .prj file.
+        Details are cached on the .prj file content, without loading it with OSR.
+
+        Args:
+            shp_path: path to the .shp file
+            sibling_files: names of the files next to the .shp file, as known from
+                the listing. Defaults to None.
+
+        Returns:
+            crs_name, crs_registry, crs_code, crs_type
+        """
+        try:
+            prj_path = self.get_sidecar_file(
+                main_path=shp_path, extension="prj", sibling_files=sibling_files
+            )
+            prj_content = prj_path.read_bytes()
+        except OSError:
+            return self.get_srs_details_from_spatial_reference(spatial_reference=None)
+
+        fingerprint = srs_cache.compute_fingerprint(
+            "prj",
+            gdal.VersionInfo(),
+            gdal.GetConfigOption("USE_OSR_FIND_MATCHES", "YES"),
+            prj_content,
+        )
+        srs_details = srs_cache.get(fingerprint=fingerprint)
+        if srs_details is None:
+            srs_details = self.get_srs_details_from_spatial_reference(
+                spatial_reference=self.get_spatial_reference_from_prj(
+                    shp_path=shp_path, prj_path=prj_path
+                )
+            )
+            srs_cache.store(fingerprint=fingerprint, srs_details=srs_details)
+
+        return srs_details
+
+    @staticmethod
+    def get_spatial_reference_from_prj(
+        shp_path: Path,
+        prj_path: Path | None = None,
+    ) -> osr.SpatialReference | None:
+        """Load the SRS from the .prj file and identify it against EPSG registry, as
+        the OGR Shapefile driver does.
+
+        Args:
+            shp_path: path to the .shp file
+            prj_path: path to the .prj file, if already known. Defaults to None.
+
+        Returns:
+            spatial reference or None if there is no (valid) .prj file
+        """
+        try:
+            if prj_path is None:
+                prj_path = ReadShapefile.get_sidecar_file(
+                    main_path=shp_path, extension="prj"
+                )
+            prj_lines = prj_path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return None
+
+        spatial_reference = osr.SpatialReference()
+        try:
+            spatial_reference.ImportFromESRI(prj_lines.splitlines())
+        except RuntimeError as err:
+            logger.warning(f"Unable to load SRS from {prj_path}. Trace: {err}")
+            return None
+
+        if gdal.GetConfigOption("USE_OSR_FIND_MATCHES", "YES").upper() in (
+            "NO",
+            "FALSE",
+            "OFF",
+            "0",
+        ):
+            spatial_reference.AutoIdentifyEPSG()
+            return spatial_reference
+
+        return find_best_match(spatial_reference=spatial_reference) or spatial_reference
+
+
+# ############################################################################
+# ######### Functions #############
+# #################################
+
+
+def find_best_match(
+    spatial_reference: osr.SpatialReference,
+    min_confidence: int = 90,
+    preferred_authority: str = "EPSG",
+) -> osr.SpatialReference | None:
+    """Find the registered SRS matching a spatial reference, with the same rules as
+    OGRSpatialReference::FindBestMatch (not exposed in Python bindings).
+
+    Args:
+        spatial_reference: spatial reference to identify
+        min_confidence: minimum confidence of the match. Defaults to 90.
+        preferred_authority: authority to prefer among several matches.
+            Defaults to "EPSG".
+
+    Returns:
+        matching spatial reference or None
+    """
+    try:
+        matches = spatial_reference.FindMatches()
+    except RuntimeError as err:
+        logger.debug(f"Unable to find SRS matches. Trace: {err}")
+        return None
+
+    if len(matches) == 1 and matches[0][1] >= min_confidence:
+        return matches[0][0]
+
+    preferred_matches = [
+        match
+        for match, confidence in matches
+        if confidence >= min_confidence
+        and (match.GetAuthorityName(None) or "").upper() == preferred_authority
+    ]
+    if len(preferred_matches) == 1:
+        return preferred_matches[0]
+
+    return None
+
+
+# ###########################################################################
+# #### Stand alone program ########
+# #################################
+if __name__ == "__main__":
+    """Standalone execution."""
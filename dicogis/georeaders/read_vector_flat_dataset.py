@@ -15,15 +15,22 @@ Author:       Julien Moura (https://github.com/Guts/)
 
 # Standard library
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from datetime import datetime
 from pathlib import Path
+from queue import Empty, SimpleQueue
+from threading import current_thread
 
 # 3rd party
-from osgeo import ogr
+from osgeo import gdal, ogr
 
 # package
+from dicogis.constants import StatisticsModes
 from dicogis.georeaders.base_georeader import GeoReaderBase
+from dicogis.georeaders.gdal_exceptions_handler import GdalErrorHandler
 from dicogis.models.metadataset import MetaDatabaseFlat, MetaVectorDataset
+from dicogis.models.processing_message import ProcessingMessage
 from dicogis.utils.check_path import check_var_can_be_path
 
 # ############################################################################
@@ -41,15 +48,21 @@ logger = logging.getLogger(__name__)
 class ReadVectorFlatDataset(GeoReaderBase):
     """Reader for geographic dataset stored as flat vector files."""
 
-    def __init__(self, dataset_type="flat_vector"):
+    def __init__(
+        self,
+        dataset_type="flat_vector",
+        stats_mode: StatisticsModes | str = StatisticsModes.exact,
+    ):
         """Class constructor."""
-        super().__init__(dataset_type=dataset_type)
+        super().__init__(dataset_type=dataset_type, stats_mode=stats_mode)
 
     def infos_dataset(
         self,
         source_path: Path | str,
         metadataset: MetaVectorDataset | None = None,
         fallback_format: str | None = None,
+        allowed_drivers: tuple[str, ...] | None = None,
+        sibling_files: dict[str, int | None] | None = None,
     ) -> MetaVectorDataset | MetaDatabaseFlat:
         """Get metadata from dataset.
 
@@ -59,6 +72,10 @@ class ReadVectorFlatDataset(GeoReaderBase):
                 fill. Defaults to None.
             fallback_format (Optional[str], optional): format name used as fallback if
                 GDAL fails to open the dataset. Defaults to None.
+            allowed_drivers: GDAL drivers to try first to open the dataset. Defaults
+                to None.
+            sibling_files: files next to the dataset file with their size, as known
+                from the listing. Defaults to None.
 
         Returns:
             MetaVectorDataset: metadataset object
@@ -83,12 +100,18 @@ class ReadVectorFlatDataset(GeoReaderBase):
                     parent_folder_name=source_path.parent.name,
                     dataset_type=self.dataset_type,
                 )
+        self.prepare_reading(metadataset=metadataset)
 
         # opening dataset
         try:
-            dataset = self.open_dataset_with_gdal(source_dataset=source_path)
+            dataset = self.open_dataset_with_gdal(
+                source_dataset=source_path,
+                allowed_drivers=allowed_drivers,
+                sibling_files=sibling_files,
+            )
         except Exception as err:
             logger.error(f"An error occurred opening '{source_path}'. Trace: {err}")
+            self.gdal_err.record_exception(err)
             self.counter_alerts = self.counter_alerts + 1
             metadataset.format_gdal_long_name = fallback_format
             self.erratum(
@@ -120,10 +143,12 @@ class ReadVectorFlatDataset(GeoReaderBase):
 
         # dependencies and total size
         metadataset.files_dependencies = self.list_dependencies(
-            main_dataset=source_path
+            main_dataset=source_path, sibling_files=sibling_files
         )
         metadataset.storage_size = self.calc_size_full_dataset(
-            source_path=source_path, dependencies=metadataset.files_dependencies
+            source_path=source_path,
+            dependencies=metadataset.files_dependencies,
+            sibling_files=sibling_files,
         )
         # Getting basic dates
         metadataset.storage_date_created = datetime.fromtimestamp(
@@ -138,14 +163,7 @@ class ReadVectorFlatDataset(GeoReaderBase):
             self.get_infos_layer(in_layer=dataset.GetLayer(), metadataset=metadataset)
         elif self.dataset_type == "flat_database":
             metadataset.layers_count = dataset.GetLayerCount()
-            metadataset.layers = []
-            for layer_idx in range(dataset.GetLayerCount()):
-                layer: ogr.Layer = dataset.GetLayer(layer_idx)
-                layer_metadataset = MetaVectorDataset(
-                    name=layer.GetName(), dataset_type="data_layer"
-                )
-                self.get_infos_layer(in_layer=layer, metadataset=layer_metadataset)
-                metadataset.layers.append(layer_metadataset)
+            metadataset.layers = self.get_layers_metadatasets(dataset=dataset)
 
         # warnings messages
         if self.counter_alerts:
@@ -157,9 +175,167 @@ class ReadVectorFlatDataset(GeoReaderBase):
         del dataset
         return metadataset
 
+    def get_layers_metadatasets(self, dataset: gdal.Dataset) -> list[MetaVectorDataset]:
+        """Read every layer of a multi-layers dataset.
+
+        Args:
+            dataset: dataset opened with GDAL
+
+        Returns:
+            metadatasets of layers, in the dataset order
+        """
+        return self.read_layers(
+            dataset=dataset, layers_indexes=list(range(dataset.GetLayerCount()))
+        )
+
+    def read_layers(
+        self, dataset: gdal.Dataset, layers_indexes: list[int]
+    ) -> list[MetaVectorDataset]:
+        """Read layers of a multi-layers dataset with OGR, using up to max_layers_jobs
+        threads. Each thread opens its own read-only handle on the dataset: GDAL
+        datasets can't be shared between threads. Layers left unread by threads which
+        failed to open their handle are read sequentially with the given dataset.
+
+        Args:
+            dataset: dataset opened with GDAL, used as is if layers are read
+                sequentially
+            layers_indexes: indexes of layers to read
+
+        Returns:
+            metadatasets of layers, in the same order as layers_indexes
+        """
+        max_workers = min(self.max_layers_jobs, len(layers_indexes))
+        if max_workers <= 1:
+            return [
+                self.read_layer(dataset=dataset, layer_idx=layer_idx)
+                for layer_idx in layers_indexes
+            ]
+
+        logger.info(
+            f"Reading {len(layers_indexes)} layers of {dataset.GetDescription()} with "
+            f"{max_workers} threads."
+        )
+        queue_layers_indexes: SimpleQueue = SimpleQueue()
+        for layer_idx in layers_indexes:
+            queue_layers_indexes.put(layer_idx)
+
+        read_layers: dict[int, tuple[MetaVectorDataset, list[ProcessingMessage]]] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="DicoGIS-Layers"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self.read_layers_worker,
+                    source_dataset=dataset.GetDescription(),
+                    gdal_driver=dataset.GetDriver().ShortName,
+                    queue_layers_indexes=queue_layers_indexes,
+                )
+                for _ in range(max_workers)
+            ]
+            for future in futures:
+                worker_layers, worker_counter_alerts = future.result()
+                read_layers.update(worker_layers)
+                self.counter_alerts += worker_counter_alerts
+
+        # messages are reported in layers order, as a sequential reading would do
+        li_layers_metadatasets = []
+        for layer_idx in layers_indexes:
+            if layer_idx not in read_layers:
+                li_layers_metadatasets.append(
+                    self.read_layer(dataset=dataset, layer_idx=layer_idx)
+                )
+                continue
+            layer_metadataset, layer_messages = read_layers[layer_idx]
+            self.gdal_err.messages.extend(layer_messages)
+            li_layers_metadatasets.append(layer_metadataset)
+
+        return li_layers_metadatasets
+
+    def read_layers_worker(
+        self, source_dataset: str, gdal_driver: str, queue_layers_indexes: SimpleQueue
+    ) -> tuple[dict[int, tuple[MetaVectorDataset, list[ProcessingMessage]]], int]:
+        """Read layers taken from a queue until it's empty, with a dataset handle and a
+        reading session of its own. If the handle can't be opened, no layer is taken
+        from the queue.
+
+        Args:
+            source_dataset: path of the dataset to open
+            gdal_driver: GDAL driver which opened the dataset
+            queue_layers_indexes: indexes of layers left to read, shared by workers
+
+        Returns:
+            metadatasets and GDAL messages of read layers by layer index, alerts count
+        """
+        # a copy of the reader keeps alerts and session of this thread apart
+        worker_reader = copy(self)
+        worker_reader.gdal_err = GdalErrorHandler()
+        worker_reader.session_opened = False
+
+        read_layers: dict[int, tuple[MetaVectorDataset, list[ProcessingMessage]]] = {}
+        with worker_reader:
+            worker_reader.prepare_reading()
+            try:
+                dataset = worker_reader.open_dataset_with_gdal(
+                    source_dataset=source_dataset, allowed_drivers=(gdal_driver,)
+                )
+            except RuntimeError as err:
+                logger.warning(
+                    f"Opening {source_dataset} in {current_thread().name} failed, "
+                    f"its layers are read sequentially. Trace: {err}"
+                )
+                return read_layers, 0
+
+            try:
+                while True:
+                    try:
+                        layer_idx = queue_layers_indexes.get_nowait()
+                    except Empty:
+                        break
+                    count_messages = len(worker_reader.gdal_err.messages)
+                    read_layers[layer_idx] = (
+                        worker_reader.read_layer(dataset=dataset, layer_idx=layer_idx),
+                        worker_reader.gdal_err.messages[count_messages:],
+                    )
+            finally:
+                del dataset
+
+        return read_layers, worker_reader.counter_alerts
+
+    def read_layer(self, dataset: gdal.Dataset, layer_idx: int) -> MetaVectorDataset:
+        """Read a layer of a multi-layers dataset. A failure is recorded in the layer
+        metadataset, along with the layer name, without failing the whole dataset.
+
+        Args:
+            dataset: dataset opened with GDAL
+            layer_idx: index of the layer to read
+
+        Returns:
+            metadataset of the layer
+        """
+        layer: ogr.Layer = dataset.GetLayer(layer_idx)
+        layer_metadataset = MetaVectorDataset(
+            name=layer.GetName(),
+            dataset_type="data_layer",
+            statistics_mode=self.stats_mode.value,
+        )
+        try:
+            self.get_infos_layer(in_layer=layer, metadataset=layer_metadataset)
+        except RuntimeError as err:
+            logger.error(
+                f"Reading layer {layer_metadataset.name} of "
+                f"{dataset.GetDescription()} failed. Trace: {err}"
+            )
+            layer_metadataset.processing_succeeded = False
+            layer_metadataset.processing_error_type = "err_layer_read"
+            layer_metadataset.processing_error_msg = (
+                f"layer {layer_metadataset.name}: {err}"
+            )
+
+        return layer_metadataset
+
     def get_infos_layer(self, in_layer: ogr.Layer, metadataset: MetaVectorDataset):
         # features
-        metadataset.features_objects_count = in_layer.GetFeatureCount()
+        metadataset.features_objects_count = self.get_features_count(layer=in_layer)
         if metadataset.features_objects_count == 0:
             """if layer doesn't have any object, return an error"""
             self.counter_alerts += 1
@@ -10,8 +10,21 @@
 # Standard library
 import logging
 
+# 3rd party
+from osgeo import gdal, ogr
+
 # package
+from dicogis.constants import StatisticsModes
+from dicogis.georeaders.geopackage_catalog import (
+    SQL_GPKG_COLUMNS,
+    SQL_GPKG_LAYERS,
+    SQL_GPKG_OGR_CONTENTS_EXISTS,
+    GeopackageLayer,
+    describe_columns,
+    parse_layer_row,
+)
 from dicogis.georeaders.read_vector_flat_dataset import ReadVectorFlatDataset
+from dicogis.models.metadataset import MetaVectorDataset
 
 # #############################################################################
 # ########## Globals ###############
@@ -30,9 +43,221 @@ class ReadFlatDatabase(ReadVectorFlatDataset):
     Typically ESRI FileGDB, Geopackage, Spatialite...
     """
 
-    def __init__(self):
+    def __init__(self, stats_mode: StatisticsModes | str = StatisticsModes.exact):
         """Class constructor."""
-        super().__init__(dataset_type="flat_database")
+        super().__init__(dataset_type="flat_database", stats_mode=stats_mode)
+
+    def execute_sql(self, dataset: gdal.Dataset, sql: str) -> list[dict]:
+        """Execute a SQL query on a dataset and fetch every row.
+
+        Args:
+            dataset: dataset opened with GDAL
+            sql: SQL query
+
+        Returns:
+            rows as dictionaries of column names and values
+        """
+        result_set: ogr.Layer | None = dataset.ExecuteSQL(sql)
+        if result_set is None:
+            return []
+        try:
+            return [feature.items() for feature in result_set]
+        finally:
+            dataset.ReleaseResultSet(result_set)
+
+    def read_geopackage_catalog(
+        self, dataset: gdal.Dataset
+    ) -> dict[str, GeopackageLayer]:
+        """Describe vector layers of a GeoPackage from its system tables, with a
+        couple of queries for the whole file.
+
+        Args:
+            dataset: GeoPackage opened with GDAL
+
+        Returns:
+            layers described from system tables, by lower-cased table name. Empty if
+            system tables can't be read.
+        """
+        try:
+            with_ogr_contents = self.execute_sql(
+                dataset=dataset, sql=SQL_GPKG_OGR_CONTENTS_EXISTS
+            )[0].get("tables_count")
+            layers_rows = self.execute_sql(
+                dataset=dataset,
+                sql=SQL_GPKG_LAYERS.format(
+                    feature_count="o.feature_count" if with_ogr_contents else "NULL",
+                    ogr_contents_join=(
+                        "LEFT JOIN gpkg_ogr_contents AS o "
+                        "ON lower(o.table_name) = lower(c.table_name)"
+                        if with_ogr_contents
+                        else ""
+                    ),
+                ),
+            )
+            columns_rows = self.execute_sql(dataset=dataset, sql=SQL_GPKG_COLUMNS)
+        except (RuntimeError, IndexError) as err:
+            logger.warning(
+                "Unable to read GeoPackage system tables, layers are read with OGR. "
+                f"Trace: {err}"
+            )
+            return {}
+
+        layers: dict[str, GeopackageLayer] = {
+            f"{row.get('table_name')}".lower(): parse_layer_row(row=row)
+            for row in layers_rows
+        }
+        columns: dict[str, list[tuple[str, str, int]]] = {}
+        for row in columns_rows:
+            columns.setdefault(f"{row.get('table_name')}".lower(), []).append(
+                (
+                    row.get("column_name"),
+                    row.get("column_type"),
+                    row.get("primary_key_index") or 0,
+                )
+            )
+        for table_name, layer in layers.items():
+            describe_columns(layer=layer, columns=columns.get(table_name, []))
+
+        return layers
+
+    def is_readable_from_catalog(self, layer: GeopackageLayer) -> bool:
+        """Check if a layer described from system tables gets the same metadata as
+        OGR would give, in the current statistics mode.
+
+        Args:
+            layer: layer described from system tables
+
+        Returns:
+            True if the layer doesn't need to be read with OGR
+        """
+        if not layer.is_describable:
+            return False
+        if layer.is_spatial and layer.geometry_column is None:
+            return False
+        if self.stats_mode == StatisticsModes.skip:
+            return True
+        # counts are missing when gpkg_ogr_contents is absent or not up to date
+        if layer.features_count is None:
+            return False
+        # without extent in gpkg_contents, OGR computes it
+        return not (
+            layer.is_spatial and layer.features_count > 0 and layer.extent[0] is None
+        )
+
+    def get_layers_metadatasets(self, dataset: gdal.Dataset) -> list[MetaVectorDataset]:
+        """Read every layer of a flat geodatabase. GeoPackage layers are described
+        from system tables in one pass, OGR reading only layers they can't describe.
+
+        Args:
+            dataset: dataset opened with GDAL
+
+        Returns:
+            metadatasets of layers, in the dataset order
+        """
+        if dataset.GetDriver().ShortName != "GPKG":
+            return super().get_layers_metadatasets(dataset=dataset)
+
+        gpkg_layers = self.read_geopackage_catalog(dataset=dataset)
+        if not gpkg_layers:
+            return super().get_layers_metadatasets(dataset=dataset)
+
+        li_layers_metadatasets: list[MetaVectorDataset | None] = []
+        layers_indexes_for_ogr: list[int] = []
+        for layer_idx in range(dataset.GetLayerCount()):
+            layer: ogr.Layer = dataset.GetLayer(layer_idx)
+            gpkg_layer = gpkg_layers.get(layer.GetName().lower())
+            if gpkg_layer is None or not self.is_readable_from_catalog(gpkg_layer):
+                layers_indexes_for_ogr.append(layer_idx)
+                li_layers_metadatasets.append(None)
+                continue
+            layer_metadataset = MetaVectorDataset(
+                name=layer.GetName(),
+                dataset_type="data_layer",
+                statistics_mode=self.stats_mode.value,
+            )
+            self.get_infos_layer_from_catalog(
+                gpkg_layer=gpkg_layer, in_layer=layer, metadataset=layer_metadataset
+            )
+            li_layers_metadatasets.append(layer_metadataset)
+
+        logger.debug(
+            f"{len(li_layers_metadatasets) - len(layers_indexes_for_ogr)} layers "
+            "described from GeoPackage system tables, "
+            f"{len(layers_indexes_for_ogr)} read with OGR."
+        )
+        for layer_idx, layer_metadataset in zip(
+            layers_indexes_for_ogr,
+            self.read_layers(dataset=dataset, layers_indexes=layers_indexes_for_ogr),
+        ):
+            li_layers_metadatasets[layer_idx] = layer_metadataset
+
+        return li_layers_metadatasets
+
+    def get_infos_layer_from_catalog(
+        self,
+        gpkg_layer: GeopackageLayer,
+        in_layer: ogr.Layer,
+        metadataset: MetaVectorDataset,
+    ):
+        """Fill metadata of a GeoPackage layer described from system tables, the same
+        way as get_infos_layer does from the OGR layer.
+
+        Args:
+            gpkg_layer: layer described from system tables
+            in_layer: OGR layer, only read to sample geometry types of generic
+                geometry columns
+            metadataset: metadataset to fill
+        """
+        # features
+        if self.stats_mode == StatisticsModes.skip:
+            metadataset.features_objects_count = None
+            metadataset.bbox = (None, None, None, None)
+        else:
+            metadataset.features_objects_count = gpkg_layer.features_count
+            metadataset.bbox = gpkg_layer.extent
+        if metadataset.features_objects_count == 0:
+            """if layer doesn't have any object, return an error"""
+            self.counter_alerts += 1
+            self.erratum(
+                target_container=metadataset,
+                src_dataset_layer=in_layer,
+                err_type="err_nobjet",
+            )
+
+        # fields
+        metadataset.feature_attributes = tuple(gpkg_layer.feature_attributes)
+
+        # geometry type
+        if not gpkg_layer.is_spatial:
+            metadataset.geometry_type = ogr.GeometryTypeToName(ogr.wkbNone)
+        else:
+            metadataset.geometry_type = self.get_ogr_geometry_type_name(
+                geometry_type=f"{gpkg_layer.geometry_type}",
+                has_z=bool(gpkg_layer.z),
+                has_m=bool(gpkg_layer.m),
+            )
+            if "unknown" in metadataset.geometry_type.lower():
+                geometry_types = self.get_sampled_geometry_types(layer=in_layer)
+                metadataset.geometry_type = (
+                    ", ".join(geometry_types) if geometry_types else None
+                )
+            if metadataset.geometry_type is None:
+                metadataset.processing_error_msg += f"{self.gdal_err.err_msg} -- "
+                metadataset.processing_error_type += f"{self.gdal_err.err_type} -- "
+                metadataset.processing_succeeded = False
+
+        # SRS
+        (
+            metadataset.crs_name,
+            metadataset.crs_registry,
+            metadataset.crs_registry_code,
+            metadataset.crs_type,
+        ) = self.get_catalog_srs_details(
+            srid=(gpkg_layer.srs_id or 0) if gpkg_layer.is_spatial else 0,
+            srs_auth_name=gpkg_layer.srs_organization,
+            srs_auth_srid=gpkg_layer.srs_organization_id,
+            srs_wkt=gpkg_layer.srs_wkt,
+        )
 
 
 # ###########################################################################
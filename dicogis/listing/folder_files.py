@@ -0,0 +1,131 @@
+"""Files of the folders read by the listing, kept in memory so that readers can find
+the files around a dataset (sidecars, auxiliary files...) and their sizes without
+reading its folder again.
+
+Only folders where datasets have been found are kept, until the next listing or, when
+datasets are read while being listed, until datasets of the folder have been
+dispatched to readers. The index is shared by every reader of the process: worker
+processes receive the sibling files of their datasets with the dataset to process.
+"""
+
+# ############################################################################
+# ######### Libraries #############
+# #################################
+
+# Standard library
+import logging
+from collections.abc import Iterable
+from os import fspath, path
+from pathlib import Path
+from threading import Lock
+
+# ############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# ############################################################################
+# ######### Classes #############
+# ###############################
+
+
+class FoldersFilesIndex:
+    """Files of folders, grouped by the lower-cased part of their name before the
+    first dot (the stem of a dataset), to get files of a dataset without scanning the
+    whole folder. Thread-safe.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        # folder path -> stem -> file name -> file size (None if unknown)
+        self._folders: dict[str, dict[str, dict[str, int | None]]] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def get_group_key(file_name: str) -> str:
+        """Get the key of the group of a file: files of a dataset share the part of
+        their name before the first dot ('roads.shp', 'roads.shp.xml', 'roads.DBF').
+
+        Args:
+            file_name: name of the file
+
+        Returns:
+            group key
+        """
+        return file_name.split(".", 1)[0].lower()
+
+    def add_folder(
+        self,
+        folder: Path | str,
+        file_names: Iterable[str],
+        files_sizes: dict[str, int] | None = None,
+    ):
+        """Store files of a folder, replacing a previous read of the same folder.
+
+        Args:
+            folder: folder path
+            file_names: names of files into the folder
+            files_sizes: sizes of files, in octets, when known from the folder read.
+                Defaults to None.
+        """
+        if files_sizes is None:
+            files_sizes = {}
+
+        groups: dict[str, dict[str, int | None]] = {}
+        for file_name in file_names:
+            groups.setdefault(self.get_group_key(file_name), {})[file_name] = (
+                files_sizes.get(file_name)
+            )
+
+        with self._lock:
+            self._folders[path.abspath(fspath(folder))] = groups
+
+    def get_sibling_files(self, file_path: Path | str) -> dict[str, int | None] | None:
+        """Get the files next to a file which may belong to the same dataset: files
+        whose name starts with the stem of the file, file included.
+
+        Args:
+            file_path: path to the dataset main file
+
+        Returns:
+            files names with their size (None if unknown) or None if the folder or the
+                file has not been indexed
+        """
+        folder, file_name = path.split(path.abspath(fspath(file_path)))
+        groups = self._folders.get(folder)
+        if groups is None:
+            return None
+
+        group_files = groups.get(self.get_group_key(file_name), {})
+        if file_name not in group_files:
+            return None
+
+        stem = path.splitext(file_name)[0].lower()
+        return {
+            sibling: size
+            for sibling, size in group_files.items()
+            if sibling.lower().startswith(stem)
+        }
+
+    def remove_folder(self, folder: Path | str):
+        """Remove a folder from the index, once its datasets don't need it anymore.
+
+        Args:
+            folder: folder path
+        """
+        with self._lock:
+            self._folders.pop(path.abspath(fspath(folder)), None)
+
+    def clear(self):
+        """Remove every folder from the index."""
+        with self._lock:
+            self._folders.clear()
+
+
+# ############################################################################
+# ######### Instances #############
+# #################################
+
+# one index per process, filled by the listing and read by processors
+folders_files_index = FoldersFilesIndex()
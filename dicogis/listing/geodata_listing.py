@@ -10,14 +10,20 @@ Look for geographic datasets.
 
 # Standard library
 import logging
-from os import path, walk
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import fspath, path, scandir
 from pathlib import Path
+from sys import platform as opersys
+from typing import ClassVar
 
 # 3rd party
 import pgserviceparser
 
 # package
+from dicogis.cache.listing_index import ListingIndex
 from dicogis.constants import FormatsRaster
+from dicogis.listing.folder_files import folders_files_index
 
 # #############################################################################
 # ########## Globals ###############
@@ -25,6 +31,250 @@ from dicogis.constants import FormatsRaster
 
 logger = logging.getLogger(__name__)
 
+# on Windows, files sizes come with folder entries: reading them costs no system call
+READ_FOLDER_GIVES_SIZES: bool = opersys == "win32"
+
+# ##############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class GeodataFilesLister:
+    """Iterable looking for compatible geo-files into a folder structure.
+
+    Datasets are yielded as soon as their folder has been scanned, as tuples of
+    (dataset format, path). Yielded order follows the folders walk: sorting is up to
+    the consumer.
+    """
+
+    # formats which can be yielded, in the order used by processors and serializers
+    LISTED_FORMATS: tuple[str, ...] = (
+        "esri_shapefile",
+        "mapinfo_tab",
+        "kml",
+        "gml",
+        "geojson",
+        "geotiff",
+        "gxt",
+        "raster",
+        "file_geodatabase_esri",
+        "file_geodatabase_geopackage",
+        "file_geodatabase_spatialite",
+        "dxf",
+        "dwg",
+        "dgn",
+    )
+
+    # file extension (lower case) to dataset format, looked up once per file
+    EXTENSIONS_FORMATS: ClassVar[dict[str, str]] = {
+        ".shp": "esri_shapefile",
+        ".tab": "mapinfo_tab",
+        ".kml": "kml",
+        ".kmz": "kml",
+        ".gml": "gml",
+        ".geojson": "geojson",
+        ".geotiff": "geotiff",
+        ".gxt": "gxt",
+        ".dxf": "dxf",
+        ".dwg": "dwg",
+        ".dgn": "dgn",
+        ".gpkg": "file_geodatabase_geopackage",
+        ".sqlite": "file_geodatabase_spatialite",
+    }
+
+    # formats made of several files: extensions (lower case) required next to the
+    # main file
+    REQUIRED_SIDECARS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "esri_shapefile": (".dbf", ".shx"),
+        "mapinfo_tab": (".dat", ".map", ".id"),
+    }
+
+    def __init__(
+        self,
+        start_folder: Path | str,
+        walker_threads: int = 1,
+        listing_index: ListingIndex | None = None,
+    ):
+        """Initialize lister.
+
+        Args:
+            start_folder: folder to start.
+            walker_threads: number of folders read at the same time. Useful on
+                high-latency network shares. 1 means folders are read one by one.
+                Defaults to 1.
+            listing_index: persistent index of folders entries. Folders which have
+                not changed since they were indexed are not read again. Defaults to
+                None.
+        """
+        self.start_folder = start_folder
+        self.walker_threads = max(1, walker_threads)
+        self.listing_index = listing_index
+        # counter of parsed folders, updated while iterating
+        self.num_folders: int = 0
+        # files sizes of folders read by the walker, until their datasets are yielded
+        self.folders_files_sizes: dict[str, dict[str, int]] = {}
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        """Walk the folders structure and yield geodata files as they are found.
+
+        Formats are determined from folder entries returned by the walk: no extra
+        call to the file system is made per file. Files of folders containing
+        datasets are kept in the folders files index, for readers. The index is
+        cleared first.
+
+        Yields:
+            dataset format and path
+        """
+        self.num_folders = 0
+        self.folders_files_sizes.clear()
+        # files of a previous listing may be gone: don't serve stale siblings
+        folders_files_index.clear()
+        logger.info(f"Begin of folders parsing: {self.start_folder}")
+        folders_walker = walk_concurrently(
+            start_folder=self.start_folder,
+            max_workers=self.walker_threads,
+            folder_reader=self.read_folder_entries,
+        )
+
+        for root, dirs, files in folders_walker:
+            files_sizes = self.folders_files_sizes.pop(root, None)
+            self.num_folders = self.num_folders + len(dirs)
+            for d in dirs:
+                """looking for File Geodatabase among directories"""
+                if d[-4:].lower() == ".gdb":
+                    # add complete path of Esri FileGeoDatabase
+                    yield "file_geodatabase_esri", path.abspath(path.join(root, d))
+
+            folder_files = self.index_folder_files(file_names=files)
+            folder_datasets: list[tuple[str, str]] = []
+            for f in files:
+                """looking for files with geographic data"""
+                if dataset_format := self.get_file_format(
+                    file_name=f, folder_files=folder_files
+                ):
+                    folder_datasets.append((dataset_format, f))
+
+            # keep folder files for readers, before they get the datasets
+            if folder_datasets:
+                folders_files_index.add_folder(
+                    folder=root, file_names=files, files_sizes=files_sizes
+                )
+            for dataset_format, f in folder_datasets:
+                yield dataset_format, path.join(root, f)
+
+        if self.listing_index is not None:
+            self.listing_index.flush()
+            logger.info(
+                f"Listing index: {self.listing_index.count_reused} folders reused - "
+                f"{self.listing_index.count_read} folders read."
+            )
+
+    def read_folder_entries(
+        self, folder: str
+    ) -> tuple[list[str], list[str], list[str]] | None:
+        """Read folder entries, from the listing index if set. Files sizes got from
+        the read are kept for the folders files index.
+
+        Args:
+            folder: folder to read
+
+        Returns:
+            sub-folders names, files names and names of sub-folders to walk into or
+                None if the folder can't be read
+        """
+        files_sizes: dict[str, int] | None = {} if READ_FOLDER_GIVES_SIZES else None
+        if self.listing_index is not None:
+            folder_entries = self.read_folder_with_index(
+                folder=folder, files_sizes=files_sizes
+            )
+        else:
+            folder_entries = read_folder(folder=folder, files_sizes=files_sizes)
+
+        if files_sizes:
+            self.folders_files_sizes[folder] = files_sizes
+        return folder_entries
+
+    def read_folder_with_index(
+        self, folder: str, files_sizes: dict[str, int] | None = None
+    ) -> tuple[list[str], list[str], list[str]] | None:
+        """Get folder entries from the listing index if the folder has not changed,
+        else read it and index it.
+
+        Args:
+            folder: folder to read
+            files_sizes: dictionary to fill with files sizes if the folder is read.
+                Defaults to None.
+
+        Returns:
+            sub-folders names, files names and names of sub-folders to walk into or
+                None if the folder can't be read
+        """
+        indexed = self.listing_index.get_folder_entries(folder=folder)
+        if indexed is None:
+            return None
+
+        mtime_ns, folder_entries = indexed
+        if folder_entries is not None:
+            return folder_entries
+
+        folder_entries = read_folder(folder=folder, files_sizes=files_sizes)
+        if folder_entries is not None:
+            self.listing_index.store_folder_entries(folder, mtime_ns, *folder_entries)
+        return folder_entries
+
+    @staticmethod
+    def index_folder_files(file_names: Iterable[str]) -> set[str]:
+        """Index files of a folder to check sidecars presence without querying the
+        file system. Extensions are lower-cased: 'roads.SHX' is indexed as
+        'roads.shx'.
+
+        Args:
+            file_names: names of files into the folder
+
+        Returns:
+            set of file names with lower-cased extension
+        """
+        folder_files: set[str] = set()
+        for file_name in file_names:
+            stem, extension = path.splitext(file_name)
+            folder_files.add(f"{stem}{extension.lower()}")
+        return folder_files
+
+    def get_file_format(
+        self, file_name: str, folder_files: set[str] | None = None
+    ) -> str | None:
+        """Determine the dataset format of a file from its name.
+
+        Args:
+            file_name: name of the file
+            folder_files: files of the same folder, as returned by
+                index_folder_files. Required to check sidecars of multi-files
+                formats (shapefile, MapInfo table).
+
+        Returns:
+            dataset format or None if the file is not a compatible geo-file
+        """
+        stem, extension = path.splitext(file_name)
+        extension = extension.lower()
+
+        dataset_format = self.EXTENSIONS_FORMATS.get(extension)
+        if dataset_format is None:
+            if FormatsRaster.has_key(extension):
+                """listing compatible rasters"""
+                return "raster"
+            return None
+
+        required_sidecars = self.REQUIRED_SIDECARS.get(dataset_format)
+        if required_sidecars and (
+            folder_files is None
+            or not all(
+                f"{stem}{sidecar}" in folder_files for sidecar in required_sidecars
+            )
+        ):
+            return None
+
+        return dataset_format
+
 
 # ##############################################################################
 # ########## Functions #############
@@ -57,8 +307,105 @@ def check_usable_pg_services(requested_pg_services: list[str]) -> list[str] | No
     return out_pg_srv_list
 
 
+def read_folder(
+    folder: str, files_sizes: dict[str, int] | None = None
+) -> tuple[list[str], list[str], list[str]] | None:
+    """Read folder entries, split as os.walk does.
+
+    Args:
+        folder: folder to read
+        files_sizes: dictionary to fill with sizes of files (symbolic links
+            excluded), in octets. Defaults to None.
+
+    Returns:
+        sub-folders names, files names and names of sub-folders to walk into
+            (symbolic links excluded) or None if the folder can't be read
+    """
+    dirs: list[str] = []
+    nondirs: list[str] = []
+    walk_dirs: list[str] = []
+    try:
+        with scandir(folder) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if not is_dir:
+                    nondirs.append(entry.name)
+                    if files_sizes is not None:
+                        try:
+                            if not entry.is_symlink():
+                                files_sizes[entry.name] = entry.stat().st_size
+                        except OSError:
+                            pass
+                    continue
+
+                dirs.append(entry.name)
+                try:
+                    if not entry.is_symlink():
+                        walk_dirs.append(entry.name)
+                except OSError:
+                    pass
+    except OSError as err:
+        logger.debug(f"Unable to read folder {folder}: {err}")
+        return None
+
+    return dirs, nondirs, walk_dirs
+
+
+def walk_concurrently(
+    start_folder: Path | str,
+    max_workers: int = 8,
+    folder_reader: Callable[
+        [str], tuple[list[str], list[str], list[str]] | None
+    ] = read_folder,
+) -> Iterator[tuple[str, list[str], list[str]]]:
+    """Walk a folders structure like os.walk (top-down, symbolic links not followed,
+    unreadable folders ignored) while reading up to max_workers folders at the same
+    time. Folders are yielded in the same order as os.walk.
+
+    Args:
+        start_folder: folder to start
+        max_workers: maximum number of folders read at the same time. Defaults to 8.
+        folder_reader: function reading a folder, with the same output as
+            read_folder. Defaults to read_folder.
+
+    Yields:
+        folder path, sub-folders names and files names
+    """
+    # next folder to yield is at the end, as in os.walk
+    stack: list[str] = [fspath(start_folder)]
+    reading: dict[str, Future] = {}
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="DicoGIS-walker"
+    )
+    try:
+        while stack:
+            # read ahead folders which are going to be yielded next
+            for folder in stack[-max_workers:]:
+                if folder not in reading:
+                    reading[folder] = executor.submit(folder_reader, folder)
+
+            top = stack.pop()
+            folder_entries = reading.pop(top).result()
+            if folder_entries is None:
+                continue
+
+            dirs, nondirs, walk_dirs = folder_entries
+            yield top, dirs, nondirs
+            stack.extend(path.join(top, dirname) for dirname in reversed(walk_dirs))
+    finally:
+        # folders read ahead are useless if the consumer stopped early or failed
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def find_geodata_files(
     start_folder: Path,
+    walker_threads: int = 1,
+    listing_index: ListingIndex | None = None,
 ) -> tuple[
     int,
     list[str],
@@ -82,132 +429,53 @@ def find_geodata_files(
 
     Args:
         start_folder (Path): folder to start.
+        walker_threads: number of folders read at the same time. Defaults to 1.
+        listing_index: persistent index of folders entries, to avoid reading again
+            folders which have not changed. Defaults to None.
 
     Returns:
         tuple[ int, list[str], list[str], list[str], list[str], list[str], list[str],
         list[str], list[str], list[str], list[str], list[str], list[str], list[str],
         list[str], ]: tuple with number of folders parsed and list of paths by formats
     """
-    # counter
-    num_folders: int = 0
     # final list by formats
-    li_shp: list[str] = []
-    li_tab: list[str] = []
-    li_kml: list[str] = []
-    li_gml: list[str] = []
-    li_geoj: list[str] = []
-    li_geotiff: list[str] = []
-    li_gxt: list[str] = []
-    li_dxf: list[str] = []
-    li_dwg: list[str] = []
-    li_dgn: list[str] = []
-    li_cdao: list[str] = []
-    li_raster: list[str] = []
-    li_flat_geodatabases_geopackage: list[str] = []
-    li_fdb: list[str] = []
-    li_flat_geodatabases_esri_filegdb: list[str] = []
-    li_flat_geodatabases_spatialite: list[str] = []
+    files_by_format: dict[str, list[str]] = {
+        dataset_format: [] for dataset_format in GeodataFilesLister.LISTED_FORMATS
+    }
 
     # Looping in folders structure
-    logger.info(f"Begin of folders parsing: {start_folder}")
-    for root, dirs, files in walk(start_folder):
-        num_folders = num_folders + len(dirs)
-        for d in dirs:
-            """looking for File Geodatabase among directories"""
-            try:
-                path.join(root, d)
-                full_path = path.join(root, d)
-            except UnicodeDecodeError:
-                full_path = path.join(root, d.decode("latin1"))
-            if full_path[-4:].lower() == ".gdb":
-                # add complete path of Esri FileGeoDatabase
-                li_flat_geodatabases_esri_filegdb.append(path.abspath(full_path))
-            else:
-                pass
-        for f in files:
-            """looking for files with geographic data"""
-            try:
-                path.join(root, f)
-                full_path = path.join(root, f)
-            except UnicodeDecodeError:
-                full_path = path.join(root, f.decode("latin1"))
-            # Looping on files contained
-            if (
-                path.splitext(full_path.lower())[1].lower() == ".shp"
-                and (
-                    path.isfile(f"{full_path[:-4]}.dbf")
-                    or path.isfile(f"{full_path[:-4]}.DBF")
-                )
-                and (
-                    path.isfile(f"{full_path[:-4]}.shx")
-                    or path.isfile(f"{full_path[:-4]}.SHX")
-                )
-            ):
-                """listing compatible shapefiles"""
-                # add complete path of shapefile
-                li_shp.append(full_path)
-            elif (
-                path.splitext(full_path.lower())[1] == ".tab"
-                and (
-                    path.isfile(full_path[:-4] + ".dat")
-                    or path.isfile(full_path[:-4] + ".DAT")
-                )
-                and (
-                    path.isfile(full_path[:-4] + ".map")
-                    or path.isfile(full_path[:-4] + ".MAP")
-                )
-                and (
-                    path.isfile(full_path[:-4] + ".id")
-                    or path.isfile(full_path[:-4] + ".ID")
-                )
-            ):
-                """listing MapInfo tables"""
-
-                li_tab.append(full_path)
-            elif (
-                path.splitext(full_path.lower())[1] == ".kml"
-                or path.splitext(full_path.lower())[1] == ".kmz"
-            ):
-                """listing KML and KMZ"""
-
-                li_kml.append(full_path)
-            elif path.splitext(full_path.lower())[1] == ".gml":
-                """listing GML"""
-
-                li_gml.append(full_path)
-            elif path.splitext(full_path.lower())[1] == ".geojson":
-                """listing GeoJSON"""
-
-                li_geoj.append(full_path)
-            elif path.splitext(full_path.lower())[1] in (".geotiff", "tiff"):
-                li_geotiff.append(full_path)
-            elif path.splitext(full_path.lower())[1] == ".gxt":
-                """listing Geoconcept eXport Text (GXT)"""
-
-                li_gxt.append(full_path)
-            elif FormatsRaster.has_key(path.splitext(full_path.lower())[1]):
-                """listing compatible rasters"""
+    geodata_lister = GeodataFilesLister(
+        start_folder=start_folder,
+        walker_threads=walker_threads,
+        listing_index=listing_index,
+    )
+    for dataset_format, full_path in geodata_lister:
+        files_by_format[dataset_format].append(full_path)
+
+    num_folders: int = geodata_lister.num_folders
+    li_shp: list[str] = files_by_format.get("esri_shapefile")
+    li_tab: list[str] = files_by_format.get("mapinfo_tab")
+    li_kml: list[str] = files_by_format.get("kml")
+    li_gml: list[str] = files_by_format.get("gml")
+    li_geoj: list[str] = files_by_format.get("geojson")
+    li_geotiff: list[str] = files_by_format.get("geotiff")
+    li_gxt: list[str] = files_by_format.get("gxt")
+    li_dxf: list[str] = files_by_format.get("dxf")
+    li_dwg: list[str] = files_by_format.get("dwg")
+    li_dgn: list[str] = files_by_format.get("dgn")
+    li_cdao: list[str] = []
+    li_raster: list[str] = files_by_format.get("raster")
+    li_flat_geodatabases_geopackage: list[str] = files_by_format.get(
+        "file_geodatabase_geopackage"
+    )
+    li_fdb: list[str] = []
+    li_flat_geodatabases_esri_filegdb: list[str] = files_by_format.get(
+        "file_geodatabase_esri"
+    )
+    li_flat_geodatabases_spatialite: list[str] = files_by_format.get(
+        "file_geodatabase_spatialite"
+    )
 
-                li_raster.append(full_path)
-            elif path.splitext(full_path.lower())[1] == ".dxf":
-                """listing DXF"""
-
-                li_dxf.append(full_path)
-            elif path.splitext(full_path.lower())[1] == ".dwg":
-                """listing DWG"""
-
-                li_dwg.append(full_path)
-            elif path.splitext(full_path.lower())[1] == ".dgn":
-                """listing MicroStation DGN"""
-                li_dgn.append(full_path)
-            elif path.splitext(full_path.lower())[1] == ".gpkg":
-                """listing GeoPackage"""
-                li_flat_geodatabases_geopackage.append(full_path)
-            elif path.splitext(full_path.lower())[1] == ".sqlite":
-                """listing Spatialite DB"""
-                li_flat_geodatabases_spatialite.append(full_path)
-            else:
-                continue
     # grouping raster
     li_raster.extend(li_geotiff)
 
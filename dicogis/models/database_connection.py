@@ -7,6 +7,7 @@
 # #################################
 
 # Standard library
+import configparser
 import logging
 from dataclasses import dataclass
 
@@ -65,6 +66,32 @@ class DatabaseConnection:
 
         return {key: value for (key, value) in as_dict.items() if value is not None}
 
+    @property
+    def server_address(self) -> str:
+        """Get the address of the database server, looking into the service file if
+            a service is used. Useful to group databases hosted by the same server.
+
+        Returns:
+            host and port of the server, e.g. 'localhost:5432'
+        """
+        host, port = self.host, self.port
+        if isinstance(self.service_name, str):
+            try:
+                service_settings = pgserviceparser.service_config(self.service_name)
+                host = service_settings.get("host", host)
+                port = service_settings.get("port", port)
+            except (
+                configparser.Error,
+                pgserviceparser.ServiceFileNotFound,
+                pgserviceparser.ServiceNotFound,
+            ) as err:
+                logger.debug(
+                    f"Unable to read settings of service '{self.service_name}'. "
+                    f"Trace: {err}"
+                )
+
+        return f"{host or 'localhost'}:{port or 5432}"
+
     @property
     def pg_connection_string(self) -> str:
         """Get PostgreSQL connection string.
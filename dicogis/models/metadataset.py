@@ -8,15 +8,17 @@
 
 # Standard library
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from hashlib import sha256
 from pathlib import Path
 from typing import Literal
 
 # package
+from dicogis.constants import StatisticsModes
 from dicogis.models.database_connection import DatabaseConnection
 from dicogis.models.feature_attributes import AttributeField
+from dicogis.models.processing_message import ProcessingMessage
 from dicogis.utils.formatters import convert_octets
 from dicogis.utils.slugger import sluggy
 
@@ -76,6 +78,9 @@ class MetaDataset:
     processing_succeeded: bool | None = None
     processing_error_msg: str | None = ""
     processing_error_type: str | None = ""
+    processing_messages: list[ProcessingMessage] = field(default_factory=list)
+    # how features count and spatial extent were obtained: exact, fast or skip
+    statistics_mode: str | None = None
 
     @property
     def as_markdown_description(self) -> str:
@@ -95,6 +100,30 @@ class MetaDataset:
         if isinstance(self, MetaVectorDataset) and self.features_objects_count:
             description += f"- Features objects count: {self.features_objects_count}\n"
 
+        if (
+            isinstance(self, MetaVectorDataset)
+            and self.statistics_mode == StatisticsModes.fast.value
+        ):
+            description += (
+                "- Statistics mode: fast (features count and extent are only "
+                "driver-provided values, possibly missing)\n"
+            )
+        elif (
+            isinstance(self, MetaVectorDataset)
+            and self.statistics_mode == StatisticsModes.estimated.value
+        ):
+            description += (
+                "- Statistics mode: estimated (features count and extent come from "
+                "database planner statistics)\n"
+            )
+        elif (
+            isinstance(self, MetaVectorDataset)
+            and self.statistics_mode == StatisticsModes.skip.value
+        ):
+            description += (
+                "- Statistics mode: skip (features count and extent not computed)\n"
+            )
+
         if (
             (self.crs_name and self.crs_name != "srs_undefined")
             or self.crs_registry
@@ -138,7 +167,7 @@ class MetaDataset:
         """
         if isinstance(self.path, Path):
             return f"{self.path.resolve()}"
-        elif isinstance(self, MetaDatabaseTable) and isinstance(
+        elif isinstance(self, (MetaDatabaseTable, MetaDatabaseRaster)) and isinstance(
             self.database_connection, DatabaseConnection
         ):
             if self.database_connection.service_name is not None:
@@ -167,7 +196,7 @@ class MetaDataset:
         """
         to_slug = ""
 
-        if isinstance(self, MetaDatabaseTable):
+        if isinstance(self, (MetaDatabaseTable, MetaDatabaseRaster)):
             if self.database_connection.database_name:
                 to_slug += f" {self.database_connection.database_name} "
             elif self.database_connection.service_name:
@@ -238,7 +267,7 @@ class MetaVectorDataset(MetaDataset):
     """Vector dataset abstraction model."""
 
     feature_attributes: list[AttributeField] | None = None
-    features_objects_count: int = 0
+    features_objects_count: int | None = 0
     geometry_type: str | None = None
 
     @property
@@ -300,9 +329,12 @@ class MetaDatabaseFlat(MetaDataset):
         """Calculate the total number of feature objects of every layer.
 
         Returns:
-            int | None: total number of feature objects or None if no layers listed
+            int | None: total number of feature objects or None if no layers listed or
+            if a layer count is unknown
         """
-        if self.layers is not None:
+        if self.layers is not None and all(
+            layer.features_objects_count is not None for layer in self.layers
+        ):
             return sum([layer.features_objects_count for layer in self.layers])
 
         return None
@@ -361,6 +393,41 @@ class MetaRasterDataset(MetaDataset):
         return out_markdown
 
 
+@dataclass
+class MetaDatabaseRaster(MetaRasterDataset):
+    """Database raster table abstraction model."""
+
+    database_connection: DatabaseConnection | None = None
+    schema_name: str = "public"
+    raster_column: str | None = None
+    # tiling
+    tile_width: int | None = None
+    tile_height: int | None = None
+    tiles_count: int | None = None
+    # bands
+    pixel_types: list[str] | None = None
+    nodata_values: list[float | None] | None = None
+    is_out_db: bool = False
+    # overview tables with their factor
+    overviews: list[str] | None = None
+
+    @property
+    def as_markdown_image_metadata(self) -> str:
+        """Return raster metadata as a Markdown table, with tiling and overviews.
+
+        Returns:
+            string containing markdown table
+        """
+        out_markdown = super().as_markdown_image_metadata
+        out_markdown += f"| Pixel types | {', '.join(self.pixel_types or [])}\n"
+        out_markdown += f"| Tile size | {self.tile_width} x {self.tile_height}\n"
+        out_markdown += f"| Tiles count | {self.tiles_count}\n"
+        out_markdown += f"| Out-db | {self.is_out_db}\n"
+        out_markdown += f"| Overviews | {', '.join(self.overviews or [])}\n"
+
+        return out_markdown
+
+
 # ############################################################################
 # #### Stand alone program ########
 # #################################
@@ -0,0 +1,57 @@
+"""
+Processing message model.
+"""
+
+# ############################################################################
+# ######### Libraries #############
+# #################################
+
+# Standard library
+import logging
+from dataclasses import dataclass
+
+# ############################################################################
+# ########## Globals ###############
+# ##################################
+
+
+logger = logging.getLogger(__name__)
+
+# GDAL error classes (CPLErr), mirrored to keep models independent from GDAL
+GDAL_ERROR_LEVELS: dict[int, str] = {
+    0: "None",
+    1: "Debug",
+    2: "Warning",
+    3: "Failure",
+    4: "Fatal",
+}
+
+# ############################################################################
+# ######### Classes #############
+# ###############################
+
+
+@dataclass
+class ProcessingMessage:
+    """Message raised by GDAL while a dataset was read."""
+
+    level: int
+    code: int
+    message: str
+
+    @property
+    def level_name(self) -> str:
+        """Human readable level.
+
+        Returns:
+            level name (Warning, Failure...)
+        """
+        return GDAL_ERROR_LEVELS.get(self.level, f"{self.level}")
+
+    def __str__(self) -> str:
+        """Message as string.
+
+        Returns:
+            level, code and message
+        """
+        return f"{self.level_name} ({self.code}): {self.message}"
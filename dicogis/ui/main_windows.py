@@ -19,6 +19,7 @@ import getpass
 import locale
 import logging
 import platform
+from os import getenv
 from pathlib import Path
 from sys import platform as opersys
 
@@ -42,6 +43,8 @@ from typer import launch
 
 # Project
 from dicogis import __about__
+from dicogis.cache.inventory_cache import InventoryCache, get_inventory_cache
+from dicogis.cache.listing_index import ListingIndex
 from dicogis.cli.cmd_inventory import determine_output_path
 from dicogis.constants import AvailableLocales, OutputFormats
 from dicogis.export.base_serializer import MetadatasetSerializerBase
@@ -53,6 +56,7 @@ from dicogis.ui import MiscButtons, TabCredits, TabDatabaseServer, TabFiles, Tab
 from dicogis.utils.checknorris import CheckNorris
 from dicogis.utils.notifier import send_system_notify
 from dicogis.utils.options import OptionsManager
+from dicogis.utils.str2bool import str2bool
 from dicogis.utils.texts import TextsManager
 from dicogis.utils.utils import Utilities
 
@@ -400,6 +404,13 @@ class DicoGIS(ThemedTk):
         self.prog_layers.start()
         logger.info(f"Begin of folders parsing: {target_folder}")
 
+        # folders which have not changed since the previous listing are not read again
+        listing_index = None
+        if str2bool(getenv("DICOGIS_CACHE", "true")):
+            listing_index = ListingIndex(
+                rescan=str2bool(getenv("DICOGIS_RESCAN", "false"))
+            )
+
         (
             self.num_folders,
             self.li_shapefiles,
@@ -418,7 +429,13 @@ class DicoGIS(ThemedTk):
             self.li_file_databases,
             self.li_file_database_spatialite,
             self.li_file_database_geopackage,
-        ) = find_geodata_files(start_folder=target_folder)
+        ) = find_geodata_files(
+            start_folder=target_folder,
+            walker_threads=int(getenv("DICOGIS_WALKER_THREADS", "8")),
+            listing_index=listing_index,
+        )
+        if listing_index is not None:
+            listing_index.close()
 
         # end of listing
         self.prog_layers.stop()
@@ -612,6 +629,10 @@ class DicoGIS(ThemedTk):
             progress_callback_cmd=self.update,
             # misc
             opt_quick_fail=self.tab_options.opt_quick_fail.get(),
+            opt_stats_mode=getenv("DICOGIS_STATS", "exact").lower(),
+            # cache
+            opt_cache=str2bool(getenv("DICOGIS_CACHE", "true")),
+            opt_cache_ttl=int(getenv("DICOGIS_CACHE_TTL", "168")),
         )
 
         # sheets and progress bar
@@ -652,19 +673,20 @@ class DicoGIS(ThemedTk):
         )
         self.serializer.output_path = Path(self.ent_outxl_filename.get())
 
-        # setting progress bar
-        self.prog_layers["maximum"] = sgbd_reader.conn.GetLayerCount()
-        # parsing the layers
-        for idx_layer in range(sgbd_reader.conn.GetLayerCount()):
-            layer = sgbd_reader.conn.GetLayerByIndex(idx_layer)
-            self.status.set(f"Reading: {layer.GetName()}")
-            metadataset = sgbd_reader.infos_dataset(layer)
-            logger.debug(f"Table examined: {metadataset.name}")
-            self.serializer.serialize_metadaset(metadataset=metadataset)
-            logger.debug(f"Layer metadata stored into workbook: {metadataset.name}")
-            # increment the progress bar
-            self.prog_layers["value"] = self.prog_layers["value"] + 1
-            self.update()
+        # parsing the layers within a single reading session
+        with sgbd_reader:
+            # setting progress bar: tables and views, then catalog rasters
+            self.prog_layers["maximum"] = sgbd_reader.conn.GetLayerCount() + len(
+                sgbd_reader.read_catalog_rasters()
+            )
+            for metadataset in sgbd_reader.iter_metadatasets():
+                self.status.set(f"Read: {metadataset.name}")
+                logger.debug(f"Table examined: {metadataset.name}")
+                self.serializer.serialize_metadaset(metadataset=metadataset)
+                logger.debug(f"Layer metadata stored into workbook: {metadataset.name}")
+                # increment the progress bar
+                self.prog_layers["value"] = self.prog_layers["value"] + 1
+                self.update()
 
         # saving dictionary
         self.serializer.post_serializing()
@@ -756,6 +778,19 @@ class DicoGIS(ThemedTk):
         sgbd_reader = ReadPostGIS(
             service=self.tab_sgbd.ddl_pg_services.get(),
             views_included=self.tab_sgbd.opt_pg_views.get(),
+            stats_mode=getenv("DICOGIS_STATS", "exact").lower(),
+            exact_stats_below_mb=int(getenv("DICOGIS_PG_EXACT_BELOW_MB", "50")),
+            max_connections=int(getenv("DICOGIS_PG_CONNECTIONS", "1")),
+            view_max_cost=float(getenv("DICOGIS_PG_VIEW_MAX_COST", "1000000")),
+            view_statement_timeout=int(getenv("DICOGIS_PG_VIEW_TIMEOUT", "60")),
+            inventory_cache=(
+                get_inventory_cache(
+                    database_path=InventoryCache.default_database_path(),
+                    ttl_hours=int(getenv("DICOGIS_CACHE_TTL", "168")),
+                )
+                if str2bool(getenv("DICOGIS_CACHE", "true"))
+                else None
+            ),
         )
         sgbd_reader.get_connection()
 
@@ -0,0 +1,243 @@
+#! python3  # noqa: E265
+
+"""
+Benchmark geodata files listing on a synthetic folders tree: compare the former
+format dispatch (one path.isfile per sidecar candidate) with the lookup table and
+folder index of GeodataFilesLister, walking folders one by one or concurrently.
+
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # default: 1 000 000 files in a temporary folder
+    python tests/dev/dev_benchmark_listing.py
+    # smaller tree, kept for further runs
+    python tests/dev/dev_benchmark_listing.py --files 100000 --folder /tmp/dicogis_bench
+    # simulate a network share
+    python tests/dev/dev_benchmark_listing.py --files 20000 --latency-ms 20
+"""
+
+# ############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import argparse
+import os
+import tempfile
+from collections import Counter
+from contextlib import contextmanager
+from os import path, walk
+from pathlib import Path
+from time import perf_counter, sleep
+
+# package
+from dicogis.constants import FormatsRaster
+from dicogis.listing import geodata_listing
+from dicogis.listing.geodata_listing import GeodataFilesLister
+
+# ############################################################################
+# ########## Globals ###############
+# ##################################
+
+# files per folder and datasets templates (extensions of files created together)
+FILES_PER_FOLDER: int = 1000
+DATASETS_TEMPLATES: tuple[tuple[str, ...], ...] = (
+    (".shp", ".shx", ".dbf", ".prj", ".cpg"),
+    (".SHP", ".SHX", ".DBF", ".PRJ"),
+    (".shp", ".dbf"),  # incomplete shapefile
+    (".tab", ".dat", ".map", ".id"),
+    (".geojson",),
+    (".kml",),
+    (".gml", ".xsd"),
+    (".tif", ".tfw", ".aux.xml"),
+    (".gpkg",),
+    (".dxf",),
+    (".pdf",),
+    (".docx",),
+    (".csv",),
+    (".txt",),
+)
+
+# ############################################################################
+# ########## Functions #############
+# ##################################
+
+
+@contextmanager
+def count_syscalls(counter: Counter, latency: float = 0):
+    """Count calls to os.stat and os.scandir (used by path.isfile and walkers),
+    optionally adding a latency to each call to simulate a network share."""
+    original_stat, original_scandir = os.stat, os.scandir
+
+    def counted_stat(*args, **kwargs):
+        counter["stat"] += 1
+        sleep(latency)
+        return original_stat(*args, **kwargs)
+
+    def counted_scandir(*args, **kwargs):
+        counter["scandir"] += 1
+        sleep(latency)
+        return original_scandir(*args, **kwargs)
+
+    # concurrent walker imports scandir from os
+    os.stat, os.scandir = counted_stat, counted_scandir
+    geodata_listing.scandir = counted_scandir
+    try:
+        yield counter
+    finally:
+        os.stat, os.scandir = original_stat, original_scandir
+        geodata_listing.scandir = original_scandir
+
+
+def create_synthetic_tree(root_folder: Path, files_count: int) -> int:
+    """Create empty files mimicking a geodata folders tree.
+
+    Args:
+        root_folder: folder where to create the tree
+        files_count: approximative number of files to create
+
+    Returns:
+        number of created files
+    """
+    created: int = 0
+    idx_dataset: int = 0
+    while created < files_count:
+        folder = root_folder.joinpath(
+            f"theme_{created // (FILES_PER_FOLDER * 10):03d}",
+            f"folder_{created // FILES_PER_FOLDER:05d}",
+        )
+        folder.mkdir(parents=True, exist_ok=True)
+        for extension in DATASETS_TEMPLATES[idx_dataset % len(DATASETS_TEMPLATES)]:
+            folder.joinpath(f"dataset_{idx_dataset}{extension}").touch()
+            created += 1
+        idx_dataset += 1
+
+    return created
+
+
+def legacy_get_file_format(full_path: str) -> str | None:
+    """Former format dispatch of find_geodata_files, kept for comparison."""
+    if (
+        path.splitext(full_path.lower())[1].lower() == ".shp"
+        and (
+            path.isfile(f"{full_path[:-4]}.dbf") or path.isfile(f"{full_path[:-4]}.DBF")
+        )
+        and (
+            path.isfile(f"{full_path[:-4]}.shx") or path.isfile(f"{full_path[:-4]}.SHX")
+        )
+    ):
+        return "esri_shapefile"
+    elif (
+        path.splitext(full_path.lower())[1] == ".tab"
+        and (
+            path.isfile(full_path[:-4] + ".dat") or path.isfile(full_path[:-4] + ".DAT")
+        )
+        and (
+            path.isfile(full_path[:-4] + ".map") or path.isfile(full_path[:-4] + ".MAP")
+        )
+        and (path.isfile(full_path[:-4] + ".id") or path.isfile(full_path[:-4] + ".ID"))
+    ):
+        return "mapinfo_tab"
+    elif (
+        path.splitext(full_path.lower())[1] == ".kml"
+        or path.splitext(full_path.lower())[1] == ".kmz"
+    ):
+        return "kml"
+    elif path.splitext(full_path.lower())[1] == ".gml":
+        return "gml"
+    elif path.splitext(full_path.lower())[1] == ".geojson":
+        return "geojson"
+    elif path.splitext(full_path.lower())[1] in (".geotiff", "tiff"):
+        return "geotiff"
+    elif path.splitext(full_path.lower())[1] == ".gxt":
+        return "gxt"
+    elif FormatsRaster.has_key(path.splitext(full_path.lower())[1]):
+        return "raster"
+    elif path.splitext(full_path.lower())[1] == ".dxf":
+        return "dxf"
+    elif path.splitext(full_path.lower())[1] == ".dwg":
+        return "dwg"
+    elif path.splitext(full_path.lower())[1] == ".dgn":
+        return "dgn"
+    elif path.splitext(full_path.lower())[1] == ".gpkg":
+        return "file_geodatabase_geopackage"
+    elif path.splitext(full_path.lower())[1] == ".sqlite":
+        return "file_geodatabase_spatialite"
+
+    return None
+
+
+def legacy_listing(start_folder: Path) -> list[tuple[str, str]]:
+    """Former listing loop."""
+    listed = []
+    for root, dirs, files in walk(start_folder):
+        for d in dirs:
+            full_path = path.join(root, d)
+            if full_path[-4:].lower() == ".gdb":
+                listed.append(("file_geodatabase_esri", path.abspath(full_path)))
+        for f in files:
+            full_path = path.join(root, f)
+            if dataset_format := legacy_get_file_format(full_path):
+                listed.append((dataset_format, full_path))
+    return listed
+
+
+def run_benchmark(start_folder: Path, latency: float = 0):
+    """Run listings and print elapsed time and file system calls.
+
+    Args:
+        start_folder: folder to list
+        latency: simulated latency of each file system call, in seconds
+    """
+    results = {}
+    for label, listing in (
+        ("legacy", legacy_listing),
+        ("lookup table", lambda folder: list(GeodataFilesLister(start_folder=folder))),
+        (
+            "8 threads",
+            lambda folder: list(
+                GeodataFilesLister(start_folder=folder, walker_threads=8)
+            ),
+        ),
+    ):
+        with count_syscalls(Counter(), latency=latency) as counter:
+            start = perf_counter()
+            listed = listing(start_folder)
+            elapsed = perf_counter() - start
+        results[label] = listed
+        print(
+            f"{label:>14}: {len(listed):>9} datasets in {elapsed:8.2f}s - "
+            f"stat calls: {counter['stat']:>9} - scandir calls: {counter['scandir']:>6}"
+        )
+
+    assert sorted(results["legacy"]) == sorted(results["lookup table"])
+    assert results["lookup table"] == results["8 threads"]
+
+
+# ############################################################################
+# #### Stand alone program ########
+# #################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=1_000_000)
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0,
+        help="Simulated latency of each stat/scandir call, in milliseconds.",
+    )
+    parser.add_argument(
+        "--folder",
+        type=Path,
+        default=None,
+        help="Folder where to create the tree. Reused if it already exists.",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="dicogis_bench_listing_") as tmp_folder:
+        bench_folder = args.folder or Path(tmp_folder)
+        if not any(bench_folder.glob("theme_*")):
+            print(f"Creating {args.files} files into {bench_folder}...")
+            create_synthetic_tree(root_folder=bench_folder, files_count=args.files)
+        run_benchmark(start_folder=bench_folder, latency=args.latency_ms / 1000)
@@ -0,0 +1,202 @@
+#! python3  # noqa: E265
+
+"""
+Benchmark datasets opening per format: compare GDAL probing every registered driver
+with trying first the drivers expected for the format (allowed drivers of
+ProcessingFiles.MATRIX_FORMAT_GEOREADER).
+
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # default: 200 opens of each sample dataset, created in a temporary folder
+    python tests/dev/dev_benchmark_open.py
+    # more features per dataset, kept for further runs
+    python tests/dev/dev_benchmark_open.py --features 10000 --folder /tmp/dicogis_bench
+"""
+
+# ############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import argparse
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+# 3rd party
+from osgeo import gdal, ogr, osr
+
+# package
+from dicogis.georeaders.base_georeader import GeoReadersSessions
+from dicogis.georeaders.process_files import ProcessingFiles
+
+# ############################################################################
+# ########## Globals ###############
+# ##################################
+
+# dataset format: GDAL driver used to create the sample dataset, file extension
+SAMPLES_FORMATS: dict[str, tuple[str, str]] = {
+    "esri_shapefile": ("ESRI Shapefile", ".shp"),
+    "mapinfo_tab": ("MapInfo File", ".tab"),
+    "kml": ("KML", ".kml"),
+    "gml": ("GML", ".gml"),
+    "geojson": ("GeoJSON", ".geojson"),
+    "file_geodatabase_geopackage": ("GPKG", ".gpkg"),
+    "file_geodatabase_spatialite": ("SQLite", ".sqlite"),
+    "dxf": ("DXF", ".dxf"),
+    "geotiff": ("GTiff", ".tif"),
+}
+
+# ############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def create_sample_dataset(
+    folder: Path, dataset_format: str, features_count: int
+) -> Path:
+    """Create a sample dataset of a format, made of points (or a small raster).
+
+    Args:
+        folder: folder where to create the dataset
+        dataset_format: dataset format, as listed by GeodataFilesLister
+        features_count: number of points to create
+
+    Returns:
+        path to the dataset
+    """
+    driver_name, extension = SAMPLES_FORMATS[dataset_format]
+    dataset_path = folder.joinpath(f"sample_{dataset_format}{extension}")
+    if dataset_path.exists():
+        return dataset_path
+
+    spatial_reference = osr.SpatialReference()
+    spatial_reference.ImportFromEPSG(4326)
+
+    if dataset_format == "geotiff":
+        dataset = gdal.GetDriverByName(driver_name).Create(
+            str(dataset_path), 256, 256, 1, gdal.GDT_Byte
+        )
+        dataset.SetGeoTransform((2.0, 0.001, 0, 48.0, 0, -0.001))
+        dataset.SetProjection(spatial_reference.ExportToWkt())
+        dataset = None
+        return dataset_path
+
+    dataset = ogr.GetDriverByName(driver_name).CreateDataSource(str(dataset_path))
+    layer = dataset.CreateLayer("sample", srs=spatial_reference, geom_type=ogr.wkbPoint)
+    # DXF layers have a fixed structure
+    if dataset_format != "dxf":
+        layer.CreateField(ogr.FieldDefn("name", ogr.OFTString))
+    for feature_idx in range(features_count):
+        feature = ogr.Feature(layer.GetLayerDefn())
+        if dataset_format != "dxf":
+            feature.SetField("name", f"feature {feature_idx}")
+        feature.SetGeometry(
+            ogr.CreateGeometryFromWkt(f"POINT ({2 + feature_idx / features_count} 48)")
+        )
+        layer.CreateFeature(feature)
+    dataset = None
+
+    return dataset_path
+
+
+def time_opens(
+    georeader, dataset_path: Path, opens_count: int, allowed_drivers=None
+) -> float:
+    """Open a dataset several times and return the mean duration of an open.
+
+    Args:
+        georeader: opened georeader of the dataset format
+        dataset_path: dataset to open
+        opens_count: number of opens
+        allowed_drivers: GDAL drivers to try first. Defaults to None.
+
+    Returns:
+        mean duration of an open, in milliseconds
+    """
+    start = perf_counter()
+    for _ in range(opens_count):
+        dataset = georeader.open_dataset_with_gdal(
+            source_dataset=dataset_path, allowed_drivers=allowed_drivers
+        )
+        dataset = None  # noqa: F841
+    return (perf_counter() - start) * 1000 / opens_count
+
+
+def run_benchmark(folder: Path, features_count: int, opens_count: int):
+    """Create sample datasets and print mean open duration per format.
+
+    Args:
+        folder: folder where to create sample datasets
+        features_count: number of features of vector samples
+        opens_count: number of opens of each sample
+    """
+    print(
+        f"{'format':>28} | {'driver':>14} | {'probing (ms)':>12} | "
+        f"{'allowed (ms)':>12} | gain"
+    )
+    with GeoReadersSessions() as georeaders:
+        for dataset_format in SAMPLES_FORMATS:
+            georeader_class, allowed_drivers = ProcessingFiles.MATRIX_FORMAT_GEOREADER[
+                dataset_format
+            ]
+            try:
+                dataset_path = create_sample_dataset(
+                    folder=folder,
+                    dataset_format=dataset_format,
+                    features_count=features_count,
+                )
+            except Exception as err:
+                print(f"{dataset_format:>28} | skipped: {err}")
+                continue
+
+            georeader = georeaders.get(georeader_class)
+            driver_name = (
+                georeader.open_dataset_with_gdal(source_dataset=dataset_path)
+                .GetDriver()
+                .ShortName
+            )
+            # warm up: first open loads drivers and file in cache
+            time_opens(georeader, dataset_path, 3, allowed_drivers)
+
+            probing = time_opens(georeader, dataset_path, opens_count)
+            allowed = time_opens(
+                georeader, dataset_path, opens_count, allowed_drivers=allowed_drivers
+            )
+            print(
+                f"{dataset_format:>28} | {driver_name:>14} | {probing:12.3f} | "
+                f"{allowed:12.3f} | {probing / allowed:4.1f}x"
+            )
+
+
+# ############################################################################
+# #### Stand alone program ########
+# #################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--features",
+        type=int,
+        default=1000,
+        help="Number of features of vector samples.",
+    )
+    parser.add_argument(
+        "--opens", type=int, default=200, help="Number of opens of each sample."
+    )
+    parser.add_argument(
+        "--folder",
+        type=Path,
+        default=None,
+        help="Folder where to create samples. Reused if it already exists.",
+    )
+    args = parser.parse_args()
+
+    gdal.UseExceptions()
+    with tempfile.TemporaryDirectory(prefix="dicogis_bench_open_") as tmp_folder:
+        bench_folder = args.folder or Path(tmp_folder)
+        bench_folder.mkdir(parents=True, exist_ok=True)
+        run_benchmark(
+            folder=bench_folder, features_count=args.features, opens_count=args.opens
+        )
@@ -0,0 +1,91 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+    # for whole tests
+    python -m unittest tests.test_export_xlsx
+    # for specific test
+    python -m unittest tests.test_export_xlsx.TestExportXlsx.test_sort_rows_by_path
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import tempfile
+import unittest
+from pathlib import Path
+
+# 3rd party
+from openpyxl import load_workbook
+
+# package
+from dicogis.export.to_xlsx import MetadatasetSerializerXlsx
+from dicogis.models.metadataset import MetaVectorDataset
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestExportXlsx(unittest.TestCase):
+    """Test Excel serializer."""
+
+    #  -- Tests ------------------------------------------------------------
+    def test_sort_rows_by_path(self):
+        """Rows serialized out of order are sorted by dataset path on demand."""
+        with tempfile.TemporaryDirectory(prefix="dicogis_test_") as tmp_dir:
+            output_path = Path(tmp_dir).joinpath("inventory.xlsx")
+            serializer = MetadatasetSerializerXlsx(
+                output_path=output_path, opt_raw_path=True
+            )
+            serializer.pre_serializing(has_vector=True)
+            for name in ("roads", "bridges", "rivers"):
+                serializer.serialize_metadaset(
+                    MetaVectorDataset(
+                        name=name,
+                        path=Path(tmp_dir).joinpath(f"{name}.shp"),
+                        dataset_type="flat_vector",
+                        files_dependencies=[],
+                        storage_size=1024,
+                    )
+                )
+            serializer.post_serializing(sort_rows=True)
+
+            worksheet = load_workbook(output_path).worksheets[0]
+            self.assertEqual(
+                [row[0] for row in worksheet.iter_rows(min_row=2, values_only=True)],
+                ["bridges", "rivers", "roads"],
+            )
+
+    def test_error_column_by_sheet(self):
+        """Processing errors are stored in each worksheet's GDAL messages column."""
+        self.assertEqual(
+            MetadatasetSerializerXlsx.get_error_column(
+                columns=MetadatasetSerializerXlsx.li_cols_vector
+            ),
+            "Q",
+        )
+        self.assertEqual(
+            MetadatasetSerializerXlsx.get_error_column(
+                columns=MetadatasetSerializerXlsx.li_cols_sgbd
+            ),
+            "M",
+        )
+        # no GDAL messages column: first column after headers
+        self.assertEqual(
+            MetadatasetSerializerXlsx.get_error_column(
+                columns=MetadatasetSerializerXlsx.li_cols_filedb
+            ),
+            "Q",
+        )
+
+
+# #############################################################################
+# ##### Main #######################
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
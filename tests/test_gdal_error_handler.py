@@ -0,0 +1,88 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+    # for whole tests
+    python -m unittest tests.test_gdal_error_handler
+    # for specific test
+    python -m unittest tests.test_gdal_error_handler.TestGdalErrorHandler.test_messages_per_thread
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+# 3rd party
+from osgeo import gdal
+
+# package
+from dicogis.georeaders.gdal_exceptions_handler import GdalErrorHandler
+from dicogis.models.metadataset import MetaVectorDataset
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestGdalErrorHandler(unittest.TestCase):
+    """Test GDAL messages collection."""
+
+    #  -- Tests ------------------------------------------------------------
+    def test_messages_collection(self):
+        """Every message is collected with level and code, debug ones excepted."""
+        error_handler = GdalErrorHandler()
+        metadataset = MetaVectorDataset(name="test")
+        error_handler.reset()
+        metadataset.processing_messages = error_handler.messages
+
+        error_handler.handler(gdal.CE_Warning, 1, "first warning")
+        error_handler.handler(gdal.CE_Debug, 0, "debug message")
+        error_handler.handler(gdal.CE_Failure, 4, "failure")
+
+        self.assertEqual(
+            [(m.level, m.code, m.message) for m in metadataset.processing_messages],
+            [(gdal.CE_Warning, 1, "first warning"), (gdal.CE_Failure, 4, "failure")],
+        )
+        self.assertEqual(error_handler.err_msg, "failure")
+        self.assertEqual(error_handler.err_type, 4)
+
+        # reset starts a new collection, leaving the attached one untouched
+        error_handler.reset()
+        error_handler.handler(gdal.CE_Warning, 1, "next dataset")
+        self.assertEqual(len(metadataset.processing_messages), 2)
+        self.assertEqual(len(error_handler.messages), 1)
+
+    def test_messages_per_thread(self):
+        """Messages raised in a thread are not visible from another one."""
+        error_handler = GdalErrorHandler()
+        barrier = Barrier(4)
+
+        def read_in_thread(idx_thread: int) -> list[str]:
+            error_handler.reset()
+            barrier.wait()
+            for idx_message in range(50):
+                error_handler.handler(
+                    gdal.CE_Warning, idx_thread, f"{idx_thread}-{idx_message}"
+                )
+            barrier.wait()
+            return [message.message for message in error_handler.messages]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(read_in_thread, range(4)))
+
+        for idx_thread, messages in enumerate(results):
+            self.assertEqual(messages, [f"{idx_thread}-{idx}" for idx in range(50)])
+
+
+# #############################################################################
+# ##### Main #######################
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
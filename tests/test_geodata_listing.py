@@ -0,0 +1,236 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+    # for whole tests
+    python -m unittest tests.test_geodata_listing
+    # for specific test
+    python -m unittest tests.test_geodata_listing.TestGeodataListing.test_sidecars_detection
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+# package
+from dicogis.cache.listing_index import ListingIndex
+from dicogis.listing.folder_files import folders_files_index
+from dicogis.listing.geodata_listing import (
+    GeodataFilesLister,
+    find_geodata_files,
+    read_folder,
+    walk_concurrently,
+)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestGeodataListing(unittest.TestCase):
+    """Test geodata files listing."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Executed before each test."""
+        self.tmp_dir = tempfile.TemporaryDirectory(prefix="dicogis_test_listing_")
+        self.tmp_path = Path(self.tmp_dir.name)
+
+        files_to_create = (
+            # complete shapefiles, with mixed case extensions
+            "vectors/roads.shp",
+            "vectors/roads.shx",
+            "vectors/roads.dbf",
+            "vectors/RIVERS.SHP",
+            "vectors/RIVERS.SHX",
+            "vectors/RIVERS.DBF",
+            # incomplete shapefile
+            "vectors/lonely.shp",
+            "vectors/lonely.dbf",
+            # MapInfo tables
+            "vectors/communes.tab",
+            "vectors/communes.dat",
+            "vectors/communes.map",
+            "vectors/communes.id",
+            "vectors/incomplete.tab",
+            # single file formats
+            "vectors/points.geojson",
+            "vectors/tracks.KML",
+            "databases/data.gpkg",
+            "cad/plan.dxf",
+            "misc/notes.txt",
+        )
+        for file_to_create in files_to_create:
+            file_path = self.tmp_path.joinpath(file_to_create)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.touch()
+        self.tmp_path.joinpath("databases/esri.gdb").mkdir()
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.tmp_dir.cleanup()
+
+    # -- Tests ------------------------------------------------------------
+    def test_sidecars_detection(self):
+        """Multi-files formats are listed only with their sidecars."""
+        folder_files = GeodataFilesLister.index_folder_files(
+            file_names=["roads.SHP", "roads.DBF", "roads.shx", "lonely.shp"]
+        )
+        lister = GeodataFilesLister(start_folder=self.tmp_path)
+
+        self.assertEqual(
+            lister.get_file_format(file_name="roads.SHP", folder_files=folder_files),
+            "esri_shapefile",
+        )
+        self.assertIsNone(
+            lister.get_file_format(file_name="lonely.shp", folder_files=folder_files)
+        )
+        self.assertIsNone(lister.get_file_format(file_name="roads.shp"))
+        self.assertEqual(lister.get_file_format(file_name="t.GeoJSON"), "geojson")
+        self.assertIsNone(lister.get_file_format(file_name="readme.txt"))
+
+    def test_sibling_files(self):
+        """Files around listed datasets are known without reading folders again."""
+        folders_files_index.clear()
+        self.tmp_path.joinpath("vectors", "roads.shp.xml").touch()
+        self.tmp_path.joinpath("vectors", "roadside.txt").touch()
+        self.assertIsNone(
+            folders_files_index.get_sibling_files(self.tmp_path / "vectors/roads.shp")
+        )
+
+        listed = find_geodata_files(start_folder=self.tmp_path)
+        self.assertEqual(
+            sorted(folders_files_index.get_sibling_files(listed[1][1])),
+            ["roads.dbf", "roads.shp", "roads.shp.xml", "roads.shx"],
+        )
+        self.assertEqual(
+            sorted(folders_files_index.get_sibling_files(listed[1][0])),
+            ["RIVERS.DBF", "RIVERS.SHP", "RIVERS.SHX"],
+        )
+        # directories and folders without datasets are not indexed
+        self.assertIsNone(folders_files_index.get_sibling_files(listed[9][0]))
+        self.assertIsNone(
+            folders_files_index.get_sibling_files(self.tmp_path / "misc/notes.txt")
+        )
+
+        # sizes got while reading the folder are indexed with files
+        self.tmp_path.joinpath("vectors", "roads.dbf").write_bytes(b"0" * 42)
+        files_sizes: dict[str, int] = {}
+        _, files, _ = read_folder(
+            folder=str(self.tmp_path / "vectors"), files_sizes=files_sizes
+        )
+        self.assertEqual(sorted(files_sizes), sorted(files))
+        folders_files_index.add_folder(
+            folder=self.tmp_path / "vectors", file_names=files, files_sizes=files_sizes
+        )
+        sibling_files = folders_files_index.get_sibling_files(listed[1][1])
+        self.assertEqual(sibling_files["roads.dbf"], 42)
+        self.assertEqual(sibling_files["roads.shx"], 0)
+
+        # folders are removed once their datasets have been dispatched
+        folders_files_index.remove_folder(folder=self.tmp_path / "vectors")
+        self.assertIsNone(folders_files_index.get_sibling_files(listed[1][1]))
+
+    def test_find_geodata_files(self):
+        """Files are dispatched by format."""
+        listed = find_geodata_files(start_folder=self.tmp_path)
+
+        self.assertEqual(
+            [Path(shp).name for shp in listed[1]], ["RIVERS.SHP", "roads.shp"]
+        )
+        self.assertEqual([Path(tab).name for tab in listed[2]], ["communes.tab"])
+        self.assertEqual([Path(kml).name for kml in listed[3]], ["tracks.KML"])
+        self.assertEqual([Path(gj).name for gj in listed[5]], ["points.geojson"])
+        self.assertEqual([Path(gdb).name for gdb in listed[9]], ["esri.gdb"])
+        self.assertEqual([Path(dxf).name for dxf in listed[10]], ["plan.dxf"])
+        self.assertEqual([Path(gpkg).name for gpkg in listed[16]], ["data.gpkg"])
+
+    def test_concurrent_walker(self):
+        """Concurrent walker gives the same result as os.walk, in the same order."""
+        self.assertEqual(
+            list(walk_concurrently(start_folder=self.tmp_path, max_workers=3)),
+            list(os.walk(self.tmp_path)),
+        )
+        self.assertEqual(
+            find_geodata_files(start_folder=self.tmp_path, walker_threads=4),
+            find_geodata_files(start_folder=self.tmp_path),
+        )
+
+    def test_listing_index(self):
+        """Unchanged folders are reused from the listing index, changed ones are
+        read again."""
+        expected = find_geodata_files(start_folder=self.tmp_path)
+        listing_index = ListingIndex(
+            database_path=self.tmp_path.joinpath("index", "listing.sqlite")
+        )
+        # test folders have just been created
+        listing_index.MTIME_SAFETY_DELAY_NS = 0
+
+        first = find_geodata_files(
+            start_folder=self.tmp_path.joinpath("databases"),
+            listing_index=listing_index,
+        )
+        self.assertEqual(first[16], expected[16])
+        self.assertEqual(listing_index.count_read, 2)
+
+        second = find_geodata_files(
+            start_folder=self.tmp_path.joinpath("databases"),
+            listing_index=listing_index,
+        )
+        self.assertEqual(second, first)
+        self.assertEqual(listing_index.count_reused, 2)
+
+        # a new file changes the folder modification time
+        self.tmp_path.joinpath("databases", "other.gpkg").touch()
+        third = find_geodata_files(
+            start_folder=self.tmp_path.joinpath("databases"),
+            listing_index=listing_index,
+        )
+        self.assertEqual(len(third[16]), 2)
+
+        listing_index.rescan = True
+        fourth = find_geodata_files(
+            start_folder=self.tmp_path.joinpath("databases"),
+            listing_index=listing_index,
+        )
+        self.assertEqual(fourth, third)
+        self.assertEqual(listing_index.count_reused, 3)
+        listing_index.close()
+
+    @unittest.skipIf(os.name == "nt", "file names are always valid on Windows")
+    def test_listing_index_undecodable_names(self):
+        """Names which are not valid UTF-8 are indexed and given back unchanged."""
+        folder_path = self.tmp_path.joinpath("databases")
+        undecodable_name = os.fsdecode(b"r\xe9seau.gpkg")
+        open(os.path.join(os.fsencode(folder_path), b"r\xe9seau.gpkg"), "wb").close()
+
+        listing_index = ListingIndex(
+            database_path=self.tmp_path.joinpath("index", "listing.sqlite")
+        )
+        listing_index.MTIME_SAFETY_DELAY_NS = 0
+        first = find_geodata_files(
+            start_folder=folder_path, listing_index=listing_index
+        )
+        second = find_geodata_files(
+            start_folder=folder_path, listing_index=listing_index
+        )
+        listing_index.close()
+
+        self.assertIn(str(folder_path.joinpath(undecodable_name)), first[16])
+        self.assertEqual(second, first)
+        self.assertEqual(listing_index.count_reused, 2)
+
+
+# #############################################################################
+# ##### Main #######################
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+    # for whole tests
+    python -m unittest tests.test_geopackage_catalog
+    # for specific test
+    python -m unittest tests.test_geopackage_catalog.TestGeopackageCatalog.test_fields_types
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+
+# package
+from dicogis.georeaders.geopackage_catalog import (
+    describe_columns,
+    get_ogr_field_type,
+    parse_layer_row,
+)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestGeopackageCatalog(unittest.TestCase):
+    """Test GeoPackage system tables description, without GDAL."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Executed before each test."""
+        self.layer = parse_layer_row(
+            row={
+                "table_name": "Roads",
+                "data_type": "features",
+                "min_x": 600000.123,
+                "min_y": 6800000.0,
+                "max_x": 610000.0,
+                "max_y": 6805000.456,
+                "geometry_column": "geom",
+                "geometry_type": "MULTILINESTRING",
+                "z": 1,
+                "m": 0,
+                "srs_id": 2154,
+                "srs_organization": "EPSG",
+                "srs_organization_id": 2154,
+                "srs_wkt": None,
+                "feature_count": 12,
+            }
+        )
+
+    #  -- Tests ------------------------------------------------------------
+    def test_layer_row(self):
+        """Extent is ordered as OGR does and missing counts are left to OGR."""
+        self.assertTrue(self.layer.is_spatial)
+        self.assertEqual(self.layer.features_count, 12)
+        self.assertEqual(
+            self.layer.extent, (600000.12, 610000.0, 6800000.0, 6805000.46)
+        )
+
+        layer = parse_layer_row(
+            row={
+                "table_name": "codes",
+                "data_type": "attributes",
+                "min_x": None,
+                "feature_count": None,
+            }
+        )
+        self.assertFalse(layer.is_spatial)
+        self.assertIsNone(layer.features_count)
+        self.assertEqual(layer.extent, (None, None, None, None))
+
+    def test_fields_types(self):
+        """Columns types are mapped as the OGR GPKG driver does."""
+        self.assertEqual(get_ogr_field_type("TEXT(80)"), ("String", 80))
+        self.assertEqual(get_ogr_field_type("text"), ("String", 0))
+        self.assertEqual(get_ogr_field_type("INTEGER"), ("Integer64", 0))
+        self.assertEqual(get_ogr_field_type("MEDIUMINT"), ("Integer", 0))
+        self.assertEqual(get_ogr_field_type("BOOLEAN"), ("Integer", 0))
+        self.assertEqual(get_ogr_field_type("DOUBLE"), ("Real", 0))
+        self.assertEqual(get_ogr_field_type("DATETIME"), ("DateTime", 0))
+        self.assertIsNone(get_ogr_field_type("JSON"))
+
+    def test_columns(self):
+        """FID and geometry columns are not feature attributes."""
+        describe_columns(
+            layer=self.layer,
+            columns=[
+                ("fid", "INTEGER", 1),
+                ("GEOM", "MULTILINESTRING", 0),
+                ("name", "TEXT(80)", 0),
+                ("lanes", "MEDIUMINT", 0),
+            ],
+        )
+        self.assertTrue(self.layer.is_describable)
+        self.assertEqual(
+            [
+                (field.name, field.data_type, field.length)
+                for field in self.layer.feature_attributes
+            ],
+            [("name", "String", 80), ("lanes", "Integer", 0)],
+        )
+
+        # unknown types and composite primary keys are left to OGR
+        describe_columns(layer=self.layer, columns=[("payload", "JSON", 0)])
+        self.assertFalse(self.layer.is_describable)
+
+        self.layer.is_describable = True
+        describe_columns(
+            layer=self.layer,
+            columns=[("code", "TEXT", 1), ("year", "INTEGER", 2)],
+        )
+        self.assertFalse(self.layer.is_describable)
+
+
+# #############################################################################
+# ##### Main #######################
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -121,3 +121,24 @@ class TestGeoReaderPostgis(unittest.TestCase):
             metadaset = pg_reader.infos_dataset(layer=layer)
             self.assertIsInstance(metadaset, MetaDatabaseTable)
             self.assertIsInstance(metadaset, MetaDataset)
+
+    def test_postgis_reader_pooled(self):
+        """Tables read with several connections come in the same order."""
+        pg_reader = ReadPostGIS(service="dicogis_test")
+        pg_reader.get_connection()
+        with pg_reader:
+            layers_names = [
+                metadataset.name for metadataset in pg_reader.iter_metadatasets()
+            ]
+
+        pg_reader_pooled = ReadPostGIS(service="dicogis_test", max_connections=4)
+        pg_reader_pooled.get_connection()
+        self.assertLessEqual(pg_reader_pooled.get_pool_size(), 4)
+        with pg_reader_pooled:
+            self.assertEqual(
+                [
+                    metadataset.name
+                    for metadataset in pg_reader_pooled.iter_metadatasets()
+                ],
+                layers_names,
+            )
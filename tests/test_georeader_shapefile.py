@@ -0,0 +1,123 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+    # for whole tests
+    python -m unittest tests.test_georeader_shapefile
+    # for specific test
+    python -m unittest tests.test_georeader_shapefile.TestReadShapefile.test_same_as_ogr
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+# package
+from dicogis.georeaders.read_shapefile import ReadShapefile
+from dicogis.georeaders.read_vector_flat_dataset import ReadVectorFlatDataset
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+# variables
+fixtures_folder = "tests/fixtures/gisdata/data/good/vector/"
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestReadShapefile(unittest.TestCase):
+    """Test shapefiles reader using headers."""
+
+    #  -- Tests ------------------------------------------------------------
+    def test_same_as_ogr(self):
+        """Reading headers must give the same metadata as reading with OGR."""
+        georeader_headers = ReadShapefile()
+        georeader_ogr = ReadVectorFlatDataset()
+
+        for fixture_filepath in sorted(Path(fixtures_folder).glob("**/*.shp")):
+            from_headers = georeader_headers.infos_dataset(fixture_filepath.resolve())
+            from_ogr = georeader_ogr.infos_dataset(fixture_filepath.resolve())
+
+            for attribute in (
+                "bbox",
+                "crs_name",
+                "crs_registry_code",
+                "crs_type",
+                "feature_attributes",
+                "features_objects_count",
+                "files_dependencies",
+                "format_gdal_long_name",
+                "geometry_type",
+                "storage_size",
+            ):
+                self.assertEqual(
+                    getattr(from_headers, attribute),
+                    getattr(from_ogr, attribute),
+                    f"{attribute} of {fixture_filepath}",
+                )
+
+    def test_fallback_to_ogr(self):
+        """Corrupted shapefiles are read with OGR and reported as failed."""
+        with tempfile.TemporaryDirectory(prefix="dicogis_test_") as tmp_dir:
+            corrupted_filepath = Path(tmp_dir).joinpath("corrupted.shp")
+            corrupted_filepath.write_bytes(b"not a shapefile")
+            Path(tmp_dir).joinpath("corrupted.dbf").write_bytes(b"not a dbf")
+            Path(tmp_dir).joinpath("corrupted.shx").write_bytes(b"not a shx")
+
+            with self.assertRaises(ValueError):
+                ReadShapefile.read_shp_header(shp_path=corrupted_filepath)
+
+            metadataset = ReadShapefile().infos_dataset(corrupted_filepath.resolve())
+
+        self.assertFalse(metadataset.processing_succeeded)
+
+    def test_dbf_wide_character_field(self):
+        """Character fields wider than 255 use both width bytes, as in shapelib."""
+        descriptor = struct.pack("<11sc4xBB14x", b"comment", b"C", 44, 1)
+        with tempfile.TemporaryDirectory(prefix="dicogis_test_") as tmp_dir:
+            dbf_filepath = Path(tmp_dir).joinpath("wide.dbf")
+            dbf_filepath.write_bytes(
+                struct.pack("<B3xIHH20x", 3, 0, 65, 301) + descriptor + b"\x0d"
+            )
+
+            feature_attributes = ReadShapefile.read_dbf_fields(dbf_path=dbf_filepath)
+
+        self.assertEqual(len(feature_attributes), 1)
+        self.assertEqual(feature_attributes[0].name, "comment")
+        self.assertEqual(feature_attributes[0].length, 300)
+        self.assertEqual(feature_attributes[0].precision, 0)
+
+    def test_sidecar_from_sibling_files(self):
+        """Sidecar files are looked up in the sibling files when they are known."""
+        shp_filepath = Path("not_listed/roads.shp")
+
+        self.assertEqual(
+            ReadShapefile.get_sidecar_file(
+                main_path=shp_filepath,
+                extension="dbf",
+                sibling_files=("roads.shp", "roads.DBF"),
+            ),
+            shp_filepath.with_suffix(".DBF"),
+        )
+        with self.assertRaises(FileNotFoundError):
+            ReadShapefile.get_sidecar_file(
+                main_path=shp_filepath, extension="prj", sibling_files=("roads.shp",)
+            )
+
+
+# #############################################################################
+# ##### Main #######################
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
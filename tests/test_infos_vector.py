@@ -10,12 +10,18 @@ Usage from the repo root folder:
 # ##################################
 
 # Standard library
+import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
 
+# 3rd party
+from osgeo import ogr, osr
+
 # package
+from dicogis.georeaders.base_georeader import GeoReadersSessions
 from dicogis.georeaders.read_vector_flat_dataset import ReadVectorFlatDataset
+from dicogis.georeaders.read_vector_flat_geodatabase import ReadFlatDatabase
 
 # #############################################################################
 # ######## Globals #################
@@ -77,6 +83,118 @@ class TestInfosFlatVector(unittest.TestCase):
             )
             self.assertIsInstance(metadaset.storage_size, int, fixture_filepath)
 
+    def test_reading_session_resets_errors(self):
+        """A reader reused within a session must not carry errors from one dataset
+        to the next one."""
+        fixture_filepath = sorted(Path(fixtures_folder).glob("**/*.shp"))[0]
+
+        with tempfile.TemporaryDirectory(prefix="dicogis_test_") as tmp_dir:
+            corrupted_filepath = Path(tmp_dir).joinpath("corrupted.shp")
+            corrupted_filepath.write_bytes(b"not a shapefile")
+            Path(tmp_dir).joinpath("corrupted.dbf").write_bytes(b"not a dbf")
+            Path(tmp_dir).joinpath("corrupted.shx").write_bytes(b"not a shx")
+
+            with GeoReadersSessions() as georeaders:
+                georeader_vector = georeaders.get(ReadVectorFlatDataset)
+                self.assertIs(georeaders.get(ReadVectorFlatDataset), georeader_vector)
+                self.assertTrue(georeader_vector.session_opened)
+
+                metadataset_ko = georeader_vector.infos_dataset(
+                    corrupted_filepath.resolve()
+                )
+                metadataset_ok = georeader_vector.infos_dataset(
+                    fixture_filepath.resolve()
+                )
+
+        self.assertFalse(metadataset_ko.processing_succeeded)
+        self.assertIsNot(metadataset_ok.processing_succeeded, False, fixture_filepath)
+        self.assertFalse(georeader_vector.session_opened)
+
+    def test_statistics_modes(self):
+        """Skipped statistics are missing, exact and fast ones are recorded."""
+        fixture_filepath = sorted(Path(fixtures_folder).glob("**/*.shp"))[0]
+
+        metadataset_exact = ReadVectorFlatDataset().infos_dataset(
+            fixture_filepath.resolve()
+        )
+        self.assertEqual(metadataset_exact.statistics_mode, "exact")
+        self.assertIsInstance(metadataset_exact.features_objects_count, int)
+
+        metadataset_fast = ReadVectorFlatDataset(stats_mode="fast").infos_dataset(
+            fixture_filepath.resolve()
+        )
+        self.assertEqual(metadataset_fast.statistics_mode, "fast")
+
+        metadataset_skip = ReadVectorFlatDataset(stats_mode="skip").infos_dataset(
+            fixture_filepath.resolve()
+        )
+        self.assertEqual(metadataset_skip.statistics_mode, "skip")
+        self.assertIsNone(metadataset_skip.features_objects_count)
+        self.assertEqual(metadataset_skip.bbox, (None, None, None, None))
+
+    def test_flat_database_layers(self):
+        """Layers of a flat geodatabase are the same whether they're described from
+        GeoPackage system tables or read with OGR, sequentially or in parallel."""
+        spatial_reference = osr.SpatialReference()
+        spatial_reference.ImportFromEPSG(2154)
+
+        with tempfile.TemporaryDirectory(prefix="dicogis_test_") as tmp_dir:
+            results = []
+            for with_ogr_contents in ("YES", "NO"):
+                gpkg_filepath = Path(tmp_dir).joinpath(
+                    f"layers_{with_ogr_contents}.gpkg"
+                )
+                dataset = ogr.GetDriverByName("GPKG").CreateDataSource(
+                    str(gpkg_filepath),
+                    options=[f"ADD_GPKG_OGR_CONTENTS={with_ogr_contents}"],
+                )
+                for layer_idx in range(5):
+                    layer = dataset.CreateLayer(
+                        f"layer_{layer_idx}",
+                        srs=spatial_reference,
+                        geom_type=ogr.wkbPoint,
+                    )
+                    layer.CreateField(ogr.FieldDefn("name", ogr.OFTString))
+                    for feature_idx in range(layer_idx + 1):
+                        feature = ogr.Feature(layer.GetLayerDefn())
+                        feature.SetField("name", f"feature {feature_idx}")
+                        feature.SetGeometry(
+                            ogr.CreateGeometryFromWkt(
+                                f"POINT ({600000 + feature_idx} 6800000)"
+                            )
+                        )
+                        layer.CreateFeature(feature)
+                dataset = None
+
+                for layers_jobs in (1, 3):
+                    with GeoReadersSessions(max_layers_jobs=layers_jobs) as georeaders:
+                        metadataset = georeaders.get(ReadFlatDatabase).infos_dataset(
+                            gpkg_filepath.resolve()
+                        )
+                    results.append(
+                        [
+                            (
+                                layer.name,
+                                layer.features_objects_count,
+                                layer.geometry_type,
+                                layer.crs_registry_code,
+                                layer.bbox,
+                                [
+                                    (field.name, field.data_type)
+                                    for field in layer.feature_attributes
+                                ],
+                            )
+                            for layer in metadataset.layers
+                        ]
+                    )
+
+        self.assertEqual(
+            [layer[:2] for layer in results[0]],
+            [(f"layer_{layer_idx}", layer_idx + 1) for layer_idx in range(5)],
+        )
+        for result in results[1:]:
+            self.assertEqual(result, results[0])
+
 
 # #############################################################################
 # ##### Main #######################
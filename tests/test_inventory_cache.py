@@ -0,0 +1,156 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+    # for whole tests
+    python -m unittest tests.test_inventory_cache
+    # for specific test
+    python -m unittest tests.test_inventory_cache.TestInventoryCache.test_cache_hit
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+# package
+from dicogis.cache.inventory_cache import InventoryCache
+from dicogis.models.metadataset import MetaVectorDataset
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestInventoryCache(unittest.TestCase):
+    """Test persistent inventory cache."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Executed before each test."""
+        self.tmp_dir = tempfile.TemporaryDirectory(prefix="dicogis_test_cache_")
+        self.tmp_path = Path(self.tmp_dir.name)
+
+        # fake dataset made of a main file and a dependency
+        self.dataset_path = self.tmp_path.joinpath("roads.shp")
+        self.dataset_path.write_bytes(b"main")
+        self.dependency_path = self.tmp_path.joinpath("roads.dbf")
+        self.dependency_path.write_bytes(b"attributes")
+
+        self.metadataset = MetaVectorDataset(
+            name="roads.shp",
+            path=self.dataset_path,
+            files_dependencies=[self.dependency_path],
+            features_objects_count=42,
+        )
+        self.cache = InventoryCache(
+            database_path=self.tmp_path.joinpath("cache.sqlite")
+        )
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.cache.close()
+        self.tmp_dir.cleanup()
+
+    # -- Tests ------------------------------------------------------------
+    def test_cache_hit(self):
+        """Unchanged dataset is got from cache."""
+        self.assertIsNone(self.cache.get(dataset_path=self.dataset_path))
+        self.assertTrue(
+            self.cache.store(
+                dataset_path=self.dataset_path, metadataset=self.metadataset
+            )
+        )
+
+        cached = self.cache.get(dataset_path=self.dataset_path)
+        self.assertIsInstance(cached, MetaVectorDataset)
+        self.assertEqual(cached.features_objects_count, 42)
+        self.assertEqual(cached.signature(), self.metadataset.signature())
+        self.assertEqual(self.cache.count_hits, 1)
+        self.assertEqual(self.cache.count_misses, 1)
+
+    def test_cache_miss_on_dependency_change(self):
+        """Modifying a dependency invalidates the cached entry."""
+        self.cache.store(dataset_path=self.dataset_path, metadataset=self.metadataset)
+        self.dependency_path.write_bytes(b"attributes changed")
+
+        self.assertIsNone(self.cache.get(dataset_path=self.dataset_path))
+
+    def test_cache_miss_on_mtime_change(self):
+        """Touching the main file invalidates the cached entry."""
+        self.cache.store(dataset_path=self.dataset_path, metadataset=self.metadataset)
+        stat = self.dataset_path.stat()
+        os.utime(self.dataset_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.assertIsNone(self.cache.get(dataset_path=self.dataset_path))
+
+    def test_cache_ttl(self):
+        """Expired entries are ignored."""
+        self.cache.store(dataset_path=self.dataset_path, metadataset=self.metadataset)
+        self.cache.flush()
+        with self.cache.connection:
+            self.cache.connection.execute(
+                "UPDATE metadatasets SET stored_at = stored_at - 7200"
+            )
+
+        self.cache.ttl_hours = 1
+        self.assertIsNone(self.cache.get(dataset_path=self.dataset_path))
+        self.cache.ttl_hours = 3
+        self.assertIsNotNone(self.cache.get(dataset_path=self.dataset_path))
+
+    def test_cache_persistence(self):
+        """Entries are available from another connection once flushed."""
+        self.cache.store(dataset_path=self.dataset_path, metadataset=self.metadataset)
+        self.cache.flush()
+
+        other_cache = InventoryCache(database_path=self.cache.database_path)
+        self.assertIsNotNone(other_cache.get(dataset_path=self.dataset_path))
+        other_cache.close()
+
+    def test_cache_database_table(self):
+        """Database tables are cached with the fingerprint given by the reader."""
+        table_key = "postgis://service=dicogis_test/cadastre.parcelles"
+        self.assertTrue(
+            self.cache.store(
+                dataset_path=table_key,
+                metadataset=self.metadataset,
+                fingerprint="stats-1",
+            )
+        )
+
+        self.assertIsNotNone(
+            self.cache.get(dataset_path=table_key, fingerprint="stats-1")
+        )
+        self.assertIsNone(self.cache.get(dataset_path=table_key, fingerprint="stats-2"))
+
+    @unittest.skipIf(os.name == "nt", "file names are always valid on Windows")
+    def test_cache_undecodable_path(self):
+        """Datasets whose path is not valid UTF-8 are cached too."""
+        dataset_path = self.tmp_path.joinpath(os.fsdecode(b"r\xe9seau.shp"))
+        dependency_path = dataset_path.with_suffix(".dbf")
+        dataset_path.write_bytes(b"main")
+        dependency_path.write_bytes(b"attributes")
+        self.metadataset.files_dependencies = [dependency_path]
+
+        self.assertIsNotNone(InventoryCache.compute_fingerprint(dataset_path))
+        self.assertTrue(
+            self.cache.store(dataset_path=dataset_path, metadataset=self.metadataset)
+        )
+        self.assertIsNotNone(self.cache.get(dataset_path=dataset_path))
+
+        dependency_path.write_bytes(b"attributes changed")
+        self.assertIsNone(self.cache.get(dataset_path=dataset_path))
+
+
+# #############################################################################
+# ##### Main #######################
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
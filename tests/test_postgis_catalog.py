@@ -0,0 +1,275 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+    # for whole tests
+    python -m unittest tests.test_postgis_catalog
+    # for specific test
+    python -m unittest tests.test_postgis_catalog.TestPostgisCatalog.test_fields_types
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+
+# package
+from dicogis.georeaders.postgis_catalog import (
+    CatalogRelation,
+    RelationsFilter,
+    describe_columns,
+    get_geometry_sample_query,
+    get_layer_name,
+    get_like_pattern,
+    get_ogr_field_type,
+    get_plan_total_cost,
+    get_statistics_query,
+    parse_geometry_type,
+    parse_raster_row,
+    parse_sampled_geometry_types,
+    quote_literal,
+)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestPostgisCatalog(unittest.TestCase):
+    """Test PostGIS catalog description, without database."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Executed before each test."""
+        self.relation = CatalogRelation(
+            relation_oid=16400,
+            schema_name="cadastre",
+            table_name='parcelles "2024"',
+            layer_name='cadastre.parcelles "2024"',
+            relation_kind="r",
+            geometry_column="geom",
+            geometry_type="MULTIPOLYGON",
+            coord_dimension=2,
+            srid=2154,
+        )
+
+    #  -- Tests ------------------------------------------------------------
+    def test_fields_types(self):
+        """Columns types are mapped as the OGR PostgreSQL driver does."""
+        self.assertEqual(
+            get_ogr_field_type("varchar", "character varying(80)"), ("String", 80, 0)
+        )
+        self.assertEqual(get_ogr_field_type("bpchar", "character(5)"), ("String", 5, 0))
+        self.assertEqual(
+            get_ogr_field_type("varchar", "character varying"), ("String", 0, 0)
+        )
+        self.assertEqual(
+            get_ogr_field_type("numeric", "numeric(12,3)"), ("Real", 12, 3)
+        )
+        self.assertEqual(
+            get_ogr_field_type("numeric", "numeric(12,0)"), ("Integer64", 12, 0)
+        )
+        self.assertEqual(
+            get_ogr_field_type("numeric", "numeric(5,0)"), ("Integer", 5, 0)
+        )
+        self.assertEqual(get_ogr_field_type("numeric", "numeric"), ("Real", 0, 0))
+        self.assertEqual(get_ogr_field_type("bool", "boolean"), ("Integer", 1, 0))
+        self.assertEqual(get_ogr_field_type("int2", "smallint"), ("Integer", 5, 0))
+        self.assertEqual(get_ogr_field_type("_text", "text[]"), ("StringList", 0, 0))
+        self.assertIsNone(get_ogr_field_type("interval", "interval"))
+
+    def test_geometry_types(self):
+        """Geometry types from geometry_columns and geography_columns are parsed."""
+        self.assertEqual(parse_geometry_type("POINT", 2), ("POINT", False, False))
+        self.assertEqual(parse_geometry_type("POINT", 3), ("POINT", True, False))
+        self.assertEqual(parse_geometry_type("POINTM", 3), ("POINT", False, True))
+        self.assertEqual(parse_geometry_type("POINT", 4), ("POINT", True, True))
+        self.assertEqual(
+            parse_geometry_type("MultiPolygonZ", 3), ("MULTIPOLYGON", True, False)
+        )
+        self.assertEqual(
+            parse_geometry_type("LineStringZM", 4), ("LINESTRING", True, True)
+        )
+        self.assertEqual(parse_geometry_type("Geometry", 2), ("GEOMETRY", False, False))
+        self.assertIsNone(parse_geometry_type("RASTER", 2))
+
+    def test_columns(self):
+        """FID and geometry columns are not feature attributes."""
+        describe_columns(
+            relation=self.relation,
+            columns=[
+                ("id", "int4", "integer", None, True),
+                ("code", "varchar", "character varying(14)", "Parcel code", False),
+                ("geom", "geometry", "geometry(MultiPolygon,2154)", None, False),
+                ("area", "float8", "double precision", None, False),
+            ],
+        )
+        self.assertTrue(self.relation.is_describable)
+        self.assertEqual(
+            [
+                (field.name, field.data_type, field.length, field.description)
+                for field in self.relation.feature_attributes
+            ],
+            [
+                ("code", "String", 14, "Parcel code"),
+                ("area", "Real", 0, None),
+            ],
+        )
+
+        # without integer primary key, ogc_fid is the FID
+        describe_columns(
+            relation=self.relation,
+            columns=[
+                ("ogc_fid", "int4", "integer", None, False),
+                ("uid", "uuid", "uuid", None, True),
+            ],
+        )
+        self.assertEqual(
+            [field.name for field in self.relation.feature_attributes], ["uid"]
+        )
+
+        # unknown types are left to OGR
+        describe_columns(
+            relation=self.relation,
+            columns=[("duration", "interval", "interval", None, False)],
+        )
+        self.assertFalse(self.relation.is_describable)
+
+    def test_names_and_queries(self):
+        """Layers are named as OGR does and identifiers are quoted."""
+        self.assertEqual(get_layer_name("public", "roads", "public"), "roads")
+        self.assertEqual(get_layer_name("osm", "roads", "public"), "osm.roads")
+
+        sql = get_statistics_query(relation=self.relation)
+        self.assertIn('FROM "cadastre"."parcelles ""2024"""', sql)
+        self.assertIn('ST_Extent("geom")', sql)
+
+        self.relation.is_geography = True
+        sql = get_statistics_query(relation=self.relation)
+        self.assertIn('ST_Extent("geom"::geometry)', sql)
+
+    def test_geometry_sample(self):
+        """Geometry types are sampled by pages on large tables only."""
+        sql = get_geometry_sample_query(
+            relation_name=self.relation.quoted_name,
+            geometry_expression=self.relation.geometry_expression,
+            sample_size=100,
+        )
+        self.assertIn('GeometryType("geom")', sql)
+        self.assertIn("LIMIT 100", sql)
+        self.assertNotIn("TABLESAMPLE", sql)
+
+        sql = get_geometry_sample_query(
+            relation_name=self.relation.quoted_name,
+            geometry_expression=self.relation.geometry_expression,
+            sample_size=100,
+            estimated_rows=10_000_000,
+        )
+        self.assertIn("TABLESAMPLE SYSTEM (0.010000) REPEATABLE (0)", sql)
+
+        self.assertEqual(
+            parse_sampled_geometry_types("POLYGON,MULTIPOLYGONM,MULTIPOLYGON"),
+            ["MULTIPOLYGON", "POLYGON"],
+        )
+        self.assertEqual(parse_sampled_geometry_types(None), [])
+
+    def test_estimated_statistics_query(self):
+        """Estimated statistics use planner statistics without reading the table."""
+        self.assertEqual(quote_literal("l'été"), "'l''été'")
+
+        sql = get_statistics_query(relation=self.relation, estimated=True)
+        self.assertIn(
+            "ST_EstimatedExtent('cadastre', 'parcelles \"2024\"', 'geom')", sql
+        )
+        self.assertNotIn("count(*)", sql)
+        self.assertNotIn("ST_Extent(", sql)
+
+    def test_relations_filter(self):
+        """Schemas and tables patterns are converted into SQL conditions."""
+        self.assertEqual(RelationsFilter().as_sql(), "TRUE")
+        self.assertEqual(get_like_pattern("osm_*"), "'osm\\_%'")
+
+        sql = RelationsFilter(
+            schemas=["cadastre", "osm*"],
+            tables=["roads", "osm.rail?"],
+            excludes=["topology", "osm.tmp*"],
+        ).as_sql()
+        self.assertIn("(n.nspname LIKE 'cadastre' OR n.nspname LIKE 'osm%')", sql)
+        self.assertIn(
+            "(c.relname LIKE 'roads' OR (n.nspname || '.' || c.relname) LIKE "
+            "'osm.rail_')",
+            sql,
+        )
+        self.assertIn("NOT n.nspname LIKE 'topology'", sql)
+        self.assertIn("NOT (n.nspname || '.' || c.relname) LIKE 'osm.tmp%'", sql)
+        self.assertIn("pg\\_temp%", sql)
+
+    def test_raster_row(self):
+        """Size, origin and tiling of rasters are read from their constraints."""
+        raster = parse_raster_row(
+            row={
+                "relation_oid": 16500,
+                "schema_name": "public",
+                "table_name": "dem",
+                "current_schema": "public",
+                "raster_column": "rast",
+                "srid": 2154,
+                "scale_x": 5.0,
+                "scale_y": -5.0,
+                "tile_width": 256,
+                "tile_height": 256,
+                "bands_count": 2,
+                "pixel_types": "32BF,8BUI",
+                "nodata_values": "-9999,NULL",
+                "is_out_db": 0,
+                "xmin": 600000.0,
+                "xmax": 610000.0,
+                "ymin": 6800000.0,
+                "ymax": 6805000.0,
+                "estimated_tiles": 32.0,
+                "overviews": "public.o_2_dem (2)\npublic.o_4_dem (4)",
+            }
+        )
+        self.assertEqual(raster.layer_name, "dem")
+        self.assertEqual(raster.size, (2000, 1000))
+        self.assertEqual(raster.origin, (600000.0, 6805000.0))
+        self.assertEqual(raster.tiles_count, 32)
+        self.assertEqual(raster.pixel_types, ["32BF", "8BUI"])
+        self.assertEqual(raster.nodata_values, [-9999.0, None])
+        self.assertEqual(raster.overviews, ["public.o_2_dem (2)", "public.o_4_dem (4)"])
+
+        # without constraints
+        raster = parse_raster_row(
+            row={
+                "relation_oid": 16501,
+                "schema_name": "imagery",
+                "table_name": "ortho",
+                "current_schema": "public",
+                "raster_column": "rast",
+                "srid": 0,
+                "estimated_tiles": -1.0,
+            }
+        )
+        self.assertEqual(raster.layer_name, "imagery.ortho")
+        self.assertEqual(raster.size, (None, None))
+        self.assertIsNone(raster.tiles_count)
+        self.assertEqual(raster.overviews, [])
+
+    def test_plan_cost(self):
+        """Total cost is read from the first line of the query plan."""
+        self.assertEqual(
+            get_plan_total_cost("Aggregate  (cost=1520.50..1520.51 rows=1 width=40)"),
+            1520.51,
+        )
+        self.assertIsNone(get_plan_total_cost("Result"))
+
+
+# #############################################################################
+# ##### Main #######################
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
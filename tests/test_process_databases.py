@@ -0,0 +1,171 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+    # for whole tests
+    python -m unittest tests.test_process_databases
+    # for specific test
+    python -m unittest tests.test_process_databases.TestProcessingDatabases.test_order_and_limits
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import time
+import unittest
+from threading import Lock
+from typing import ClassVar
+
+# package
+from dicogis.georeaders.process_databases import ProcessingDatabases
+from dicogis.models.database_connection import DatabaseConnection
+from dicogis.models.metadataset import MetaVectorDataset
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class DatabaseReader:
+    """Reader of a fake database, exposing what ProcessingDatabases uses of
+    ReadPostGIS."""
+
+    running: ClassVar[dict[str, int]] = {}
+    max_running: ClassVar[dict[str, int]] = {}
+    lock = Lock()
+
+    def __init__(
+        self,
+        name: str,
+        host: str,
+        tables: int,
+        delay: float = 0.0,
+        fail_after: int | None = None,
+    ):
+        self.db_connection = DatabaseConnection(
+            database_name=name, host=host, port=5432
+        )
+        self.tables = tables
+        self.delay = delay
+        self.fail_after = fail_after
+        self.conn = None
+
+    def get_connection(self):
+        self.conn = None if self.tables < 0 else object()
+        if self.conn is None:
+            self.db_connection.state_msg = "KO: connection refused"
+        return self.conn
+
+    def __enter__(self):
+        server = self.db_connection.server_address
+        with self.lock:
+            self.running[server] = self.running.get(server, 0) + 1
+            self.max_running[server] = max(
+                self.max_running.get(server, 0), self.running[server]
+            )
+        return self
+
+    def __exit__(self, *args):
+        with self.lock:
+            self.running[self.db_connection.server_address] -= 1
+
+    def iter_metadatasets(self):
+        for index in range(self.tables):
+            time.sleep(self.delay)
+            if index == self.fail_after:
+                raise RuntimeError("server closed the connection unexpectedly")
+            yield MetaVectorDataset(
+                name=f"{self.db_connection.database_name}.table_{index}",
+                path=self.db_connection.database_name,
+                dataset_type="sgbd_postgis",
+            )
+
+
+class TestProcessingDatabases(unittest.TestCase):
+    """Test concurrent reading of databases, without database."""
+
+    #  -- Tests ------------------------------------------------------------
+    def test_order_and_limits(self):
+        """Metadatasets follow databases order whatever the reading order, within
+        global and per server limits."""
+        readers = [
+            DatabaseReader(name="slow", host="db1", tables=3, delay=0.05),
+            DatabaseReader(name="refused", host="db1", tables=-1),
+            DatabaseReader(name="fast_1", host="db1", tables=2),
+            DatabaseReader(name="fast_2", host="db2", tables=2),
+            DatabaseReader(name="fast_3", host="db2", tables=1),
+        ]
+        databases_processor = ProcessingDatabases(
+            readers=readers, max_databases=3, max_databases_per_server=1
+        )
+
+        self.assertEqual(
+            [
+                metadataset.name
+                for metadataset in databases_processor.iter_metadatasets()
+            ],
+            [
+                "slow.table_0",
+                "slow.table_1",
+                "slow.table_2",
+                "fast_1.table_0",
+                "fast_1.table_1",
+                "fast_2.table_0",
+                "fast_2.table_1",
+                "fast_3.table_0",
+            ],
+        )
+        self.assertEqual(databases_processor.count_metadatasets, 8)
+        self.assertEqual(DatabaseReader.max_running, {"db1:5432": 1, "db2:5432": 1})
+        self.assertEqual(
+            [
+                database.process_error
+                for database in databases_processor.li_databases_to_process
+            ],
+            [None, "KO: connection refused", None, None, None],
+        )
+
+    def test_reading_failure(self):
+        """A database failing while being read doesn't stop other databases."""
+        for max_databases in (1, 2):
+            readers = [
+                DatabaseReader(name="broken", host="db1", tables=3, fail_after=1),
+                DatabaseReader(name="fine", host="db2", tables=4),
+            ]
+            databases_processor = ProcessingDatabases(
+                readers=readers,
+                max_databases=max_databases,
+                max_pending_metadatasets=1,
+            )
+
+            self.assertEqual(
+                [
+                    metadataset.name
+                    for metadataset in databases_processor.iter_metadatasets()
+                ],
+                [
+                    "broken.table_0",
+                    "fine.table_0",
+                    "fine.table_1",
+                    "fine.table_2",
+                    "fine.table_3",
+                ],
+            )
+            broken, fine = databases_processor.li_databases_to_process
+            self.assertFalse(broken.processed)
+            self.assertEqual(
+                broken.process_error, "KO: server closed the connection unexpectedly"
+            )
+            self.assertTrue(fine.processed)
+            self.assertIsNone(fine.process_error)
+
+
+# #############################################################################
+# ##### Main #######################
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
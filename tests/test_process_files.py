@@ -0,0 +1,162 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+    # for whole tests
+    python -m unittest tests.test_process_files
+    # for specific test
+    python -m unittest tests.test_process_files.TestProcessingFiles.test_parallel_reading_keeps_order
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import tempfile
+import unittest
+from pathlib import Path
+
+# package
+from dicogis.export.base_serializer import MetadatasetSerializerBase
+from dicogis.georeaders.process_files import (
+    DatasetToProcess,
+    ProcessingFiles,
+    read_dataset_with_georeader,
+)
+from dicogis.georeaders.read_vector_flat_dataset import ReadVectorFlatDataset
+from dicogis.listing.geodata_listing import GeodataFilesLister
+from dicogis.models.metadataset import MetaDataset
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+# variables
+fixtures_folder = "tests/fixtures/gisdata/data/good/vector/"
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class SerializerForTests(MetadatasetSerializerBase):
+    """Serializer storing metadatasets in memory."""
+
+    def __init__(self):
+        super().__init__(localized_strings={})
+        self.serialized: list[MetaDataset] = []
+
+    def serialize_metadaset(self, metadataset: MetaDataset):
+        self.serialized.append(metadataset)
+
+
+class TestProcessingFiles(unittest.TestCase):
+    """Test geofiles processor."""
+
+    def process_shapefiles(self, jobs: int) -> list[MetaDataset]:
+        """Run the processor on fixtures shapefiles and return serialized items."""
+        serializer = SerializerForTests()
+        li_shapefiles = sorted(
+            str(shp.resolve()) for shp in Path(fixtures_folder).glob("**/*.shp")
+        )
+        processor = ProcessingFiles(
+            serializer=serializer,
+            localized_strings={},
+            li_cdao=[],
+            li_dxf=[],
+            li_flat_geodatabase_esri_filegdb=[],
+            li_flat_geodatabase_geopackage=[],
+            li_flat_geodatabase_spatialite=[],
+            li_geojson=[],
+            li_geotiff=[],
+            li_gxt=[],
+            li_gml=[],
+            li_kml=[],
+            li_mapinfo_tab=[],
+            li_shapefiles=li_shapefiles,
+            li_vectors=li_shapefiles,
+            li_rasters=[],
+            li_file_databases=[],
+            opt_jobs=jobs,
+            opt_worker_max_datasets=2,
+        )
+        processor.count_files_to_process()
+        processor.process_datasets_in_queue()
+
+        self.assertTrue(all(d.processed for d in processor.li_files_to_process))
+        return serializer.serialized
+
+    #  -- Tests ------------------------------------------------------------
+    def test_parallel_reading_keeps_order(self):
+        """Parallel reading must produce the same output as sequential reading."""
+        sequential = self.process_shapefiles(jobs=1)
+        parallel = self.process_shapefiles(jobs=3)
+
+        self.assertGreater(len(sequential), 0)
+        self.assertEqual([md.path for md in sequential], [md.path for md in parallel])
+        self.assertEqual(
+            [md.signature() for md in sequential],
+            [md.signature() for md in parallel],
+        )
+
+    def test_streaming_matches_listing(self):
+        """Streaming listing to readers must produce the same datasets as a complete
+        listing."""
+        listed = self.process_shapefiles(jobs=1)
+
+        serializer = SerializerForTests()
+        processor = ProcessingFiles(
+            serializer=serializer,
+            localized_strings={},
+            opt_analyze_cdao=False,
+            opt_analyze_esri_filegdb=False,
+            opt_analyze_geojson=False,
+            opt_analyze_geopackage=False,
+            opt_analyze_geotiff=False,
+            opt_analyze_gml=False,
+            opt_analyze_gxt=False,
+            opt_analyze_kml=False,
+            opt_analyze_mapinfo_tab=False,
+            opt_analyze_raster=False,
+            opt_analyze_spatialite=False,
+        )
+        processor.process_datasets_from_stream(
+            listed_geofiles=GeodataFilesLister(start_folder=fixtures_folder),
+            max_pending_datasets=2,
+        )
+
+        self.assertEqual(processor.total_files, len(listed))
+        self.assertEqual(
+            sorted(md.signature() for md in listed),
+            sorted(md.signature() for md in serializer.serialized),
+        )
+
+    def test_cache_failure_is_a_miss(self):
+        """A failing cache lookup doesn't fail the reading: the dataset is read."""
+        shapefile = sorted(Path(fixtures_folder).glob("**/*.shp"))[0].resolve()
+        with tempfile.TemporaryDirectory(prefix="dicogis_test_") as tmp_dir:
+            not_a_folder = Path(tmp_dir).joinpath("not_a_folder")
+            not_a_folder.touch()
+
+            dataset_to_process, metadataset = read_dataset_with_georeader(
+                dataset_to_process=DatasetToProcess(
+                    file_path=shapefile,
+                    file_format="esri_shapefile",
+                    georeader=ReadVectorFlatDataset,
+                ),
+                cache_path=not_a_folder.joinpath("inventory.sqlite"),
+            )
+
+        self.assertIsNotNone(metadataset)
+        self.assertFalse(dataset_to_process.from_cache)
+        self.assertIsNone(dataset_to_process.process_error)
+
+
+# #############################################################################
+# ##### Main #######################
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
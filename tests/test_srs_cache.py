@@ -0,0 +1,81 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+    # for whole tests
+    python -m unittest tests.test_srs_cache
+    # for specific test
+    python -m unittest tests.test_srs_cache.TestSrsCache.test_shared_database
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import tempfile
+import unittest
+from pathlib import Path
+
+# package
+from dicogis.cache.srs_cache import SrsCache
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestSrsCache(unittest.TestCase):
+    """Test resolved SRS cache."""
+
+    #  -- Tests ------------------------------------------------------------
+    def test_bounded_memory(self):
+        """Least recently used entries are dropped and lookups are counted."""
+        srs_cache = SrsCache(max_size=2)
+        lambert93 = ("RGF93 v1 / Lambert-93", "EPSG", "2154", "srs_proj")
+        wgs84 = ("WGS 84", "EPSG", "4326", "srs_geog")
+
+        self.assertIsNone(srs_cache.hit_rate)
+        self.assertIsNone(srs_cache.get(fingerprint="lambert93"))
+        srs_cache.store(fingerprint="lambert93", srs_details=lambert93)
+        srs_cache.store(fingerprint="wgs84", srs_details=wgs84)
+        self.assertEqual(srs_cache.get(fingerprint="lambert93"), lambert93)
+
+        srs_cache.store(fingerprint="other", srs_details=wgs84)
+        self.assertIsNone(srs_cache.get(fingerprint="wgs84"))
+        self.assertEqual(srs_cache.get(fingerprint="lambert93"), lambert93)
+
+        self.assertEqual(len(srs_cache.entries), 2)
+        self.assertEqual((srs_cache.count_hits, srs_cache.count_misses), (2, 2))
+        self.assertEqual(srs_cache.hit_rate, 0.5)
+
+    def test_shared_database(self):
+        """Entries stored by a process are found by another one."""
+        lambert93 = ("RGF93 v1 / Lambert-93", "EPSG", "2154", "srs_proj")
+        fingerprint = SrsCache.compute_fingerprint("wkt", "3.8.4", "PROJCRS[...]")
+        self.assertNotEqual(
+            fingerprint, SrsCache.compute_fingerprint("wkt", "3.9.0", "PROJCRS[...]")
+        )
+
+        with tempfile.TemporaryDirectory(prefix="dicogis_test_") as tmp_dir:
+            database_path = Path(tmp_dir).joinpath("srs.sqlite")
+            first_cache = SrsCache()
+            first_cache.open_database(database_path=database_path)
+            first_cache.store(fingerprint=fingerprint, srs_details=lambert93)
+
+            second_cache = SrsCache()
+            second_cache.open_database(database_path=database_path)
+            self.assertEqual(second_cache.get(fingerprint=fingerprint), lambert93)
+            self.assertEqual(second_cache.count_hits, 1)
+
+            first_cache.close_database()
+            second_cache.close_database()
+
+
+# #############################################################################
+# ##### Main #######################
+# ##################################
+if __name__ == "__main__":
+    unittest.main()